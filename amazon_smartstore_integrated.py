@@ -22,6 +22,8 @@ import time
 import random
 from pathlib import Path
 
+from workflow_pipeline import DEFAULT_CONFIG_FILE, WorkflowPipeline, load_pipeline_config
+
 # 현재 디렉토리를 Python 경로에 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
@@ -75,6 +77,7 @@ class AmazonSmartstoreIntegrated:
         self.is_running = False
         self.crawled_products = []
         self.latest_crawl_file = None
+        self.latest_crawl_run = None  # 아카이브 폴더 안의 최근 크롤링 실행 ID
         self.latest_smartstore_file = None
         
     def setup_window(self):
@@ -113,6 +116,7 @@ class AmazonSmartstoreIntegrated:
         self.margin_rate = tk.StringVar(value="50")
         self.auto_convert = tk.BooleanVar(value=True)  # 크롤링 후 자동 변환
         self.enable_translation = tk.BooleanVar(value=True)  # 한국어 번역 활성화
+        self.incremental_conversion = tk.BooleanVar(value=False)  # 변경된 상품만 다시 변환
         
         # 진행상황 변수
         self.progress_var = tk.StringVar(value="준비 완료")
@@ -335,6 +339,10 @@ class AmazonSmartstoreIntegrated:
                                    foreground="gray")
         translation_info.pack(side=tk.LEFT, padx=(20,0))
         
+        # 증분 변환 설정
+        ttk.Checkbutton(settings_grid, text="♻️ 증분 변환 (이전 크롤링과 같은 상품은 변환 결과 재사용)", 
+                       variable=self.incremental_conversion).grid(row=3, column=0, columnspan=4, sticky=tk.W, pady=(5,0))
+        
         # 최근 결과 표시
         results_frame = ttk.LabelFrame(workflow_frame, text="📊 최근 결과", padding="10")
         results_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
@@ -718,33 +726,36 @@ class AmazonSmartstoreIntegrated:
     def run_full_workflow(self):
         """전체 워크플로우 실행 (별도 쓰레드)"""
         try:
-            # 1단계: 크롤링
-            self.update_workflow_step(1, 'running')
-            self.update_progress("1단계 실행 중", "아마존에서 상품 정보를 수집하고 있습니다...")
-            
-            success = self.execute_crawling()
-            if not success:
-                self.update_workflow_step(1, 'failed')
-                raise Exception("크롤링에 실패했습니다.")
-            
-            self.update_workflow_step(1, 'completed')
-            self.log_message(f"✅ 1단계 완료: {len(self.crawled_products)}개 상품 수집")
-            
-            # 자동 변환이 설정된 경우에만 2단계 실행
+            # 자동 변환이 설정된 경우 키워드별 크롤링 결과를 바로 변환 (1, 2단계 동시 진행)
             if self.auto_convert.get():
-                time.sleep(2)  # 잠깐 대기
-                
-                # 2단계: 변환
+                self.update_workflow_step(1, 'running')
                 self.update_workflow_step(2, 'running')
-                self.update_progress("2단계 실행 중", "스마트스토어 등록 파일을 생성하고 있습니다...")
+                self.update_progress("1·2단계 실행 중", "키워드별로 수집한 상품을 바로 스마트스토어 형식으로 변환하고 있습니다...")
                 
-                success = self.execute_conversion()
+                success = self.execute_pipelined()
                 if not success:
-                    self.update_workflow_step(2, 'failed')
-                    raise Exception("스마트스토어 변환에 실패했습니다.")
+                    if self.crawled_products:
+                        self.update_workflow_step(1, 'completed')
+                        self.update_workflow_step(2, 'failed')
+                        raise Exception("스마트스토어 변환에 실패했습니다.")
+                    self.update_workflow_step(1, 'failed')
+                    self.update_workflow_step(2, 'pending')
+                    raise Exception("크롤링에 실패했습니다.")
                 
+                self.update_workflow_step(1, 'completed')
                 self.update_workflow_step(2, 'completed')
-                self.log_message("✅ 2단계 완료: 스마트스토어 파일 생성")
+            else:
+                # 1단계: 크롤링
+                self.update_workflow_step(1, 'running')
+                self.update_progress("1단계 실행 중", "아마존에서 상품 정보를 수집하고 있습니다...")
+                
+                success = self.execute_crawling()
+                if not success:
+                    self.update_workflow_step(1, 'failed')
+                    raise Exception("크롤링에 실패했습니다.")
+                
+                self.update_workflow_step(1, 'completed')
+                self.log_message(f"✅ 1단계 완료: {len(self.crawled_products)}개 상품 수집")
             
             # 완료 처리
             self.root.after(0, self.on_workflow_complete)
@@ -799,111 +810,72 @@ class AmazonSmartstoreIntegrated:
             self.update_progress("변환 실패", error_msg)
             self.root.after(0, lambda: self.on_workflow_error(str(e)))
     
+    def build_pipeline(self):
+        """현재 GUI 설정으로 워크플로우 파이프라인 생성 (진행 메시지는 로그 창으로)"""
+        settings = load_pipeline_config()
+        settings.update({
+            'search_keywords': self.search_keywords.copy(),
+            'products_per_keyword': int(self.products_per_keyword.get()),
+            'crawl_delay': int(self.crawl_delay.get()),
+            'min_rating': float(self.min_rating.get()),
+            'min_reviews': int(self.min_reviews.get()),
+            'margin_rate': int(self.margin_rate.get()),
+            'auto_convert': self.auto_convert.get(),
+            'enable_translation': self.enable_translation.get(),
+            'incremental_conversion': self.incremental_conversion.get()
+        })
+        pipeline = WorkflowPipeline(settings, log=self.log_message)
+        pipeline.latest_crawl_file = self.latest_crawl_file
+        pipeline.latest_crawl_run = self.latest_crawl_run
+        return pipeline
+    
     def execute_crawling(self):
-        """실제 크롤링 실행"""
+        """실제 크롤링 실행 (WorkflowPipeline.run_crawling)"""
         try:
-            # Selenium 크롤러 설정
-            config = {
-                "crawler_settings": {
-                    "max_products_per_keyword": int(self.products_per_keyword.get()),
-                    "min_rating": float(self.min_rating.get()),
-                    "min_reviews": int(self.min_reviews.get()),
-                    "crawl_delay": int(self.crawl_delay.get())
-                }
-            }
-            
-            # 설정 파일 임시 저장
-            with open('temp_crawl_config.json', 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            
-            # 개선된 크롤러 초기화 및 실행
-            crawler = ImprovedAmazonCrawler('temp_crawl_config.json')
-            crawler.search_keywords = self.search_keywords.copy()
-            
-            products = crawler.crawl_all_keywords()
-            
-            if products:
-                self.crawled_products = products
-                
-                # 결과 파일 저장
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                json_filename = f"amazon_products_integrated_{timestamp}.json"
-                csv_filename = f"amazon_products_integrated_{timestamp}.csv"
-                
-                # JSON 저장
-                with open(json_filename, 'w', encoding='utf-8') as f:
-                    json.dump(products, f, ensure_ascii=False, indent=2)
-                
-                # CSV 저장
-                df = pd.DataFrame(products)
-                df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
-                
-                self.latest_crawl_file = json_filename
-                self.log_message(f"📁 크롤링 결과 저장: {json_filename}")
-                
-                return True
-            else:
-                return False
-                
+            pipeline = self.build_pipeline()
+            success = pipeline.run_crawling()
         except Exception as e:
             self.log_message(f"❌ 크롤링 실행 오류: {e}")
             return False
-        finally:
-            # 임시 파일 정리
-            try:
-                os.remove('temp_crawl_config.json')
-            except:
-                pass
+        
+        if success:
+            self.crawled_products = pipeline.crawled_products
+            self.latest_crawl_file = pipeline.latest_crawl_file
+            self.latest_crawl_run = pipeline.latest_crawl_run
+        return success
+    
+    def execute_pipelined(self):
+        """크롤링과 변환을 겹쳐 실행 (WorkflowPipeline.run_pipelined)"""
+        self.crawled_products = []
+        try:
+            pipeline = self.build_pipeline()
+            success = pipeline.run_pipelined()
+        except Exception as e:
+            self.log_message(f"❌ 워크플로우 실행 오류: {e}")
+            return False
+        
+        self.crawled_products = pipeline.crawled_products
+        if pipeline.latest_crawl_file:
+            self.latest_crawl_file = pipeline.latest_crawl_file
+            self.latest_crawl_run = pipeline.latest_crawl_run
+        if success:
+            self.latest_smartstore_file = pipeline.latest_smartstore_file
+        return success
     
     def execute_conversion(self):
-        """실제 변환 실행 (안전한 에러 처리)"""
+        """실제 변환 실행 (WorkflowPipeline.run_conversion, 안전한 에러 처리)"""
         try:
-            if not self.latest_crawl_file:
-                self.log_message("❌ 크롤링 파일이 없습니다. 먼저 크롤링을 실행하세요.")
-                return False
-            
-            if not os.path.exists(self.latest_crawl_file):
-                self.log_message(f"❌ 크롤링 파일을 찾을 수 없습니다: {self.latest_crawl_file}")
-                return False
-            
-            self.log_message("🔄 스마트스토어 변환 시작...")
-            
-            # 개선된 스마트스토어 업로더 초기화 (상세페이지 이미지 포함 버전)
-            uploader = EnhancedSmartstoreUploader(enable_translation=self.enable_translation.get())
-            
-            # 변환 실행
-            margin_rate = int(self.margin_rate.get())
-            self.log_message(f"📊 마진율: {margin_rate}%")
-            
-            output_file = uploader.convert_file(
-                input_file=self.latest_crawl_file
-            )
-            
-            if output_file and os.path.exists(output_file):
-                self.latest_smartstore_file = output_file
-                self.log_message(f"✅ 스마트스토어 업로드 파일 생성 성공!")
-                self.log_message(f"📁 파일 위치: {os.path.basename(output_file)}")
-                self.log_message("📋 네이버 스마트스토어 일괄등록에서 사용 가능한 Excel 파일입니다.")
-                
-                # 참고용 파일 정보 추가
-                reference_file = output_file.replace('.xlsx', '_참고용.xlsx')
-                if os.path.exists(reference_file):
-                    self.log_message(f"📊 참고용 상세 정보: {os.path.basename(reference_file)}")
-                
-                return True
-            else:
-                self.log_message("❌ 스마트스토어 파일 생성에 실패했습니다.")
-                self.log_message("💡 가능한 원인: 데이터 품질 문제, 필수 필드 누락, 변환 오류")
-                return False
-                
+            pipeline = self.build_pipeline()
+            success = pipeline.run_conversion()
         except Exception as e:
             # 에러 발생 시 로그만 출력하고 절대 파일을 생성하지 않음
-            error_msg = str(e)
-            self.log_message(f"❌ 변환 중 오류 발생: {error_msg}")
+            self.log_message(f"❌ 변환 중 오류 발생: {e}")
             self.log_message("💡 해결방법: 크롤링을 다시 실행하거나 데이터를 확인해주세요.")
-            
-            # 에러 파일 생성하지 않음 - 오직 로그만!
             return False
+        
+        if success:
+            self.latest_smartstore_file = pipeline.latest_smartstore_file
+        return success
     
     # UI 업데이트 함수들
     def update_workflow_step(self, step, status):
@@ -1100,8 +1072,8 @@ class AmazonSmartstoreIntegrated:
     def load_config(self):
         """설정 로드"""
         try:
-            if os.path.exists('integrated_config.json'):
-                with open('integrated_config.json', 'r', encoding='utf-8') as f:
+            if os.path.exists(DEFAULT_CONFIG_FILE):
+                with open(DEFAULT_CONFIG_FILE, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                 
                 # 설정 적용
@@ -1119,6 +1091,8 @@ class AmazonSmartstoreIntegrated:
                     self.auto_convert.set(config['auto_convert'])
                 if 'enable_translation' in config:
                     self.enable_translation.set(config['enable_translation'])
+                if 'incremental_conversion' in config:
+                    self.incremental_conversion.set(config['incremental_conversion'])
                     
         except Exception as e:
             self.log_message(f"설정 로드 실패: {e}")
@@ -1126,7 +1100,9 @@ class AmazonSmartstoreIntegrated:
     def save_config(self):
         """설정 저장"""
         try:
-            config = {
+            # GUI에 없는 설정 (conversion_workers, rows_per_file 등)은 파일 값을 유지
+            config = load_pipeline_config(DEFAULT_CONFIG_FILE)
+            config.update({
                 'search_keywords': self.search_keywords,
                 'products_per_keyword': int(self.products_per_keyword.get()),
                 'crawl_delay': int(self.crawl_delay.get()),
@@ -1134,10 +1110,11 @@ class AmazonSmartstoreIntegrated:
                 'min_reviews': int(self.min_reviews.get()),
                 'margin_rate': int(self.margin_rate.get()),
                 'auto_convert': self.auto_convert.get(),
-                'enable_translation': self.enable_translation.get()
-            }
+                'enable_translation': self.enable_translation.get(),
+                'incremental_conversion': self.incremental_conversion.get()
+            })
             
-            with open('integrated_config.json', 'w', encoding='utf-8') as f:
+            with open(DEFAULT_CONFIG_FILE, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
                 
         except Exception as e:
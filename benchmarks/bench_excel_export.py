@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업로드 시트 저장 성능 측정 (일반 Workbook vs write-only 스트리밍)
+
+같은 DataFrame으로 업로드 시트만 저장하며 시간과 tracemalloc 최대 메모리를 비교하고,
+두 파일의 시트 이름/값/헤더 서식/컬럼 너비가 같은지 확인한다.
+    python benchmarks/bench_excel_export.py --rows 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'tests'))
+
+from smartstore_uploader import UPLOAD_COLUMNS, SmartstoreUploader, StreamingUploadWriter  # noqa: E402
+from test_streaming_export import read_sheet, sample_upload_dataframe  # noqa: E402
+
+
+def measure(func):
+    """(실행 시간, 최대 메모리 MB) - tracemalloc이 시간을 늘리므로 따로 실행해 측정"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="업로드 시트 저장 성능 측정")
+    parser.add_argument('--rows', type=int, default=5000, help="저장할 행 수")
+    args = parser.parse_args()
+
+    uploader = SmartstoreUploader(enable_translation=False)
+    upload_df = sample_upload_dataframe(args.rows)[UPLOAD_COLUMNS]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        standard_path = os.path.join(tmp_dir, 'standard.xlsx')
+        streaming_path = os.path.join(tmp_dir, 'streaming.xlsx')
+
+        def write_streaming():
+            writer = StreamingUploadWriter(streaming_path, UPLOAD_COLUMNS, uploader.clean_text_for_excel)
+            writer.write_dataframe(upload_df)
+            writer.close()
+
+        standard = measure(lambda: uploader._write_upload_workbook(upload_df, UPLOAD_COLUMNS, standard_path))
+        streaming = measure(write_streaming)
+        same = read_sheet(standard_path) == read_sheet(streaming_path)
+
+    print(f"{args.rows}행 x {len(UPLOAD_COLUMNS)}컬럼 (업로드 시트만)")
+    print(f"  일반 Workbook: {standard[0]:.2f}s, 최대 {standard[1]:.1f} MB")
+    print(f"  스트리밍:      {streaming[0]:.2f}s, 최대 {streaming[1]:.1f} MB")
+    print(f"  결과 파일 동일: {'예' if same else '아니오'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+clean_text_for_excel 성능 측정 (이전 다단계 re.sub 구현 대비)
+
+88개 컬럼 행(반복되는 상수 + 이모지/상표 기호가 섞인 문장)을 rows번 정리하는 시간을 비교한다.
+    python benchmarks/bench_excel_text.py --rows 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'tests'))
+
+from smartstore_uploader import _clean_text_for_excel  # noqa: E402
+from test_excel_text import legacy_clean_text_for_excel, random_texts  # noqa: E402
+
+
+def sample_row(index: int):
+    """업로드 행 한 개 분량의 문자열 (상수 80개 + 상품별 문장 8개)"""
+    constants = ['택배', 'N', 'Y', '과세상품', '0', '해외직구', '신상품', '상세페이지 참조'] * 10
+    texts = [f"Brand™ Premium Serum #{index} ✨ 50ml® \U0001F600  hydrating   formula",
+             f"Face Cream {index} — soothing ☀ daily care\n\tfor dry skin"] * 4
+    return constants + texts
+
+
+def measure(func, rows, clear_memo: bool) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        if clear_memo:
+            _clean_text_for_excel.cache_clear()
+        for value in row:
+            func(value)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="clean_text_for_excel 성능 측정")
+    parser.add_argument('--rows', type=int, default=2000, help="정리할 행 수")
+    parser.add_argument('--fuzz', type=int, default=200000, help="결과 비교용 임의 문자열 수")
+    args = parser.parse_args()
+
+    mismatches = sum(1 for text in random_texts(args.fuzz)
+                     if _clean_text_for_excel(text) != legacy_clean_text_for_excel(text))
+    print(f"결과 비교: 임의 문자열 {args.fuzz}개 중 불일치 {mismatches}개")
+
+    rows = [sample_row(i) for i in range(args.rows)]
+    legacy = measure(legacy_clean_text_for_excel, rows, clear_memo=False)
+    cold = measure(_clean_text_for_excel, rows, clear_memo=True)
+    _clean_text_for_excel.cache_clear()
+    warm = measure(_clean_text_for_excel, rows, clear_memo=False)
+    print(f"{args.rows}행 x {len(rows[0])}컬럼")
+    print(f"  이전 구현:          {legacy:.3f}s")
+    print(f"  단일 패턴 (행마다 캐시 비움): {cold:.3f}s ({legacy / cold:.1f}x)")
+    print(f"  단일 패턴 (캐시 유지):      {warm:.3f}s ({legacy / warm:.1f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+캐시 파일 기본 위치 모듈
+번역 캐시/변환 캐시처럼 실행 폴더와 무관하게 재사용하는 캐시 DB의 기본 경로를 정한다
+
+기본 폴더: AMAZON_SMARTSTORE_CACHE_DIR 환경 변수 > %LOCALAPPDATA%/amazon_smartstore (Windows)
+> $XDG_CACHE_HOME/amazon_smartstore > ~/.cache/amazon_smartstore
+폴더는 처음 사용할 때 본인만 접근할 수 있도록(0700) 만든다.
+
+작성일: 2025년 8월 6일
+버전: v1.0
+"""
+
+import os
+
+# 캐시 폴더 재정의 환경 변수 및 폴더 이름
+CACHE_DIR_ENV = 'AMAZON_SMARTSTORE_CACHE_DIR'
+CACHE_DIR_NAME = 'amazon_smartstore'
+
+
+def user_cache_dir() -> str:
+    """사용자별 캐시 폴더 경로 (없으면 0700으로 생성)"""
+    path = os.environ.get(CACHE_DIR_ENV)
+    if not path:
+        base = os.environ.get('LOCALAPPDATA') if os.name == 'nt' else os.environ.get('XDG_CACHE_HOME')
+        path = os.path.join(base or os.path.join(os.path.expanduser('~'), '.cache'), CACHE_DIR_NAME)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def default_cache_path(filename: str) -> str:
+    """사용자별 캐시 폴더 안의 캐시 파일 경로"""
+    return os.path.join(user_cache_dir(), filename)
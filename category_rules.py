@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+카테고리 규칙 인덱스 (category_rules.json 기반)
+SmartstoreUploader와 NaverSmartStoreAPI가 같은 규칙과 같은 카테고리 ID를 사용하도록 공유
+
+규칙 파일을 KeywordMatcher로 컴파일하여 메모리에만 보관하고, 실행 중에는 파일 수정 시각이
+바뀌면 자동으로 다시 컴파일한다 (GUI 재시작 불필요). 규칙 파일이 작아 컴파일이 1ms 미만이므로
+디스크 캐시는 두지 않는다.
+
+분류 순서 (lookup, 두 변환기 공통): 상품명 규칙 > 키워드 규칙 > 기본 카테고리
+
+작성일: 2025년 8월 4일
+버전: v1.0
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from keyword_matcher import KeywordMatcher, build_category_rules
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 규칙 파일 (모듈과 같은 폴더)
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'category_rules.json')
+
+
+class CategoryRuleIndex:
+    """컴파일된 카테고리 규칙 인덱스 (파일 변경 시 자동 재로드)"""
+
+    def __init__(self, rules_file: str = DEFAULT_RULES_FILE, check_interval: float = 1.0):
+        """규칙 파일 로드"""
+        self.rules_file = rules_file
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._last_check = 0.0
+
+        self.default_category_code = ''
+        self.title_rules: List[Tuple[List[str], str]] = []
+        self.keyword_rules: Dict[str, str] = {}
+        self.categories: Dict[str, Dict[str, str]] = {}
+        self.matcher: Optional[KeywordMatcher] = None
+
+        self.refresh(force=True)
+
+    def _file_signature(self) -> Tuple[int, int]:
+        """규칙 파일 (수정 시각, 크기)"""
+        stat = os.stat(self.rules_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self, force: bool = False) -> bool:
+        """규칙 파일이 바뀌었으면 다시 로드 (check_interval 간격으로만 확인)"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.check_interval:
+            return False
+
+        with self._lock:
+            self._last_check = now
+            try:
+                signature = self._file_signature()
+            except OSError as e:
+                if self.matcher is None:
+                    raise
+                logger.warning(f"카테고리 규칙 파일 확인 실패, 기존 규칙 유지: {e}")
+                return False
+
+            if signature == self._signature:
+                return False
+
+            try:
+                state = self._compile()
+            except Exception as e:
+                if self.matcher is None:
+                    raise
+                logger.error(f"카테고리 규칙 재로드 실패, 기존 규칙 유지: {e}")
+                self._signature = signature
+                return False
+
+            self._apply(state)
+            self._signature = signature
+            return True
+
+    def _compile(self) -> Dict:
+        """규칙 파일을 읽어 분류기로 컴파일"""
+        with open(self.rules_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        title_rules = [(list(rule['keywords']), str(rule['category_code'])) for rule in data.get('title_rules', [])]
+        keyword_rules = {str(k): str(v) for k, v in data.get('keyword_rules', {}).items()}
+        default_code = str(data['default_category_code'])
+        state = {
+            'default_category_code': default_code,
+            'title_rules': title_rules,
+            'keyword_rules': keyword_rules,
+            'categories': data.get('categories', {}),
+            'matcher': KeywordMatcher(build_category_rules(title_rules, keyword_rules), default_code)
+        }
+
+        logger.info(f"카테고리 규칙 로드: 키워드 {len(state['matcher'].rules)}개")
+        return state
+
+    def _apply(self, state: Dict):
+        """로드한 규칙을 인덱스에 반영"""
+        self.default_category_code = state['default_category_code']
+        self.title_rules = state['title_rules']
+        self.keyword_rules = state['keyword_rules']
+        self.categories = state['categories']
+        self.matcher = state['matcher']
+
+    def build_matcher(self, keyword_rules: Dict[str, str], default_code: str) -> KeywordMatcher:
+        """상품명 규칙은 그대로 두고 키워드 규칙/기본값만 바꾼 분류기 생성"""
+        return KeywordMatcher(build_category_rules(self.title_rules, keyword_rules), default_code)
+
+    def lookup(self, product_title: str, category: str = '', matcher: Optional[KeywordMatcher] = None) -> str:
+        """상품명과 아마존 카테고리로 네이버 카테고리 코드 반환 (상품명 규칙 > 키워드 규칙 > 기본값)"""
+        self.refresh()
+        matcher = matcher or self.matcher
+        title_lower = product_title.lower() if product_title else ""
+        category_lower = category.lower() if category else ""
+        return matcher.match(title_lower, category_lower)
+
+    def lookup_many(self, product_titles: List[str], categories: Optional[List[str]] = None,
+                    matcher: Optional[KeywordMatcher] = None) -> List[str]:
+        """상품명/카테고리 열 전체의 카테고리 코드"""
+        if categories is None:
+            categories = [''] * len(product_titles)
+        return [self.lookup(title, category, matcher) for title, category in zip(product_titles, categories)]
+
+    def leaf_category_id(self, category_code: str) -> str:
+        """최종(리프) 카테고리 ID (상세 정보가 없으면 기본 카테고리)"""
+        detail = self.categories.get(category_code)
+        return detail['leaf_category_id'] if detail else self.default_category_code
+
+
+_shared_indexes: Dict[str, CategoryRuleIndex] = {}
+_shared_lock = threading.Lock()
+
+
+def get_category_index(rules_file: Optional[str] = None) -> CategoryRuleIndex:
+    """규칙 파일별 공유 카테고리 인덱스 반환"""
+    path = os.path.abspath(rules_file or DEFAULT_RULES_FILE)
+    with _shared_lock:
+        if path not in _shared_indexes:
+            _shared_indexes[path] = CategoryRuleIndex(path)
+        return _shared_indexes[path]
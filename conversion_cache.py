@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+증분 변환 캐시 모듈 (SQLite 기반 상품별 변환 결과 저장소)
+SmartstoreUploader 증분 변환 모드에서 사용
+
+상품 원본 필드(제목, 가격, 설명, 특징, 이미지 URL)와 변환 설정의 지문(fingerprint)별로
+상품명 정리/번역 결과와 상세설명을 저장하여, 어제 크롤링과 같은 상품은
+번역/정리 단계를 다시 거치지 않고 이전 변환 결과를 재사용한다.
+
+작성일: 2025년 8월 5일
+버전: v1.0
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cache_paths import default_cache_path
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 파일 이름 (사용자별 캐시 폴더 안)
+DEFAULT_CACHE_PATH = "conversion_cache.db"
+
+# 지문에 포함되는 원본 필드 (변환 결과에 영향을 주는 필드)
+FINGERPRINT_FIELDS = ('title', 'price_usd', 'description', 'features', 'image_url')
+
+
+def product_fingerprint(product: Dict, settings_signature: str = '') -> str:
+    """상품 원본 필드 + 변환 설정의 SHA-256 지문"""
+    payload = json.dumps(
+        [settings_signature] + [product.get(field) for field in FINGERPRINT_FIELDS],
+        ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ConversionCache:
+    """상품별 변환 결과 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: Optional[str] = None, max_age_days: int = 90):
+        """캐시 DB 초기화 (db_path가 없으면 사용자별 캐시 폴더의 기본 파일)"""
+        db_path = db_path or default_cache_path(DEFAULT_CACHE_PATH)
+        self.db_path = db_path
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS converted_products (
+                fingerprint TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        """)
+
+    def get_many(self, fingerprints: Iterable[str]) -> Dict[str, Dict]:
+        """지문 목록에 대한 저장된 변환 결과 (없는 지문은 결과에 포함되지 않음)"""
+        keys = list(dict.fromkeys(fingerprints))
+        found = {}
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나누어 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT fingerprint, payload FROM converted_products "
+                    f"WHERE fingerprint IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for fingerprint, payload in rows:
+                    found[fingerprint] = json.loads(payload)
+            if found:
+                self.conn.executemany(
+                    "UPDATE converted_products SET updated_at = ? WHERE fingerprint = ?",
+                    [(time.time(), fingerprint) for fingerprint in found]
+                )
+                self.conn.commit()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, entries: List[Tuple[str, Dict]]):
+        """변환 결과 일괄 저장"""
+        if not entries:
+            return
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO converted_products (fingerprint, payload, updated_at) VALUES (?, ?, ?)",
+                [(fingerprint, json.dumps(payload, ensure_ascii=False), now) for fingerprint, payload in entries]
+            )
+            self.conn.commit()
+
+    def prune(self) -> int:
+        """max_age_days 동안 사용되지 않은 결과 삭제"""
+        cutoff = time.time() - self.max_age_days * 86400
+        with self._lock:
+            deleted = self.conn.execute(
+                "DELETE FROM converted_products WHERE updated_at < ?", (cutoff,)
+            ).rowcount
+            self.conn.commit()
+        if deleted:
+            logger.info(f"증분 변환 캐시 정리: {deleted}건 삭제")
+        return deleted
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self.conn.close()
+
+
+_shared_caches: Dict[str, ConversionCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_conversion_cache(db_path: Optional[str] = None) -> ConversionCache:
+    """경로별 공유 변환 캐시 인스턴스 반환 (db_path가 없으면 사용자별 캐시 폴더의 기본 파일)"""
+    path = os.path.abspath(db_path or default_cache_path(DEFAULT_CACHE_PATH))
+    with _shared_lock:
+        if path not in _shared_caches:
+            _shared_caches[path] = ConversionCache(path)
+        return _shared_caches[path]
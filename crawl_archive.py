@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과 컬럼형 아카이브 (Parquet, 수집일/키워드 파티션)
+execute_crawling의 JSON + CSV 이중 저장을 대체
+
+아카이브 구조:
+    crawl_archive/crawl_date=2025-08-05/keyword=vitamin c serum/part-20250805_143000.parquet
+
+변환기는 필요한 컬럼만 메모리 매핑으로 읽는다. pyarrow가 없으면 압축 JSON 파일로 저장한다.
+
+작성일: 2025년 8월 5일
+버전: v1.0
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+# Parquet 지원 (선택 패키지)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 아카이브 폴더
+DEFAULT_ARCHIVE_DIR = "crawl_archive"
+
+# 상품별 검색 키워드 필드 (크롤러 버전에 따라 이름이 다름)
+KEYWORD_FIELDS = ('search_keyword', 'keyword')
+
+# 실행 내 원래 상품 순서 (키워드 파티션으로 나뉘어도 순서를 복원하기 위한 컬럼)
+ORDER_COLUMN = '_crawl_order'
+
+# 파티션 폴더 이름에 쓸 수 없는 문자
+_UNSAFE_PARTITION_RE = re.compile(r'[\\/:*?"<>|=%\x00-\x1f]')
+
+
+def _partition_value(value: str) -> str:
+    """파티션 폴더 이름용 값 정리"""
+    cleaned = _UNSAFE_PARTITION_RE.sub('_', str(value)).strip(' .')
+    return cleaned[:100] or 'unknown'
+
+
+def _product_keyword(product: Dict) -> str:
+    """상품의 검색 키워드 (없으면 unknown)"""
+    for field in KEYWORD_FIELDS:
+        if product.get(field):
+            return str(product[field])
+    return 'unknown'
+
+
+def _to_arrow_table(products: List[Dict]) -> 'pa.Table':
+    """상품 목록을 Arrow 테이블로 변환 (타입이 섞인 컬럼은 문자열로 저장)"""
+    columns = list(dict.fromkeys(key for product in products for key in product))
+    arrays = []
+    for column in columns:
+        values = [product.get(column) for product in products]
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            arrays.append(pa.array([
+                None if value is None
+                else json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict))
+                else str(value)
+                for value in values
+            ], type=pa.string()))
+    return pa.Table.from_arrays(arrays, names=columns)
+
+
+def write_crawl_archive(products: List[Dict], archive_dir: str = DEFAULT_ARCHIVE_DIR,
+                        run_id: Optional[str] = None, crawl_date: Optional[str] = None) -> List[str]:
+    """크롤링 결과를 수집일/키워드 파티션으로 저장
+
+    Args:
+        products: 크롤링된 상품 목록
+        archive_dir: 아카이브 루트 폴더
+        run_id: 이번 크롤링 실행 ID (파일 이름, 기본값은 현재 시각)
+        crawl_date: 수집일 파티션 값 (기본값은 오늘)
+
+    Returns:
+        저장된 파일 경로 목록 (pyarrow가 없으면 JSON 파일 하나)
+    """
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    crawl_date = crawl_date or datetime.now().strftime("%Y-%m-%d")
+    date_dir = os.path.join(archive_dir, f"crawl_date={crawl_date}")
+
+    if not PARQUET_AVAILABLE:
+        os.makedirs(date_dir, exist_ok=True)
+        json_path = os.path.join(date_dir, f"part-{run_id}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(products, f, ensure_ascii=False, separators=(',', ':'))
+        logger.info(f"pyarrow가 없어 JSON으로 저장: {json_path}")
+        return [json_path]
+
+    groups: Dict[str, List[Dict]] = {}
+    for order, product in enumerate(products):
+        groups.setdefault(_partition_value(_product_keyword(product)), []).append({**product, ORDER_COLUMN: order})
+
+    written = []
+    for keyword, group in groups.items():
+        keyword_dir = os.path.join(date_dir, f"keyword={keyword}")
+        os.makedirs(keyword_dir, exist_ok=True)
+        path = os.path.join(keyword_dir, f"part-{run_id}.parquet")
+        pq.write_table(_to_arrow_table(group), path, compression='zstd')
+        written.append(path)
+
+    logger.info(f"크롤링 아카이브 저장: {len(products)}개 상품, {len(written)}개 파티션 ({date_dir})")
+    return written
+
+
+def is_archive_path(path: str) -> bool:
+    """Parquet 파일 또는 아카이브 폴더 여부"""
+    return path.endswith('.parquet') or os.path.isdir(path)
+
+
+def latest_archive_run(archive_dir: str = DEFAULT_ARCHIVE_DIR) -> Optional[str]:
+    """아카이브 폴더에서 가장 최근 크롤링 실행 ID (Parquet 파일이 없으면 None)"""
+    if not os.path.isdir(archive_dir):
+        return None
+    runs = [
+        name[len('part-'):-len('.parquet')]
+        for _, _, names in os.walk(archive_dir)
+        for name in names
+        if name.startswith('part-') and name.endswith('.parquet')
+    ]
+    return max(runs) if runs else None
+
+
+def read_crawl_archive(path: str, columns: Optional[Sequence[str]] = None,
+                       run_id: Optional[str] = None) -> List[Dict]:
+    """아카이브에서 상품 목록 읽기 (컬럼 선택 + 메모리 매핑)
+
+    Args:
+        path: Parquet 파일 또는 아카이브(파티션) 폴더
+        columns: 읽을 컬럼 (None이면 전체, 없는 컬럼은 무시)
+        run_id: 특정 크롤링 실행의 파일만 읽기 (폴더일 때)
+
+    Returns:
+        상품 딕셔너리 목록 (값이 없는 필드는 제외). 여러 실행을 읽으면 최근 실행이 먼저 오므로
+        처음 것을 유지하는 중복 제거에서 최신 수집 결과가 남는다.
+    """
+    if not PARQUET_AVAILABLE:
+        raise ImportError("Parquet 아카이브를 읽으려면 pyarrow가 필요합니다: pip install pyarrow")
+
+    if os.path.isdir(path):
+        files = sorted(
+            os.path.join(root, name)
+            for root, _, names in os.walk(path)
+            for name in names
+            if name.endswith('.parquet') and (run_id is None or name == f"part-{run_id}.parquet")
+        )
+    else:
+        files = [path]
+
+    # 파티션마다 추론된 타입이 다를 수 있으므로 파일 단위로 읽음
+    keyed_rows = []
+    for file_path in files:
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        names = parquet_file.schema_arrow.names
+        selected = None
+        if columns is not None:
+            selected = [column for column in columns if column in names and column != ORDER_COLUMN]
+            if ORDER_COLUMN in names:
+                selected.append(ORDER_COLUMN)
+        run_name = os.path.basename(file_path)
+        for position, row in enumerate(parquet_file.read(columns=selected).to_pylist()):
+            order = row.pop(ORDER_COLUMN, None)
+            keyed_rows.append(((run_name, order if order is not None else position), row))
+
+    # 최근 실행(파일 이름 내림차순) 먼저, 실행 안에서는 원래 크롤링 순서로 정렬
+    keyed_rows.sort(key=lambda item: item[0][1])
+    keyed_rows.sort(key=lambda item: item[0][0], reverse=True)
+    return [
+        {key: value for key, value in row.items() if value is not None}
+        for _, row in keyed_rows
+    ]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 기반 카테고리 분류기 (Aho-Corasick 다중 패턴 매칭)
+SmartstoreUploader.get_category_code의 우선순위 규칙을 하나의 오토마톤으로 컴파일
+
+규칙 수와 관계없이 상품명/카테고리 문자열을 한 번만 훑어서
+가장 우선순위가 높은(먼저 정의된) 규칙의 카테고리 코드를 찾는다.
+
+작성일: 2025년 8월 4일
+버전: v1.0
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 규칙 적용 범위: 상품명에만 적용 / 상품명 또는 카테고리에 적용
+SCOPE_TITLE = 'title'
+SCOPE_ANY = 'any'
+
+_NO_MATCH = float('inf')
+
+
+class KeywordMatcher:
+    """우선순위 키워드 규칙 분류기
+
+    rules는 (키워드, 카테고리 코드, 적용 범위) 목록이며 앞에 있을수록 우선순위가 높다.
+    결과는 규칙을 순서대로 `keyword in text` 검사하는 방식과 동일하다.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str, str]], default_code: str, memo_size: int = 50000):
+        """오토마톤 구성"""
+        self.rules = list(rules)
+        self.default_code = default_code
+        self.memo_size = memo_size
+        self._memo: Dict[Tuple[str, str], str] = {}
+
+        # 노드별 전이 테이블, 실패 링크, 매칭되는 규칙의 최소 우선순위 (전체 / 카테고리 적용 규칙)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._best_any: List[float] = [_NO_MATCH]
+        self._best_category: List[float] = [_NO_MATCH]
+
+        for priority, (keyword, _code, scope) in enumerate(self.rules):
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._best_any.append(_NO_MATCH)
+                    self._best_category.append(_NO_MATCH)
+                node = next_node
+            self._best_any[node] = min(self._best_any[node], priority)
+            if scope == SCOPE_ANY:
+                self._best_category[node] = min(self._best_category[node], priority)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        """너비 우선으로 실패 링크를 만들고 접미사 노드의 매칭 결과를 합침"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._best_any[child] = min(self._best_any[child], self._best_any[self._fail[child]])
+                self._best_category[child] = min(self._best_category[child], self._best_category[self._fail[child]])
+                queue.append(child)
+
+    def _scan(self, text: str, best: List[float]) -> float:
+        """문자열에서 매칭되는 규칙의 최소 우선순위 (빈 키워드는 루트 노드에서 처리)"""
+        result = best[0]
+        goto = self._goto
+        fail = self._fail
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if best[node] < result:
+                result = best[node]
+                if result == 0:
+                    break
+        return result
+
+    def match(self, title_lower: str, category_lower: str = '') -> str:
+        """소문자화된 상품명/카테고리에 대한 카테고리 코드"""
+        key = (title_lower, category_lower)
+        code = self._memo.get(key)
+        if code is not None:
+            return code
+
+        priority = self._scan(title_lower, self._best_any)
+        if category_lower and priority:
+            priority = min(priority, self._scan(category_lower, self._best_category))
+        elif not category_lower and self._best_category[0] < priority:
+            # 빈 키워드 규칙은 빈 카테고리 문자열에도 매칭됨
+            priority = self._best_category[0]
+
+        code = self.rules[priority][1] if priority != _NO_MATCH else self.default_code
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[key] = code
+        return code
+
+    def match_many(self, titles: Iterable[str], categories: Optional[Iterable[str]] = None) -> List[str]:
+        """상품명/카테고리 열 전체 분류"""
+        if categories is None:
+            return [self.match(title) for title in titles]
+        return [self.match(title, category) for title, category in zip(titles, categories)]
+
+
+def build_category_rules(title_rules: Sequence[Tuple[Sequence[str], str]],
+                         category_codes: Dict[str, str]) -> List[Tuple[str, str, str]]:
+    """get_category_code 규칙을 우선순위 순서의 (키워드, 코드, 범위) 목록으로 변환
+
+    상품명 규칙 그룹이 먼저, 그다음 category_codes가 정의 순서대로 온다.
+    """
+    rules = []
+    for keywords, code in title_rules:
+        for keyword in keywords:
+            rules.append((keyword, code, SCOPE_TITLE))
+    for keyword, code in category_codes.items():
+        rules.append((keyword, code, SCOPE_ANY))
+    return rules
@@ -13,19 +13,38 @@ import aiohttp
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 import base64
 import hashlib
 import hmac
+import random
+import sqlite3
+import tempfile
+import threading
 import time
 from urllib.parse import urlencode
 import os
 from pathlib import Path
 
+from category_rules import get_category_index
+from translation_cache import get_translation_cache
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 재시도 대상 HTTP 상태 코드 (요청 한도 초과 / 일시적 서버 오류)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# 비멱등 요청(상품 등록) 재시도 대상 - 서버가 처리하지 않았음이 확실한 경우만
+# (429 응답, 요청을 보내기 전의 연결 실패. 타임아웃/5xx는 이미 등록됐을 수 있으므로 재시도하지 않음)
+NON_IDEMPOTENT_RETRYABLE_STATUSES = {429}
+NON_IDEMPOTENT_RETRYABLE_ERRORS = (aiohttp.ClientConnectorError,)
+
+# 이미지 스트리밍 전송 청크 크기
+IMAGE_CHUNK_SIZE = 64 * 1024
+
 @dataclass
 class NaverProductData:
     """네이버 스마트스토어 상품 등록 데이터"""
@@ -42,11 +61,267 @@ class NaverProductData:
     delivery_method: str
     status: str = "SALE"  # SALE, SOLD_OUT, STOP
     adult_product: bool = False
+    failed_images: List[Dict[str, str]] = field(default_factory=list)  # 업로드 실패 이미지 (URL별)
+
+class TokenBucket:
+    """비동기 토큰 버킷 요청 제한기 (커머스 API 호출 한도 준수)"""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """초당 요청 수(rate)와 순간 허용량(capacity) 설정"""
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def _reserve(self) -> float:
+        """토큰 차감 시도 - 성공 시 0, 부족하면 대기할 시간(초) 반환"""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+    
+    async def acquire(self):
+        """토큰 1개 획득 (부족하면 보충될 때까지 대기)"""
+        async with self._lock:
+            while True:
+                delay = self._reserve()
+                if delay <= 0:
+                    return
+                await asyncio.sleep(delay)
+
+class AdaptiveRateLimiter(TokenBucket):
+    """응답 상태에 따라 속도를 조절하는 적응형 요청 제한기
+    
+    정상 응답이 이어지면 max_rate(API 한도)까지 조금씩 속도를 올리고,
+    429/5xx 응답을 받으면 속도를 절반으로 줄이며 Retry-After 동안 모든 요청을 멈춘다.
+    """
+    
+    def __init__(self, max_rate: float, min_rate: Optional[float] = None,
+                 increase_step: Optional[float] = None, decrease_factor: float = 0.5):
+        """최대/최소 속도 및 증감 폭 설정"""
+        super().__init__(max_rate)
+        self.max_rate = max_rate
+        self.min_rate = min_rate if min_rate is not None else max_rate / 10
+        self.increase_step = increase_step if increase_step is not None else max_rate / 20
+        self.decrease_factor = decrease_factor
+        self._paused_until = 0.0
+    
+    def _reserve(self) -> float:
+        """일시 정지 중이면 남은 시간 반환, 아니면 토큰 차감"""
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            return pause
+        return super()._reserve()
+    
+    def on_success(self):
+        """정상 응답 - 속도 점진 증가"""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+    
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """429/5xx 응답 - 속도 감소 및 Retry-After 동안 전체 정지"""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._tokens = 0
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        logger.warning(f"요청 한도 조정: {self.rate:.2f}회/초"
+                       + (f", {retry_after:.1f}초 대기" if retry_after else ""))
+    
+class TokenCache:
+    """액세스 토큰 캐시 (만료 시각 관리 + 디스크 저장)"""
+    
+    def __init__(self, cache_file: Optional[str] = None, refresh_margin: int = 600):
+        """캐시 파일 경로와 사전 갱신 여유 시간(초) 설정"""
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.refresh_margin = refresh_margin
+        self.access_token = None
+        self.expires_at = 0.0  # 만료 시각 (epoch 초)
+    
+    def is_valid(self) -> bool:
+        """토큰이 있고 아직 만료되지 않았는지"""
+        return bool(self.access_token) and time.time() < self.expires_at
+    
+    def needs_refresh(self) -> bool:
+        """만료가 임박해 미리 갱신해야 하는지"""
+        return not self.access_token or time.time() >= self.expires_at - self.refresh_margin
+    
+    def store(self, access_token: str, expires_in: int, client_id: str):
+        """새 토큰 저장 (파일 경로가 있으면 디스크에도 기록)"""
+        self.access_token = access_token
+        self.expires_at = time.time() + expires_in
+        
+        if not self.cache_file:
+            return
+        # 처음부터 0600으로 만든 임시 파일에 기록한 뒤 교체 (다른 사용자가 읽을 수 있는 순간이 없도록)
+        tmp_file = self.cache_file.with_name(f".{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'client_id': client_id,
+                    'access_token': access_token,
+                    'expires_at': self.expires_at
+                }, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.warning(f"토큰 캐시 저장 실패: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    
+    def load(self, client_id: str) -> bool:
+        """디스크에서 유효한 토큰 로드 (같은 client_id의 토큰만 사용)"""
+        if not self.cache_file or not self.cache_file.exists():
+            return False
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"토큰 캐시 로드 실패: {e}")
+            return False
+        
+        if data.get('client_id') != client_id:
+            return False
+        
+        self.access_token = data.get('access_token')
+        self.expires_at = float(data.get('expires_at', 0))
+        return self.is_valid()
+    
+    def invalidate(self):
+        """토큰 폐기 (401 응답 등)"""
+        self.access_token = None
+        self.expires_at = 0.0
+
+class ImageUploadCache:
+    """업로드 이미지 캐시 (원본 URL/내용 해시 -> 네이버 이미지 URL, SQLite)
+    
+    같은 원본 URL은 다운로드 없이, 다른 URL이라도 내용이 같으면 업로드 없이
+    기존 네이버 이미지 URL을 재사용한다. TTL이 지난 항목과 최대 개수를 넘는
+    오래 사용하지 않은 항목은 자동으로 정리된다.
+    
+    비동기 업로드에서는 asyncio.to_thread로 호출하므로 연결은 잠금으로 보호한다.
+    """
+    
+    def __init__(self, db_path: str, ttl_days: int = 30, max_entries: int = 50000):
+        """캐시 DB 초기화"""
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS image_uploads (
+                content_hash TEXT PRIMARY KEY,
+                image_url TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS image_sources (
+                source_url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_image_uploads_last_used ON image_uploads(last_used);
+        """)
+        self.evict()
     
+    def _touch(self, content_hash: str) -> Optional[str]:
+        """유효한 항목이면 사용 시각 갱신 후 네이버 URL 반환"""
+        now = time.time()
+        row = self.conn.execute(
+            "SELECT image_url FROM image_uploads WHERE content_hash = ? AND created_at > ?",
+            (content_hash, now - self.ttl_seconds)
+        ).fetchone()
+        if not row:
+            return None
+        self.conn.execute("UPDATE image_uploads SET last_used = ? WHERE content_hash = ?", (now, content_hash))
+        self.conn.commit()
+        return row[0]
+    
+    def lookup_url(self, source_url: str) -> Optional[str]:
+        """원본 URL로 조회 (다운로드 생략)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT content_hash FROM image_sources WHERE source_url = ?", (source_url,)
+            ).fetchone()
+            return self._touch(row[0]) if row else None
+    
+    def lookup_hash(self, content_hash: str, source_url: str) -> Optional[str]:
+        """내용 해시로 조회 (업로드 생략) - 적중 시 원본 URL도 연결"""
+        with self._lock:
+            image_url = self._touch(content_hash)
+            if image_url:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO image_sources (source_url, content_hash) VALUES (?, ?)",
+                    (source_url, content_hash)
+                )
+                self.conn.commit()
+            return image_url
+    
+    def store(self, source_url: str, content_hash: str, image_url: str, size: int):
+        """업로드 결과 저장"""
+        with self._lock:
+            self._store(source_url, content_hash, image_url, size)
+    
+    def _store(self, source_url: str, content_hash: str, image_url: str, size: int):
+        """업로드 결과 저장 (잠금 상태에서 호출)"""
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO image_uploads (content_hash, image_url, size, created_at, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (content_hash, image_url, size, now, now)
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO image_sources (source_url, content_hash) VALUES (?, ?)",
+            (source_url, content_hash)
+        )
+        self.conn.commit()
+    
+    def evict(self):
+        """TTL 만료 및 최대 개수 초과 항목 정리"""
+        with self._lock:
+            self._evict()
+    
+    def _evict(self):
+        """TTL 만료 및 최대 개수 초과 항목 정리 (잠금 상태에서 호출)"""
+        self.conn.execute("DELETE FROM image_uploads WHERE created_at <= ?", (time.time() - self.ttl_seconds,))
+        self.conn.execute(
+            "DELETE FROM image_uploads WHERE content_hash IN ("
+            "SELECT content_hash FROM image_uploads ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self.conn.execute(
+            "DELETE FROM image_sources WHERE content_hash NOT IN (SELECT content_hash FROM image_uploads)"
+        )
+        self.conn.commit()
+    
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self.conn.close()
+
 class NaverSmartStoreAPI:
     """네이버 스마트스토어 커머스 API 클래스"""
     
-    def __init__(self, client_id: str, client_secret: str, customer_id: str):
+    def __init__(self, client_id: str, client_secret: str, customer_id: str,
+                 max_concurrent_images: int = 8, max_concurrent_registrations: int = 5,
+                 requests_per_second: float = 2.0, max_retries: int = 4,
+                 token_cache_file: Optional[str] = None, image_cache_file: Optional[str] = None,
+                 max_image_bytes: int = 10 * 1024 * 1024, image_spool_bytes: int = 1024 * 1024,
+                 translation_cache_file: Optional[str] = None,
+                 category_rules_file: Optional[str] = None,
+                 translation_requests_per_second: float = 5.0):
         """API 클라이언트 초기화"""
         self.client_id = client_id
         self.client_secret = client_secret
@@ -55,29 +330,59 @@ class NaverSmartStoreAPI:
         self.session = None
         self.access_token = None
         
-        # 카테고리 매핑 (아마존 -> 네이버)
-        self.category_mapping = {
-            "diet supplements": "50002617",      # 건강식품/다이어트
-            "protein powder": "50002617",        # 건강식품/다이어트
-            "granola cereal": "50000163",        # 식품/간편식
-            "health supplements": "50002617",     # 건강식품/다이어트
-            "baby clothes ballet": "50000671",   # 유아동패션/잡화
-            "gaming accessories": "50000056",    # 컴퓨터/게임
-            "medical equipment": "50002617",     # 건강식품/다이어트
-            "brand accessories": "50000057",     # 패션잡화
-            "home garden": "50000078",          # 생활/건강
-            "sports outdoor": "50000080"        # 스포츠/레저
-        }
+        # 토큰 수명 관리 (만료 전 백그라운드 갱신, 디스크 캐시로 재인증 생략)
+        self.token_cache = TokenCache(token_cache_file)
+        self._auth_lock = asyncio.Lock()
+        self._refresh_task = None
+        
+        # 이미지 다운로드/업로드 동시 실행 제한 (모든 상품 공통)
+        self.max_concurrent_images = max(1, max_concurrent_images)
+        self.image_semaphore = None
+        
+        # 업로드 이미지 캐시 (실행 간 재사용) 및 실행 중 중복 업로드 방지
+        self.image_cache = ImageUploadCache(image_cache_file) if image_cache_file else None
+        self._inflight_images: Dict[str, asyncio.Future] = {}
+        
+        # 번역 캐시 (SmartstoreUploader와 공유하는 번역 메모리, 첫 번역 때 연결)
+        self.translation_cache_file = translation_cache_file
+        self._translation_cache = None
+        
+        # 이미지 스트리밍 설정 (이미지당 최대 크기, 메모리 보관 한도 - 초과분은 임시 파일)
+        self.max_image_bytes = max_image_bytes
+        self.image_spool_bytes = image_spool_bytes
+        
+        # 동시 등록 수 및 API 호출 한도 (모든 네이버 API 요청이 공유하는 적응형 제한기)
+        self.max_concurrent_registrations = max(1, max_concurrent_registrations)
+        self.rate_limiter = AdaptiveRateLimiter(requests_per_second)
+        
+        # Papago(openapi.naver.com)는 커머스 API와 한도가 별개이므로 별도 제한기 사용
+        # (번역 429가 상품 등록 속도를 떨어뜨리지 않도록)
+        self.translation_rate_limiter = AdaptiveRateLimiter(translation_requests_per_second)
+        
+        # 429/5xx/네트워크 오류 재시도 설정
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = 1.0
+        self.backoff_max = 60.0
+        
+        # 카테고리 규칙 (category_rules.json, SmartstoreUploader와 공유하는 인덱스)
+        self.category_index = get_category_index(category_rules_file)
     
     async def init_session(self):
         """HTTP 세션 초기화"""
-        connector = aiohttp.TCPConnector(limit=10)
+        connector = aiohttp.TCPConnector(
+            limit=max(10, self.max_concurrent_registrations + self.max_concurrent_images)
+        )
         timeout = aiohttp.ClientTimeout(total=30)
         
         self.session = aiohttp.ClientSession(
             connector=connector,
             timeout=timeout
         )
+        self.image_semaphore = asyncio.Semaphore(self.max_concurrent_images)
+        
+        if self.token_cache.load(self.client_id):
+            self.access_token = self.token_cache.access_token
+            logger.info("캐시된 네이버 API 토큰 사용")
     
     def _generate_signature(self, timestamp: str, method: str, uri: str, body: str = "") -> str:
         """API 서명 생성"""
@@ -113,6 +418,96 @@ class NaverSmartStoreAPI:
         
         return headers
     
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Retry-After 헤더 해석 (초 또는 HTTP 날짜)"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """지수 백오프 + 지터"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.5)
+    
+    async def _request(self, method: str, url: str, build_kwargs: Callable[[], Dict[str, Any]],
+                       read: Any = 'json', rate_limited: bool = True,
+                       authorized: bool = False,
+                       limiter: Optional[AdaptiveRateLimiter] = None,
+                       idempotent: bool = True) -> Tuple[int, Any]:
+        """HTTP 요청 실행 (요청 제한 + 429/5xx/네트워크 오류 재시도)
+        
+        rate_limited 요청은 limiter(기본값: 커머스 API 제한기)를 거친다.
+        idempotent=False인 요청(상품 등록)은 중복 처리를 막기 위해 429 응답과
+        요청을 보내기 전의 연결 실패만 재시도한다.
+        build_kwargs는 시도마다 호출되어 새 헤더(서명 타임스탬프, 토큰)와 본문을 만든다.
+        authorized 요청은 보내기 전에 토큰을 확인하고, 401 응답 시 한 번 재인증한다.
+        200 응답은 read 형식('json', 'text', 'bytes' 또는 응답을 받는 코루틴 함수)으로,
+        그 외는 텍스트로 본문을 반환한다.
+        """
+        limiter = limiter or self.rate_limiter
+        retryable_statuses = RETRYABLE_STATUSES if idempotent else NON_IDEMPOTENT_RETRYABLE_STATUSES
+        attempt = 0
+        reauthenticated = False
+        while True:
+            if authorized:
+                await self.ensure_token()
+            if rate_limited:
+                await limiter.acquire()
+            
+            try:
+                async with self.session.request(method, url, **build_kwargs()) as response:
+                    status = response.status
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    if status == 200:
+                        if callable(read):
+                            body = await read(response)
+                        elif read == 'json':
+                            body = await response.json()
+                        elif read == 'bytes':
+                            body = await response.read()
+                        else:
+                            body = await response.text()
+                    else:
+                        body = await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries or not (idempotent or isinstance(e, NON_IDEMPOTENT_RETRYABLE_ERRORS)):
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"요청 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {url} - {e}")
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            
+            if status == 401 and authorized and not reauthenticated:
+                logger.warning("토큰이 거부되어 재인증 후 재시도합니다.")
+                reauthenticated = True
+                self.token_cache.invalidate()
+                self.access_token = None
+                continue
+            
+            if status in retryable_statuses and attempt < self.max_retries:
+                delay = self._backoff_delay(attempt)
+                if retry_after is not None:
+                    delay = retry_after + random.uniform(0, self.backoff_base)
+                if rate_limited:
+                    limiter.on_throttle(retry_after if status == 429 else None)
+                logger.warning(f"응답 {status}, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {url}")
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            
+            if rate_limited and status < 400:
+                limiter.on_success()
+            return status, body
+    
     async def authenticate(self) -> bool:
         """OAuth 2.0 인증"""
         try:
@@ -126,55 +521,194 @@ class NaverSmartStoreAPI:
             
             headers = {'Content-Type': 'application/x-www-form-urlencoded'}
             
-            async with self.session.post(auth_url, data=auth_data, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self.access_token = data.get('access_token')
-                    logger.info("네이버 API 인증 성공")
-                    return True
-                else:
-                    logger.error(f"네이버 API 인증 실패: {response.status}")
-                    return False
+            status, data = await self._request(
+                'POST', auth_url, lambda: {'data': auth_data, 'headers': headers}
+            )
+            if status == 200:
+                self.access_token = data.get('access_token')
+                self.token_cache.store(self.access_token, int(data.get('expires_in', 10800)), self.client_id)
+                logger.info("네이버 API 인증 성공")
+                return True
+            else:
+                logger.error(f"네이버 API 인증 실패: {status}")
+                return False
                     
         except Exception as e:
             logger.error(f"네이버 API 인증 오류: {str(e)}")
             return False
     
+    async def ensure_token(self) -> bool:
+        """유효한 토큰 보장
+        
+        만료가 임박하면 백그라운드에서 갱신하고 기존 토큰으로 계속 요청하며,
+        토큰이 없거나 만료된 경우에만 인증이 끝날 때까지 대기한다.
+        """
+        if self.token_cache.is_valid():
+            if self.token_cache.needs_refresh() and (self._refresh_task is None or self._refresh_task.done()):
+                self._refresh_task = asyncio.create_task(self._refresh_token())
+            return True
+        
+        async with self._auth_lock:
+            if self.token_cache.is_valid():
+                return True
+            return await self.authenticate()
+    
+    async def _refresh_token(self):
+        """백그라운드 토큰 갱신"""
+        async with self._auth_lock:
+            if self.token_cache.needs_refresh():
+                logger.info("네이버 API 토큰 만료 전 갱신")
+                await self.authenticate()
+    
+    async def _spool_image(self, response: aiohttp.ClientResponse) -> Tuple[Any, str, int]:
+        """다운로드 본문을 청크 단위로 임시 파일에 저장 (크기 제한 + 내용 해시 계산)
+        
+        image_spool_bytes까지는 메모리에, 초과분은 디스크에 보관한다.
+        """
+        if response.content_length and response.content_length > self.max_image_bytes:
+            raise ValueError(f"이미지 크기 초과: {response.content_length} bytes")
+        
+        spool = tempfile.SpooledTemporaryFile(max_size=self.image_spool_bytes)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async for chunk in response.content.iter_chunked(IMAGE_CHUNK_SIZE):
+                size += len(chunk)
+                if size > self.max_image_bytes:
+                    raise ValueError(f"이미지 크기 초과: {self.max_image_bytes} bytes 이상")
+                digest.update(chunk)
+                spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+        
+        return spool, digest.hexdigest(), size
+    
     async def upload_image(self, image_url: str) -> Optional[str]:
-        """이미지 업로드"""
+        """이미지 업로드 (캐시 적중 시 다운로드/업로드 생략, 스트리밍 전송)"""
+        spool = None
         try:
-            # 이미지 다운로드
-            async with self.session.get(image_url) as response:
-                if response.status != 200:
-                    return None
-                
-                image_data = await response.read()
+            # 캐시 조회/기록은 동기 SQLite이므로 이벤트 루프를 막지 않도록 작업 쓰레드에서 실행
+            if self.image_cache:
+                cached_url = await asyncio.to_thread(self.image_cache.lookup_url, image_url)
+                if cached_url:
+                    return cached_url
+            
+            # 이미지 다운로드 (아마존 CDN - 네이버 호출 한도와 무관하므로 재시도만 적용)
+            status, downloaded = await self._request(
+                'GET', image_url, lambda: {}, read=self._spool_image, rate_limited=False
+            )
+            if status != 200:
+                return None
+            spool, content_hash, size = downloaded
+            
+            if self.image_cache:
+                cached_url = await asyncio.to_thread(self.image_cache.lookup_hash, content_hash, image_url)
+                if cached_url:
+                    return cached_url
             
             # 네이버 이미지 업로드 API
             upload_url = f"{self.base_url}/external/v1/product-images/upload"
             
-            # 멀티파트 폼 데이터 생성
-            data = aiohttp.FormData()
-            data.add_field('image', image_data, filename='product.jpg', content_type='image/jpeg')
+            async def iter_spool():
+                spool.seek(0)
+                while True:
+                    chunk = spool.read(IMAGE_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
             
-            headers = self._get_headers('POST', '/external/v1/product-images/upload')
-            del headers['Content-Type']  # 멀티파트에서는 자동 설정
+            def build_upload():
+                # 멀티파트 폼 데이터 생성 (재시도마다 새로 생성, 본문은 청크 단위 전송)
+                data = aiohttp.FormData()
+                data.add_field('image', iter_spool(), filename='product.jpg', content_type='image/jpeg')
+                
+                headers = self._get_headers('POST', '/external/v1/product-images/upload')
+                del headers['Content-Type']  # 멀티파트에서는 자동 설정
+                return {'data': data, 'headers': headers}
             
-            async with self.session.post(upload_url, data=data, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get('imageUrl')
-                else:
-                    logger.error(f"이미지 업로드 실패: {response.status}")
-                    return None
+            status, result = await self._request('POST', upload_url, build_upload, authorized=True)
+            if status == 200:
+                uploaded_url = result.get('imageUrl')
+                if uploaded_url and self.image_cache:
+                    await asyncio.to_thread(self.image_cache.store, image_url, content_hash, uploaded_url, size)
+                return uploaded_url
+            else:
+                logger.error(f"이미지 업로드 실패: {status}")
+                return None
                     
         except Exception as e:
             logger.error(f"이미지 업로드 오류: {str(e)}")
             return None
+        finally:
+            if spool:
+                spool.close()
+    
+    async def _upload_image_limited(self, image_url: str) -> Optional[str]:
+        """동시 실행 제한 내에서 이미지 업로드 (같은 URL은 진행 중인 업로드 결과 공유)"""
+        inflight = self._inflight_images.get(image_url)
+        if inflight:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_images[image_url] = future
+        try:
+            async with self.image_semaphore:
+                result = await self.upload_image(image_url)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight_images[image_url]
+        
+        future.set_result(result)
+        return result
+    
+    async def upload_images(self, image_urls: List[str]) -> Tuple[List[str], List[Dict[str, str]]]:
+        """이미지 병렬 업로드 (원본 순서 유지)
+        
+        Returns:
+            (업로드된 이미지 URL 목록, 실패한 이미지 목록 [{"image_url", "reason"}])
+        """
+        targets = [url for url in image_urls if url]
+        if not targets:
+            return [], []
+        
+        results = await asyncio.gather(
+            *(self._upload_image_limited(url) for url in targets),
+            return_exceptions=True
+        )
+        
+        uploaded_images = []
+        failed_images = []
+        for image_url, result in zip(targets, results):
+            # 취소(CancelledError)는 Exception이 아닌 BaseException이므로 함께 실패로 처리
+            if isinstance(result, BaseException):
+                failed_images.append({"image_url": image_url, "reason": str(result) or type(result).__name__})
+            elif result:
+                uploaded_images.append(result)
+            else:
+                failed_images.append({"image_url": image_url, "reason": "업로드 실패"})
+        
+        for failed in failed_images:
+            logger.warning(f"이미지 업로드 실패: {failed['image_url']} ({failed['reason']})")
+        
+        return uploaded_images, failed_images
+    
+    @property
+    def translation_cache(self):
+        """공유 번역 캐시 (처음 사용할 때 DB 파일을 열거나 생성)"""
+        if self._translation_cache is None:
+            self._translation_cache = get_translation_cache(self.translation_cache_file)
+        return self._translation_cache
     
     async def translate_description(self, description: str) -> str:
-        """상품 설명 번역 (Papago API 활용)"""
+        """상품 설명 번역 (Papago API 활용, 번역 캐시 적중 시 호출 생략)"""
         try:
+            cached = self.translation_cache.get(description[:5000], 'description', 'en', 'ko')
+            if cached is not None:
+                return cached
+            
             translate_url = "https://openapi.naver.com/v1/papago/n2mt"
             
             headers = {
@@ -189,13 +723,17 @@ class NaverSmartStoreAPI:
                 'text': description[:5000]  # 5000자 제한
             }
             
-            async with self.session.post(translate_url, data=data, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result['message']['result']['translatedText']
-                else:
-                    logger.warning(f"번역 실패, 원문 사용: {response.status}")
-                    return description
+            status, result = await self._request(
+                'POST', translate_url, lambda: {'data': data, 'headers': headers},
+                limiter=self.translation_rate_limiter
+            )
+            if status == 200:
+                translated = result['message']['result']['translatedText']
+                self.translation_cache.set(description[:5000], translated, 'description', 'en', 'ko')
+                return translated
+            else:
+                logger.warning(f"번역 실패, 원문 사용: {status}")
+                return description
                     
         except Exception as e:
             logger.error(f"번역 오류: {str(e)}")
@@ -212,11 +750,8 @@ class NaverSmartStoreAPI:
             selling_price = int(original_price_krw * 1.35)
             discount_price = int(selling_price * 0.95)  # 5% 할인가
             
-            # 카테고리 매핑
-            category_id = self.category_mapping.get(
-                amazon_product.get('category', ''), 
-                "50002617"  # 기본: 건강식품
-            )
+            # 카테고리 매핑 (SmartstoreUploader와 같은 category_rules.json 규칙: 상품명 > 키워드 > 기본값)
+            category_id = self.category_index.lookup(amazon_product['title'], amazon_product.get('category', ''))
             
             # 상품명 생성 (브랜드 + 원제목)
             product_name = f"[{amazon_product.get('brand', 'Amazon')}] {amazon_product['title'][:80]}"
@@ -265,13 +800,9 @@ class NaverSmartStoreAPI:
     async def register_product(self, naver_product: NaverProductData) -> Optional[str]:
         """네이버 스마트스토어에 상품 등록"""
         try:
-            # 이미지 업로드
-            uploaded_images = []
-            for image_url in naver_product.images:
-                if image_url:
-                    uploaded_url = await self.upload_image(image_url)
-                    if uploaded_url:
-                        uploaded_images.append(uploaded_url)
+            # 이미지 업로드 (병렬, 원본 순서 유지)
+            uploaded_images, failed_images = await self.upload_images(naver_product.images)
+            naver_product.failed_images = failed_images
             
             # 상품 등록 데이터
             product_data = {
@@ -316,76 +847,120 @@ class NaverSmartStoreAPI:
                 }
             }
             
-            # API 요청
+            # API 요청 (비멱등 - 타임아웃/5xx 후 재시도하면 같은 상품이 두 번 등록될 수 있음)
             register_url = f"{self.base_url}/external/v2/products"
             body = json.dumps(product_data, ensure_ascii=False)
-            headers = self._get_headers('POST', '/external/v2/products', body)
-            
-            async with self.session.post(register_url, data=body, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    product_id = result.get('originProductId')
-                    logger.info(f"상품 등록 성공: {naver_product.product_name} (ID: {product_id})")
-                    return product_id
-                else:
-                    error_data = await response.text()
-                    logger.error(f"상품 등록 실패: {response.status} - {error_data}")
-                    return None
+            
+            status, result = await self._request(
+                'POST', register_url,
+                lambda: {'data': body, 'headers': self._get_headers('POST', '/external/v2/products', body)},
+                authorized=True, idempotent=False
+            )
+            if status == 200:
+                product_id = result.get('originProductId')
+                logger.info(f"상품 등록 성공: {naver_product.product_name} (ID: {product_id})")
+                return product_id
+            else:
+                logger.error(f"상품 등록 실패: {status} - {result}")
+                return None
                     
         except Exception as e:
             logger.error(f"상품 등록 오류: {str(e)}")
             return None
     
+    async def _register_one(self, index: int, amazon_product: Dict, total: int) -> Tuple[bool, Dict]:
+        """단일 상품 변환 + 등록 (소요 시간 기록)"""
+        started = time.monotonic()
+        try:
+            logger.info(f"상품 등록 진행: {index+1}/{total} - {amazon_product.get('title', '')[:50]}")
+            
+            # 아마존 데이터를 네이버 형식으로 변환
+            naver_product = self.convert_amazon_to_naver_product(amazon_product)
+            
+            # 상품 등록
+            product_id = await self.register_product(naver_product)
+            latency = round(time.monotonic() - started, 3)
+            
+            if product_id:
+                return True, {
+                    "product_name": naver_product.product_name,
+                    "product_id": product_id,
+                    "price": naver_product.price,
+                    "failed_images": naver_product.failed_images,
+                    "latency": latency
+                }
+            return False, {
+                "product_name": amazon_product.get('title', ''),
+                "reason": "등록 실패",
+                "failed_images": naver_product.failed_images,
+                "latency": latency
+            }
+            
+        except Exception as e:
+            logger.error(f"개별 상품 등록 오류: {str(e)}")
+            return False, {
+                "product_name": amazon_product.get('title', ''),
+                "reason": str(e),
+                "latency": round(time.monotonic() - started, 3)
+            }
+    
     async def batch_register_products(self, amazon_products: List[Dict]) -> Dict[str, Any]:
-        """배치 상품 등록"""
+        """배치 상품 등록 (워커 풀 + 토큰 버킷 요청 제한)"""
         try:
-            if not await self.authenticate():
+            if not await self.ensure_token():
                 return {"error": "인증 실패"}
             
+            total = len(amazon_products)
             results = {
-                "total": len(amazon_products),
+                "total": total,
                 "success": 0,
                 "failed": 0,
                 "success_products": [],
                 "failed_products": []
             }
             
-            for i, amazon_product in enumerate(amazon_products):
-                try:
-                    logger.info(f"상품 등록 진행: {i+1}/{len(amazon_products)} - {amazon_product.get('title', '')[:50]}")
-                    
-                    # 아마존 데이터를 네이버 형식으로 변환
-                    naver_product = self.convert_amazon_to_naver_product(amazon_product)
-                    
-                    # 상품 등록
-                    product_id = await self.register_product(naver_product)
-                    
-                    if product_id:
-                        results["success"] += 1
-                        results["success_products"].append({
-                            "product_name": naver_product.product_name,
-                            "product_id": product_id,
-                            "price": naver_product.price
-                        })
-                    else:
-                        results["failed"] += 1
-                        results["failed_products"].append({
-                            "product_name": amazon_product.get('title', ''),
-                            "reason": "등록 실패"
-                        })
-                    
-                    # API 요청 간격
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
+            # 작업 큐에 상품 적재 후 N개 워커가 동시에 처리
+            queue = asyncio.Queue()
+            for item in enumerate(amazon_products):
+                queue.put_nowait(item)
+            
+            outcomes: List[Optional[Tuple[bool, Dict]]] = [None] * total
+            
+            async def worker():
+                while True:
+                    try:
+                        index, amazon_product = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    outcomes[index] = await self._register_one(index, amazon_product, total)
+            
+            batch_started = time.monotonic()
+            worker_count = min(self.max_concurrent_registrations, total)
+            await asyncio.gather(*(worker() for _ in range(worker_count)))
+            
+            # 입력 순서대로 결과 정리
+            latencies = []
+            for success, entry in outcomes:
+                latencies.append(entry["latency"])
+                if success:
+                    results["success"] += 1
+                    results["success_products"].append(entry)
+                else:
                     results["failed"] += 1
-                    results["failed_products"].append({
-                        "product_name": amazon_product.get('title', ''),
-                        "reason": str(e)
-                    })
-                    logger.error(f"개별 상품 등록 오류: {str(e)}")
+                    results["failed_products"].append(entry)
+            
+            results["elapsed_seconds"] = round(time.monotonic() - batch_started, 3)
+            if latencies:
+                latencies.sort()
+                results["latency"] = {
+                    "avg": round(sum(latencies) / len(latencies), 3),
+                    "p50": latencies[len(latencies) // 2],
+                    "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                    "max": latencies[-1]
+                }
             
-            logger.info(f"배치 등록 완료 - 성공: {results['success']}, 실패: {results['failed']}")
+            logger.info(f"배치 등록 완료 - 성공: {results['success']}, 실패: {results['failed']}, "
+                        f"소요: {results['elapsed_seconds']}초")
             return results
             
         except Exception as e:
@@ -394,6 +969,10 @@ class NaverSmartStoreAPI:
     
     async def close(self):
         """세션 종료"""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self.image_cache:
+            self.image_cache.close()
         if self.session:
             await self.session.close()
 
@@ -422,7 +1001,11 @@ class NaverRegistrationManager:
                     "naver_customer_id": "YOUR_CUSTOMER_ID",
                     "auto_register": False,
                     "max_daily_registrations": 100,
-                    "profit_margin_threshold": 30
+                    "profit_margin_threshold": 30,
+                    "max_concurrent_images": 8,
+                    "max_concurrent_registrations": 5,
+                    "requests_per_second": 2.0,
+                    "max_retries": 4
                 }
                 
                 with open(config_path, 'w', encoding='utf-8') as f:
@@ -442,7 +1025,16 @@ class NaverRegistrationManager:
         self.api = NaverSmartStoreAPI(
             client_id=self.config.get('naver_client_id'),
             client_secret=self.config.get('naver_client_secret'),
-            customer_id=self.config.get('naver_customer_id')
+            customer_id=self.config.get('naver_customer_id'),
+            max_concurrent_images=self.config.get('max_concurrent_images', 8),
+            max_concurrent_registrations=self.config.get('max_concurrent_registrations', 5),
+            requests_per_second=self.config.get('requests_per_second', 2.0),
+            max_retries=self.config.get('max_retries', 4),
+            token_cache_file=str(Path("C:/Users/PC8/Desktop/claude/아마존 크롤링") / "naver_token_cache.json"),
+            image_cache_file=str(Path("C:/Users/PC8/Desktop/claude/아마존 크롤링") / "naver_image_cache.db"),
+            max_image_bytes=self.config.get('max_image_bytes', 10 * 1024 * 1024),
+            translation_cache_file=str(Path("C:/Users/PC8/Desktop/claude/아마존 크롤링") / "translation_cache.db"),
+            category_rules_file=self.config.get('category_rules_file')
         )
         
         await self.api.init_session()
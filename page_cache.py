@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤러 페이지 캐시 모듈 (SQLite 기반 HTTP 응답 저장소)
+같은 키워드 목록을 다시 크롤링할 때 검색 결과/상품 페이지를 다시 받지 않도록 크롤러 앞에 둔다
+
+(URL, 로케일) 단위로 응답 본문을 압축 저장하고, max_age 안의 페이지는 바로 돌려주며,
+오래된 페이지는 ETag/Last-Modified 조건부 요청으로 재검증한다 (304면 본문 재사용).
+전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 페이지부터 지운다 (LRU).
+
+requests로 페이지를 받으므로 fetch()로 페이지를 요청하는 크롤러에서만 쓸 수 있다.
+현재 Selenium 크롤러(ImprovedAmazonCrawler)는 브라우저로 직접 페이지를 열기 때문에
+WorkflowPipeline에는 연결하지 않는다 (크롤러가 fetch()를 쓰도록 바뀌면 연결).
+
+작성일: 2025년 8월 7일
+버전: v1.0
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urldefrag
+
+# HTTP 클라이언트 (선택 패키지, fetch에만 필요)
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 파일
+DEFAULT_CACHE_PATH = "page_cache.db"
+
+# 기본 유효 시간 (초) 및 최대 저장 크기
+DEFAULT_MAX_AGE = 3600
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# 기본 로케일 (Accept-Language)
+DEFAULT_LOCALE = 'en-US'
+
+
+
+def page_cache_key(url: str, locale: str = DEFAULT_LOCALE) -> str:
+    """(로케일, 프래그먼트를 제거한 URL)의 SHA-256 키"""
+    return hashlib.sha256(f"{locale}\n{urldefrag(url.strip())[0]}".encode('utf-8')).hexdigest()
+
+
+@dataclass
+class CachedPage:
+    """캐시 또는 네트워크에서 받은 페이지"""
+    url: str
+    status: int
+    content: bytes
+    content_type: str = ''
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    source: str = 'network'  # network / cache / revalidated / stale
+
+    @property
+    def text(self) -> str:
+        """본문 문자열 (Content-Type의 charset, 없으면 UTF-8)"""
+        charset = 'utf-8'
+        for part in self.content_type.split(';')[1:]:
+            name, _, value = part.strip().partition('=')
+            if name.lower() == 'charset' and value:
+                charset = value.strip('"\'')
+        try:
+            return self.content.decode(charset, errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+
+class PageCache:
+    """URL/로케일별 페이지 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, max_age: float = DEFAULT_MAX_AGE,
+                 max_bytes: int = DEFAULT_MAX_BYTES, timeout: float = 30):
+        """캐시 DB 초기화"""
+        self.db_path = db_path
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()  # 쓰레드별 requests 세션
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                cache_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                locale TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL,
+                body BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_pages_last_used ON pages (last_used);
+        """)
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+    def get(self, url: str, locale: str = DEFAULT_LOCALE) -> Optional[CachedPage]:
+        """저장된 페이지 (유효 시간과 관계없이, 없으면 None)"""
+        key = page_cache_key(url, locale)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, status, content_type, etag, last_modified, fetched_at, body "
+                "FROM pages WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE pages SET last_used = ? WHERE cache_key = ?", (time.time(), key))
+            self.conn.commit()
+        stored_url, status, content_type, etag, last_modified, fetched_at, body = row
+        return CachedPage(stored_url, status, zlib.decompress(body), content_type or '',
+                          etag, last_modified, fetched_at, source='cache')
+
+    def put(self, page: CachedPage, locale: str = DEFAULT_LOCALE):
+        """페이지 저장 후 최대 크기를 넘으면 오래 사용하지 않은 페이지부터 삭제"""
+        key = page_cache_key(page.url, locale)
+        body = zlib.compress(page.content, 6)
+        now = time.time()
+        with self._lock:
+            previous = self.conn.execute("SELECT size FROM pages WHERE cache_key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (cache_key, url, locale, status, content_type, etag, "
+                "last_modified, fetched_at, last_used, size, body) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, page.url, locale, page.status, page.content_type, page.etag, page.last_modified,
+                 page.fetched_at or now, now, len(body), body)
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self._evict_locked()
+            self.conn.commit()
+
+    def _mark_revalidated(self, url: str, locale: str, etag: Optional[str], last_modified: Optional[str]) -> float:
+        """304 응답: 저장된 본문의 유효 시간 갱신"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "UPDATE pages SET fetched_at = ?, last_used = ?, etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE cache_key = ?",
+                (now, now, etag, last_modified, page_cache_key(url, locale))
+            )
+            self.conn.commit()
+        return now
+
+    def _evict_locked(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 페이지 삭제 (잠금 상태에서 호출)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        removed = 0
+        rows = self.conn.execute("SELECT cache_key, size FROM pages ORDER BY last_used ASC").fetchall()
+        for key, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM pages WHERE cache_key = ?", (key,))
+            self._total_bytes -= size
+            removed += 1
+        if removed:
+            logger.debug(f"페이지 캐시 정리: {removed}개 삭제 (현재 {self._total_bytes} bytes)")
+
+    def _session(self) -> 'requests.Session':
+        """현재 쓰레드의 requests 세션"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def fetch(self, url: str, locale: str = DEFAULT_LOCALE, headers: Optional[Dict[str, str]] = None) -> CachedPage:
+        """캐시를 거쳐 페이지 가져오기
+
+        max_age 안의 페이지는 캐시에서 바로 반환하고, 오래된 페이지는 조건부 요청으로 재검증한다.
+        네트워크 오류 시 저장된 페이지가 있으면 오래됐더라도 반환한다 (source='stale').
+        """
+        cached = self.get(url, locale)
+        if cached is not None and time.time() - cached.fetched_at < self.max_age:
+            self.hits += 1
+            return cached
+
+        if not REQUESTS_AVAILABLE:
+            raise ImportError("페이지를 받으려면 requests가 필요합니다: pip install requests")
+
+        request_headers = {'Accept-Language': locale}
+        request_headers.update(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                request_headers['If-Modified-Since'] = cached.last_modified
+
+        try:
+            response = self._session().get(url, headers=request_headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            if cached is None:
+                raise
+            logger.warning(f"페이지 요청 실패, 저장된 페이지 사용: {url} ({e})")
+            cached.source = 'stale'
+            return cached
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        if response.status_code == 304 and cached is not None:
+            self.revalidated += 1
+            cached.fetched_at = self._mark_revalidated(url, locale, etag, last_modified)
+            cached.etag = etag or cached.etag
+            cached.last_modified = last_modified or cached.last_modified
+            cached.source = 'revalidated'
+            return cached
+
+        self.misses += 1
+        page = CachedPage(url, response.status_code, response.content,
+                          response.headers.get('Content-Type', ''), etag, last_modified, time.time())
+        if response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', '').lower():
+            self.put(page, locale)
+        return page
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 사용 통계"""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return {
+            'hits': self.hits,
+            'revalidated': self.revalidated,
+            'misses': self.misses,
+            'entries': entries,
+            'bytes': self._total_bytes
+        }
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self.conn.close()
+
+
+_shared_caches: Dict[str, PageCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_page_cache(db_path: Optional[str] = None, max_age: float = DEFAULT_MAX_AGE,
+                   max_bytes: int = DEFAULT_MAX_BYTES) -> PageCache:
+    """경로별 공유 페이지 캐시 인스턴스 반환 (max_age/max_bytes는 호출마다 갱신)"""
+    path = os.path.abspath(db_path or DEFAULT_CACHE_PATH)
+    with _shared_lock:
+        if path not in _shared_caches:
+            _shared_caches[path] = PageCache(path, max_age, max_bytes)
+        cache = _shared_caches[path]
+        cache.max_age = max_age
+        cache.max_bytes = max_bytes
+        return cache
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상품 중복 인덱스 (ASIN/정규화 URL 기준, SQLite)
+키워드와 크롤링 실행을 넘어 같은 아마존 상품을 하나로 식별
+
+같은 상품이 여러 키워드에서 수집되면 한 번만 변환/업로드하도록 배치 내 중복을 제거하고,
+상품별 마지막 수집 시각과 내용 지문(fingerprint)을 저장하여 크롤링마다 신규/변경 상품 수를 알려준다.
+(최근 수집한 상품의 재크롤링 생략은 크롤러가 상품 목록을 걸러 받는 기능을 지원할 때 추가한다.)
+
+작성일: 2025년 8월 7일
+버전: v1.0
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+from conversion_cache import product_fingerprint
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 인덱스 파일
+DEFAULT_INDEX_PATH = "product_index.db"
+
+# ASIN 형식과 상품 URL 안의 ASIN 위치 (/dp/ASIN, /gp/product/ASIN)
+_ASIN_RE = re.compile(r'^[A-Z0-9]{10}$')
+_URL_ASIN_RE = re.compile(r'/(?:dp|gp/product|gp/aw/d)/([A-Za-z0-9]{10})(?:[/?#]|$)')
+
+
+def _field_text(product: Dict, field: str) -> str:
+    """필드 문자열 값 (None, CSV의 빈 칸(NaN)은 빈 문자열)"""
+    value = product.get(field)
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return str(value).strip()
+
+
+def canonical_product_key(product: Dict) -> Optional[str]:
+    """상품 식별 키 ('asin:...' 또는 정규화한 'url:...', 식별할 수 없으면 None)"""
+    if not isinstance(product, dict):
+        return None
+
+    asin = _field_text(product, 'asin').upper()
+    if _ASIN_RE.match(asin):
+        return f"asin:{asin}"
+
+    url = _field_text(product, 'product_url') or _field_text(product, 'url')
+    if not url:
+        return None
+
+    match = _URL_ASIN_RE.search(url)
+    if match:
+        return f"asin:{match.group(1).upper()}"
+
+    # 추적용 쿼리/프래그먼트와 /ref= 경로 제거
+    parts = urlsplit(url)
+    path = parts.path.split('/ref=')[0].rstrip('/')
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return f"url:{host}{path}"
+
+
+def drop_duplicate_products(products: Iterable[Dict], seen: Optional[Set[str]] = None) -> List[Dict]:
+    """이미 나온 상품 키의 상품을 제외 (처음 것만 유지, 키가 없는 상품은 유지)
+
+    seen을 넘기면 여러 배치에 걸쳐 중복을 판단하며, 남은 상품의 키가 seen에 추가된다.
+    상품이 아닌 항목(읽지 못한 줄의 None 등)은 그대로 유지한다.
+    """
+    seen = set() if seen is None else seen
+    kept = []
+    for product in products:
+        key = canonical_product_key(product)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(product)
+    return kept
+
+
+class ProductIndex:
+    """상품별 마지막 수집 시각/내용 지문 저장소 (스레드 안전)"""
+
+    def __init__(self, db_path: str = DEFAULT_INDEX_PATH):
+        """인덱스 DB 초기화"""
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS seen_products (
+                product_key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                keyword TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_seen_products_last_seen ON seen_products (last_seen);
+        """)
+
+    def record(self, products: Iterable[Dict]) -> Dict[str, int]:
+        """수집한 상품 기록 (신규/내용 변경/동일 상품 수 반환)"""
+        entries = {}
+        for product in products:
+            key = canonical_product_key(product)
+            if key is not None and key not in entries:
+                keyword = product.get('search_keyword') or product.get('keyword')
+                entries[key] = (product_fingerprint(product), keyword)
+
+        counts = {'new': 0, 'changed': 0, 'unchanged': 0}
+        if not entries:
+            return counts
+
+        now = time.time()
+        keys = list(entries)
+        with self._lock:
+            previous = {}
+            # SQLite 변수 개수 제한을 넘지 않도록 나누어 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT product_key, fingerprint FROM seen_products "
+                    f"WHERE product_key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                previous.update(rows)
+
+            self.conn.executemany(
+                "INSERT INTO seen_products (product_key, fingerprint, keyword, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(product_key) DO UPDATE SET "
+                "fingerprint = excluded.fingerprint, keyword = excluded.keyword, last_seen = excluded.last_seen",
+                [(key, fingerprint, keyword, now, now) for key, (fingerprint, keyword) in entries.items()]
+            )
+            self.conn.commit()
+
+        for key, (fingerprint, _keyword) in entries.items():
+            if key not in previous:
+                counts['new'] += 1
+            elif previous[key] != fingerprint:
+                counts['changed'] += 1
+            else:
+                counts['unchanged'] += 1
+        return counts
+
+    def prune(self, max_age_days: int = 90) -> int:
+        """max_age_days 동안 수집되지 않은 상품 삭제"""
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            deleted = self.conn.execute(
+                "DELETE FROM seen_products WHERE last_seen < ?", (cutoff,)
+            ).rowcount
+            self.conn.commit()
+        if deleted:
+            logger.info(f"상품 중복 인덱스 정리: {deleted}건 삭제")
+        return deleted
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self.conn.close()
+
+
+_shared_indexes: Dict[str, ProductIndex] = {}
+_shared_lock = threading.Lock()
+
+
+def get_product_index(db_path: Optional[str] = None) -> ProductIndex:
+    """경로별 공유 상품 인덱스 인스턴스 반환"""
+    path = os.path.abspath(db_path or DEFAULT_INDEX_PATH)
+    with _shared_lock:
+        if path not in _shared_indexes:
+            _shared_indexes[path] = ProductIndex(path)
+        return _shared_indexes[path]
@@ -9,14 +9,30 @@
 버전: v2.0 - 실제 업로드 형식
 """
 
+import numpy as np
 import pandas as pd
 import json
 import os
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+from category_rules import get_category_index
+from conversion_cache import get_conversion_cache, product_fingerprint
+from product_index import drop_duplicate_products
+from crawl_archive import (
+    DEFAULT_ARCHIVE_DIR, PARQUET_AVAILABLE, is_archive_path, latest_archive_run, read_crawl_archive
+)
+from keyword_matcher import KeywordMatcher
+from translation_cache import (
+    TRANSLATION_CHAR_LIMIT, get_translation_cache, join_translation_batch, normalize_text,
+    pack_translation_batches, split_translation_batch
+)
 
 # 번역 모듈 import
 try:
@@ -30,13 +46,376 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Excel 텍스트 정리 패턴 (모듈 로드 시 1회 컴파일)
+# 제거 문자: 보조 평면(이모지 등), 기호/딩뱃/화살표 블록, 변형 선택자, 상표 기호, 제어 문자
+_EXCEL_REMOVE = (r'\U00010000-\U0010ffff\u2600-\u27bf\u2b00-\u2bff\ufe00-\ufe0f'
+                 r'\u2122\u00ae\u00a9\u2120\x00-\x08\x0b\x0c\x0e-\x1f\x7f')
+# 공백 문자 중 제거 대상(\x0b, \x0c, \x1c-\x1f)이 아닌 것
+_EXCEL_SPACE = r'[^\S\x0b\x0c\x1c-\x1f]'
+# 공백이 하나라도 포함된 (공백|제거 문자) 연속 구간 -> ' ', 제거 문자만의 구간 -> ''
+_EXCEL_CLEAN_RE = re.compile(
+    rf'([{_EXCEL_REMOVE}]*{_EXCEL_SPACE}[{_EXCEL_REMOVE}\s]*)|[{_EXCEL_REMOVE}]+'
+)
+
+
+def _excel_clean_replacement(match) -> str:
+    return ' ' if match.group(1) else ''
+
+
+@lru_cache(maxsize=8192)
+def _clean_text_for_excel(text: str) -> str:
+    """clean_text_for_excel 본체 (반복되는 값은 캐시)"""
+    return _EXCEL_CLEAN_RE.sub(_excel_clean_replacement, text).strip(' ')
+
+
+_LATIN_RE = re.compile(r'[A-Za-z]')
+
+
+def _is_translated(source: str, translated: str) -> bool:
+    """번역 성공 여부 (빈 결과, 영문 원문이 그대로 돌아온 결과는 번역기 실패로 판단)
+    
+    실패한 결과는 번역 캐시/증분 변환 캐시에 저장하지 않아 다음 실행에서 다시 번역한다.
+    """
+    if not translated or not str(translated).strip():
+        return False
+    return normalize_text(str(translated)) != normalize_text(str(source)) or not _LATIN_RE.search(str(source))
+
+# 스마트스토어 업로드용 단일 행 헤더 컬럼 목록 (줄바꿈 문제 해결)
+UPLOAD_COLUMNS = [
+    '판매자상품코드', '카테고리코드', '상품명', '상품상태', '판매가', '부가세', 
+    '재고수량', '최종카테고리선택', '구매평노출여부', '상품문의노출여부', '리뷰작성가능여부',
+    '판매상태', '전시상태', '성인인증', '청소년이용불가',
+    '옵션형태', '옵션명', '옵션값', '옵션가', '옵션재고수량', 
+    '직접입력옵션', '추가상품명', '추가상품값', '추가상품가', '추가상품재고수량',
+    '대표이미지', '추가이미지', '상세설명', '브랜드', '제조사', '제조일자', 
+    '유효일자', '원산지코드', '수입사', '복수원산지여부', '원산지직접입력', '미성년자구매여부',
+    '배송비템플릿코드', '배송방법', '기본배송비', '배송비유형', '배송비결제방식', '출고지', '배송업체', '배송기간',
+    '조건부무료상품판매가합계', '수량별부과수량', '구간별2구간수량', '구간별3구간수량',
+    '구간별3구간배송비', '구간별추가배송비', '반품배송비', '교환배송비',
+    '지역별차등배송비', '별도설치비',
+    '상품정보제공고시템플릿코드', '상품정보제공고시품명', '상품정보제공고시모델명', 
+    '상품정보제공고시인증허가사항', '상품정보제공고시제조자', 
+    '상품정보제공고시제조국', '상품정보제공고시사용기한', 
+    '상품정보제공고시사용법', '상품정보제공고시주의사항',
+    'AS템플릿코드', 'AS담당자명', 'AS전화번호', 'AS안내', '판매자특이사항',
+    '즉시할인값기본할인', '즉시할인단위기본할인', '모바일즉시할인값',
+    '모바일즉시할인단위', '복수구매할인조건값', '복수구매할인조건단위',
+    '복수구매할인값', '복수구매할인단위', '상품구매시포인트지급값',
+    '상품구매시포인트지급단위', '텍스트리뷰작성시지급포인트',
+    '포토동영상리뷰작성시지급포인트', '한달사용텍스트리뷰작성시지급포인트',
+    '한달사용포토동영상리뷰작성시지급포인트', '가전효율등급',
+    '효율등급인증기관', '케어라벨인증유형', '상품정보제공고시색상',
+    '상품정보제공고시소재', '상품정보제공고시사이즈', '상품정보제공고시동백사이즈',
+    '상품정보제공고시동백노출', '상품정보제공고시수리방법',
+    '사이즈상품군', '사이즈사이즈명', '사이즈상세사이즈', '사이즈모델명'
+]
+
+# 참고용 파일 컬럼 (업로드용과 분리)
+# 업로드 DataFrame의 컬럼 이름을 그대로 사용 (A/S 전화번호 컬럼은 스마트스토어 템플릿 이름 'AS전화번호')
+REFERENCE_COLUMNS = [
+    '카테고리코드', '상품명', '판매가', '재고수량', 'AS전화번호',
+    '상품설명_참고', '아마존평점', '아마존리뷰수', '아마존USD가격', 
+    '아마존원본제목', '이미지URL', '브랜드_참고', '수집일시'
+]
+
+# JSON Lines 스트리밍 변환 시 한 번에 변환하는 상품 수
+STREAM_CHUNK_SIZE = 1000
+
+
+def iter_jsonl_products(path: str):
+    """JSON Lines 파일에서 상품을 한 줄씩 읽기 (잘못된 줄은 None으로 전달해 변환 단계에서 건너뜀)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"{line_no}번째 줄 JSON 형식 오류: {e}")
+                yield None
+
+
+# 병렬 변환 시 프로세스당 최소 상품 수 (이보다 작으면 프로세스 시작 비용이 더 큼)
+PARALLEL_MIN_CHUNK = 200
+
+# 변환 작업 프로세스의 변환기 (프로세스 풀 initializer에서 설정)
+_worker_uploader = None
+
+
+def _init_conversion_worker(uploader: 'SmartstoreUploader'):
+    """변환 작업 프로세스 초기화 (부모 프로세스의 변환기 설정을 복원)"""
+    global _worker_uploader
+    _worker_uploader = uploader
+
+
+def _convert_chunk(task: Tuple[List[Dict], int]) -> pd.DataFrame:
+    """작업 프로세스에서 상품 묶음 하나 변환 (start_index로 AMZ_ 번호 유지)"""
+    chunk, start_index = task
+    return _worker_uploader.convert_to_smartstore_upload_format(chunk, start_index=start_index)
+
+
+def _write_upload_shard(task: Tuple[pd.DataFrame, str]) -> Optional[str]:
+    """작업 프로세스에서 분할 업로드 파일 하나 (+ 참고용 파일) 저장"""
+    shard_df, output_path = task
+    return _worker_uploader.create_upload_file(shard_df, output_path)
+
+
+def shard_file_paths(output_path: str, shard_no: int) -> Tuple[str, str]:
+    """분할 파일 번호별 (업로드 파일, 참고용 파일) 경로"""
+    shard_path = output_path.replace('.xlsx', f'_part{shard_no:03d}.xlsx')
+    return shard_path, shard_path.replace('.xlsx', '_참고용.xlsx')
+
+
+def write_upload_manifest(output_path: str, shards: List[Dict]) -> str:
+    """분할 파일 목록 매니페스트(JSON) 저장"""
+    manifest_path = output_path.replace('.xlsx', '_manifest.json')
+    manifest = {
+        'created_at': datetime.now().isoformat(),
+        'total_rows': sum(shard['rows'] for shard in shards),
+        'file_count': len(shards),
+        'files': shards
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest_path
+
+# 증분 변환 캐시 형식 버전 (상품명 정리/상세설명 생성 로직이 바뀌면 올려서 캐시 무효화)
+CONVERSION_CACHE_VERSION = 1
+
+# 변환 결과 행 구조 (검증된 네이버 스마트스토어 완전 필수 필드, 단일 행 헤더 적용)
+# None 값은 상품별로 계산되는 필드이고, 나머지는 모든 행에 같은 값으로 채워지는 상수 필드
+SMARTSTORE_ROW_TEMPLATE = {
+    # 핵심 상품 정보 (0-6)
+    '판매자상품코드': None,
+    '카테고리코드': None,
+    '상품명': None,
+    '상품상태': '신상품',
+    '판매가': None,
+    '부가세': '과세상품',
+    '재고수량': 999,
+    
+    # 필수 추가 필드들
+    '최종카테고리선택': None,
+    '구매평노출여부': 'Y',
+    '상품문의노출여부': 'Y', 
+    '리뷰작성가능여부': 'Y',
+    '판매상태': '판매중',
+    '전시상태': '전시',
+    '성인인증': 'N',
+    '청소년이용불가': 'N',
+    
+    # 옵션 관련 필드 (7-16) - 옵션 없는 단순 상품으로 설정
+    '옵션형태': '단순상품',
+    '옵션명': '',
+    '옵션값': '',
+    '옵션가': '',
+    '옵션재고수량': '',
+    '직접입력옵션': '',
+    '추가상품명': '',
+    '추가상품값': '',
+    '추가상품가': '',
+    '추가상품재고수량': '',
+    
+    # 이미지 및 설명 (17-19) - 유효한 이미지 URL 설정
+    '대표이미지': '',
+    '추가이미지': '',
+    '상세설명': None,
+    
+    # 제조 및 원산지 정보 (20-28) - 정확한 원산지코드 사용
+    '브랜드': None,
+    '제조사': None,
+    '제조일자': '2024-01-01',
+    '유효일자': '2030-12-31',
+    '원산지코드': 'US',
+    '수입사': '',
+    '복수원산지여부': 'N',
+    '원산지직접입력': '미국',
+    '미성년자구매여부': 'N',
+    
+    # 배송비 템플릿코드 추가
+    '배송비템플릿코드': '1',  # 기본 배송비 템플릿
+    
+    # 배송 관련 정보 (29-45) - 정확한 배송 설정
+    '배송방법': '택배',
+    '기본배송비': 3000,
+    '배송비유형': '유료',
+    '배송비결제방식': '선결제',
+    '출고지': '서울',
+    '배송업체': 'CJ대한통운',
+    '배송기간': '1~3일',
+    '조건부무료상품판매가합계': '',
+    '수량별부과수량': '',
+    '구간별2구간수량': '',
+    '구간별3구간수량': '',
+    '구간별3구간배송비': '',
+    '구간별추가배송비': '',
+    '반품배송비': '',
+    '교환배송비': '',
+    '지역별차등배송비': '',
+    '별도설치비': '',
+    
+    # 상품정보제공고시 (46-50) - 상품정보제공고시 템플릿코드 사용  
+    '상품정보제공고시템플릿코드': '50000169',  # 에센스/세럼 템플릿
+    '상품정보제공고시품명': None,
+    '상품정보제공고시모델명': None,
+    '상품정보제공고시인증허가사항': 'FDA 승인 시설에서 제조',
+    '상품정보제공고시제조자': None,
+    '상품정보제공고시제조국': '미국',
+    '상품정보제공고시사용기한': '제품 표기 참조',
+    '상품정보제공고시사용법': '제품 설명서 참조',
+    '상품정보제공고시주의사항': '사용 전 패치테스트 권장',
+    
+    # A/S 관련 (51-54) - A/S 템플릿코드 사용
+    'AS템플릿코드': '1',  # 기본 A/S 템플릿
+    'AS담당자명': '고객센터',
+    'AS전화번호': '010-2291-4080',
+    'AS안내': 'A/S 관련 문의는 판매자에게 연락바랍니다. 해외 직구 상품으로 A/S는 제한적입니다.',
+    '판매자특이사항': '해외 직구 상품입니다',
+    
+    # 할인 및 포인트 관련 (55-68) - 모든 필드 비워두기 (사용 안함)
+    '즉시할인값기본할인': '',
+    '즉시할인단위기본할인': '',
+    '모바일즉시할인값': '',
+    '모바일즉시할인단위': '',
+    '복수구매할인조건값': '',
+    '복수구매할인조건단위': '',
+    '복수구매할인값': '',
+    '복수구매할인단위': '',
+    '상품구매시포인트지급값': '',
+    '상품구매시포인트지급단위': '',
+    '텍스트리뷰작성시지급포인트': '',
+    '포토동영상리뷰작성시지급포인트': '',
+    '한달사용텍스트리뷰작성시지급포인트': '',
+    '한달사용포토동영상리뷰작성시지급포인트': '',
+    
+    # 기타 인증 및 상품정보 (69-88) - 화장품 관련 필수 정보
+    '가전효율등급': '',
+    '효율등급인증기관': '',
+    '케어라벨인증유형': '',
+    '상품정보제공고시색상': '제품 참조',
+    '상품정보제공고시소재': '화장품',
+    '상품정보제공고시사이즈': '제품 상세 참조',
+    '상품정보제공고시동백사이즈': '',
+    '상품정보제공고시동백노출': '',
+    '상품정보제공고시수리방법': '',
+    '사이즈상품군': '일반',
+    '사이즈사이즈명': 'FREE',
+    '사이즈상세사이즈': '제품 상세 참조',
+    '사이즈모델명': None,
+    
+    # 참고용 데이터 (업로드에는 포함되지 않음)
+    '상품설명_참고': None,
+    '아마존평점': None,
+    '아마존리뷰수': None,
+    '아마존USD가격': None,
+    '아마존원본제목': None,
+    '이미지URL': None,
+    '브랜드_참고': None,
+    '수집일시': None
+}
+
+
+class StreamingUploadWriter:
+    """openpyxl write-only 모드 업로드 시트 작성기
+    
+    행을 바로 파일 스트림에 기록하므로 Cell 객체가 메모리에 쌓이지 않는다.
+    헤더 서식과 컬럼 너비는 일반 Workbook 경로와 동일하다.
+    """
+    
+    def __init__(self, output_path: str, columns: List[str], clean_func=None, sheet_title: str = '일괄등록'):
+        """Workbook 생성 및 서식 있는 단일 행 헤더 기록"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, Alignment, PatternFill
+        from openpyxl.utils import get_column_letter
+        
+        self.output_path = output_path
+        self.columns = columns
+        self.clean_func = clean_func
+        self.rows_written = 0
+        
+        self.wb = Workbook(write_only=True)
+        self.ws = self.wb.create_sheet(sheet_title)
+        
+        # 컬럼 너비 (write-only 모드에서는 행 기록 전에 설정)
+        for col_idx, header in enumerate(columns, 1):
+            max_len = max(len(str(header)), 15)  # 최소 15자
+            self.ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 2, 50)
+        
+        # 헤더 스타일 설정 (네이버 스마트스토어 표준 형식)
+        header_font = Font(name='맑은 고딕', size=10, bold=True)
+        header_fill = PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid')
+        center_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        
+        header_cells = []
+        for header in columns:
+            cell = WriteOnlyCell(self.ws, value=header.replace('\r\n', '').replace('\n', ''))
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = center_alignment
+            header_cells.append(cell)
+        self.ws.append(header_cells)
+    
+    def write_rows(self, rows):
+        """값 튜플들을 순서대로 기록 (문자열은 정리 함수 적용)"""
+        clean = self.clean_func
+        for row in rows:
+            if clean:
+                row = [clean(value) if isinstance(value, str) else value for value in row]
+            self.ws.append(row)
+            self.rows_written += 1
+    
+    def write_dataframe(self, df: pd.DataFrame):
+        """DataFrame 행 기록 (컬럼 순서는 생성 시 지정한 순서)"""
+        self.write_rows(df[self.columns].itertuples(index=False, name=None))
+    
+    def close(self):
+        """파일 저장"""
+        self.wb.save(self.output_path)
+    
+    def discard(self):
+        """저장하지 않고 닫기 (write-only 시트가 쓰던 임시 파일 삭제)"""
+        writer = self.ws._writer
+        try:
+            if not self.ws.closed:
+                self.ws.close()
+        except Exception as e:
+            logger.debug(f"작성 중인 시트 닫기 실패: {e}")
+        if writer is not None and isinstance(writer.out, str) and os.path.exists(writer.out):
+            os.remove(writer.out)
+
+
 class SmartstoreUploader:
     """네이버 스마트스토어 실제 업로드 형식 변환기"""
     
-    def __init__(self, enable_translation=True):
+    # Parquet 크롤링 아카이브에서 읽을 컬럼 (변환/중복 제거에 사용하는 필드)
+    # 하위 클래스는 직접 선언한 경우에만 컬럼을 골라 읽고, 선언하지 않으면 전체 컬럼을 읽는다
+    ARCHIVE_COLUMNS = [
+        'title', 'price_usd', 'description', 'features', 'category', 'image_url',
+        'rating', 'review_count', 'crawl_timestamp', 'asin', 'product_url', 'url'
+    ]
+    
+    def __init__(self, enable_translation=True, translation_cache_file: str = None,
+                 translation_workers: int = 1, streaming_export: bool = True,
+                 category_rules_file: str = None, incremental: bool = False,
+                 conversion_cache_file: str = None, conversion_workers: int = 1,
+                 rows_per_file: int = None, drop_duplicates: bool = True):
         """변환기 초기화"""
         self.usd_to_krw = 1350  # 환율
         self.markup_percentage = 50  # 기본 마진율 50%
+        self.translation_workers = max(1, translation_workers)  # 동시 번역 요청 수 (1 = 순차)
+        self.streaming_export = streaming_export  # write-only 모드 Excel 기록
+        self.incremental = incremental  # 변경되지 않은 상품은 이전 변환 결과 재사용
+        self.conversion_cache_file = conversion_cache_file
+        self.conversion_cache = None
+        self.archive_run_id = None  # 아카이브 폴더 입력 시 특정 크롤링 실행만 변환
+        self.conversion_workers = max(1, conversion_workers)  # 변환 프로세스 수 (1 = 단일 프로세스)
+        self.rows_per_file = rows_per_file  # 업로드 파일당 최대 상품 수 (None = 파일 하나)
+        self.last_manifest_path = None  # 마지막 분할 저장의 매니페스트 경로
+        self.drop_duplicates = drop_duplicates  # 같은 ASIN/정규화 URL 상품은 처음 것만 변환
+        self.translation_cache_file = translation_cache_file
+        self.category_rules_file = category_rules_file
         
         # 번역기 초기화
         self.enable_translation = enable_translation and TRANSLATION_AVAILABLE
@@ -50,87 +429,132 @@ class SmartstoreUploader:
         else:
             self.translator = None
         
-        # 네이버 스마트스토어 실제 카테고리 코드 (2025년 기준)
-        self.category_codes = {
-            # 뷰티/화장품 카테고리
-            'serum': '50000169',             # 스킨케어 > 에센스/세럼
-            'cream': '50000167',             # 스킨케어 > 크림
-            'skincare': '50000166',          # 스킨케어 
-            'beauty': '50000166',            # 스킨케어
-            'cosmetics': '50000166',         # 스킨케어
-            'hyaluronic': '50000169',        # 히알루론산 = 에센스/세럼
-            'retinol': '50000167',           # 레티놀 = 크림
-            'vitamin_c': '50000169',         # 비타민C = 에센스/세럼
-            
-            # 건강기능식품
-            'protein': '50006674',           # 건강기능식품
-            'vitamin': '50006674',           # 건강기능식품 
-            'supplement': '50006674',        # 건강기능식품
-            
-            # 기타 카테고리
-            'baby': '50002436',              # 베이비/출산용품
-            'pet': '50002439',               # 반려동물용품
-            'home': '50000131',              # 생활용품
-            'kitchen': '50000156',           # 주방용품
-            'tech': '50000128',              # 전자제품
-            'fashion': '50000001',           # 패션의류
-            'office': '50000145'             # 문구/오피스
-        }
+        # 번역 캐시 (NaverSmartStoreAPI와 공유하는 번역 메모리)
+        self.translation_cache = None
+        if self.enable_translation:
+            try:
+                self.translation_cache = get_translation_cache(translation_cache_file)
+            except Exception as e:
+                logger.warning(f"번역 캐시 초기화 실패, 캐시 없이 진행: {e}")
         
-        # 뷰티/스킨케어를 기본값으로 변경 (현재 상품들이 뷰티 제품)
-        self.default_category_code = '50000169'  # 에센스/세럼
-        
-        # 네이버 스마트스토어 세부 카테고리 매핑 (최종 카테고리까지)
-        self.detailed_category_mapping = {
-            '50000169': {  # 에센스/세럼
-                'category_path': '뷰티 > 스킨케어 > 에센스/세럼',
-                'category_id': '50000169',
-                'leaf_category_id': '50000169'
-            },
-            '50000167': {  # 크림
-                'category_path': '뷰티 > 스킨케어 > 크림',
-                'category_id': '50000167', 
-                'leaf_category_id': '50000167'
-            },
-            '50006674': {  # 건강기능식품
-                'category_path': '건강 > 건강기능식품 > 비타민/미네랄',
-                'category_id': '50006674',
-                'leaf_category_id': '50006674'
-            }
-        }
+        # 카테고리 규칙 (category_rules.json, NaverSmartStoreAPI와 공유하는 인덱스)
+        self.category_index = get_category_index(category_rules_file)
+        
+        # 인스턴스별 규칙 재정의 (None이면 공유 인덱스 사용)
+        self._category_codes = None
+        self._default_category_code = None
+        self._detailed_category_mapping = None
+        self._category_matcher = None
+        self._category_matcher_source = None
+    
+    @property
+    def category_codes(self) -> Dict[str, str]:
+        """키워드 -> 네이버 카테고리 코드 규칙"""
+        if self._category_codes is not None:
+            return self._category_codes
+        return self.category_index.keyword_rules
+    
+    @category_codes.setter
+    def category_codes(self, value: Dict[str, str]):
+        self._category_codes = value
+    
+    @property
+    def default_category_code(self) -> str:
+        """매칭되는 규칙이 없을 때의 카테고리 코드"""
+        if self._default_category_code is not None:
+            return self._default_category_code
+        return self.category_index.default_category_code
+    
+    @default_category_code.setter
+    def default_category_code(self, value: str):
+        self._default_category_code = value
+    
+    @property
+    def detailed_category_mapping(self) -> Dict[str, Dict[str, str]]:
+        """네이버 스마트스토어 세부 카테고리 매핑 (최종 카테고리까지)"""
+        if self._detailed_category_mapping is not None:
+            return self._detailed_category_mapping
+        return self.category_index.categories
+    
+    @detailed_category_mapping.setter
+    def detailed_category_mapping(self, value: Dict[str, Dict[str, str]]):
+        self._detailed_category_mapping = value
+    
+    def __getstate__(self):
+        """프로세스 풀 전달용 상태 (번역기, DB 연결 등 프로세스별 자원 제외)"""
+        state = self.__dict__.copy()
+        for key in ('translator', 'translation_cache', 'conversion_cache', 'category_index',
+                    '_category_matcher', '_category_matcher_source'):
+            state[key] = None
+        return state
+    
+    def __setstate__(self, state):
+        """작업 프로세스에서 번역기/캐시/카테고리 인덱스 다시 연결"""
+        self.__dict__.update(state)
+        if self.enable_translation:
+            try:
+                self.translator = ProductTranslator()
+                self.translation_cache = get_translation_cache(self.translation_cache_file)
+            except Exception as e:
+                logger.warning(f"작업 프로세스 번역기 초기화 실패: {e}")
+                self.enable_translation = False
+        self.category_index = get_category_index(self.category_rules_file)
     
     def clean_text_for_excel(self, text: str) -> str:
-        """Excel 파일용 텍스트 정리 (이모지 및 특수문자 제거)"""
+        """Excel 파일용 텍스트 정리 (이모지 및 특수문자 제거)
+        
+        이모지/기호/제어 문자 제거와 다중 공백 정리를 미리 컴파일한 패턴 하나로 처리한다.
+        """
         if not text:
             return ""
         
-        # 유니코드 이모지 제거
-        text = re.sub(r'[\U00010000-\U0010ffff]', '', text)
+        return _clean_text_for_excel(text)
+    
+    def _translate_cached(self, text: str, translate_func, kind: str) -> Tuple[str, bool]:
+        """번역 캐시를 거쳐 번역 (캐시 미적중 시에만 번역기 호출, kind: 번역 종류)
+        
+        Returns:
+            (번역 결과, 번역 성공 여부) - 실패한 결과는 캐시에 저장하지 않는다
+        """
+        if not self.translation_cache:
+            translated = translate_func(text)
+            return translated, _is_translated(text, translated)
         
-        # 다양한 이모지 패턴 제거
-        emoji_pattern = re.compile("["
-                                 u"\U0001F600-\U0001F64F"  # emoticons
-                                 u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                                 u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                                 u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                                 u"\U00002700-\U000027BF"  # Dingbats
-                                 u"\U0000FE00-\U0000FE0F"  # Variation Selectors
-                                 u"\U00002600-\U000026FF"  # Miscellaneous Symbols
-                                 u"\U00002B00-\U00002BFF"  # Miscellaneous Symbols and Arrows
-                                 "]+", flags=re.UNICODE)
-        text = emoji_pattern.sub('', text)
+        cached = self.translation_cache.get(text, kind)
+        if cached is not None:
+            return cached, True
         
-        # 기타 문제가 될 수 있는 문자들 제거
-        text = re.sub(r'[™®©℠]', '', text)
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)  # 제어 문자 제거
+        translated = translate_func(text)
+        success = _is_translated(text, translated)
+        if success:
+            self.translation_cache.set(text, translated, kind)
+        return translated, success
+    
+    def _translate_features_cached(self, features: List[str]) -> Tuple[List[str], bool]:
+        """특징 목록 번역 (캐시에 없는 항목만 한 번에 번역기 호출)
         
-        # 다중 공백 정리
-        text = re.sub(r'\s+', ' ', text).strip()
+        Returns:
+            (번역 결과 목록, 모든 항목 번역 성공 여부)
+        """
+        if not self.translation_cache:
+            translated = self.translator.translate_product_features(features)
+            return translated, all(_is_translated(src, dst) for src, dst in zip(features, translated))
         
-        return text
+        results = [self.translation_cache.get(feature, 'features') for feature in features]
+        missing = [idx for idx, cached in enumerate(results) if cached is None]
+        success = True
+        if missing:
+            translated = self.translator.translate_product_features([features[idx] for idx in missing])
+            for idx, text in zip(missing, translated):
+                results[idx] = text
+                if _is_translated(features[idx], text):
+                    self.translation_cache.set(features[idx], text, 'features')
+                else:
+                    success = False
+        return results, success
     
-    def clean_and_translate_title(self, title: str) -> Dict[str, str]:
-        """상품명 정리 및 번역"""
+    def _split_title(self, title: str):
+        """상품명 특수문자 정리 후 (정리된 제목, 브랜드, 상품명) 분리"""
         # 특수문자 정리
         cleaned_title = re.sub(r'[™®©]', '', title)
         cleaned_title = re.sub(r'\s+', ' ', cleaned_title).strip()
@@ -146,10 +570,124 @@ class SmartstoreUploader:
                 brand = potential_brand
                 product_name = ' '.join(words[1:])
         
+        return cleaned_title, brand, product_name
+    
+    def _translate_packed(self, batch: List[str], translate_func, kind: str):
+        """묶음 하나 번역 - (번역 결과 목록 또는 None, 호출 횟수) 반환
+        
+        상품명/설명은 문장마다 번호를 붙여 한 요청으로 번역하고, 번호가 문장 순서대로 모두
+        돌아오지 않으면 (문장이 합쳐지거나 나뉜 경우) 해당 묶음만 문장별로 다시 번역한다.
+        특징(features)은 상품별 변환과 같은 translate_product_features로 목록째 번역한다.
+        """
+        calls = 1
+        try:
+            if kind == 'features':
+                translated = translate_func(batch)
+                if len(translated) != len(batch):
+                    logger.debug(f"특징 번역 결과 개수 불일치 ({len(translated)}/{len(batch)}), 캐시 생략")
+                    return None, calls
+                return translated, calls
+            
+            if len(batch) == 1:
+                return [translate_func(batch[0])], calls
+            
+            translated = split_translation_batch(translate_func(join_translation_batch(batch)), len(batch))
+            if translated is None:
+                logger.debug(f"일괄 번역 결과 문장 대응 불일치 ({len(batch)}개), 문장별 번역")
+                translated = []
+                for text in batch:
+                    calls += 1
+                    translated.append(translate_func(text))
+            return translated, calls
+        except Exception as e:
+            logger.warning(f"일괄 번역 실패, 개별 번역으로 진행: {e}")
+            return None, calls
+    
+    def _translate_jobs(self, jobs) -> int:
+        """(묶음, 번역 함수, 번역 종류) 작업들을 번역해 캐시에 저장 (호출 횟수 반환)
+        
+        translation_workers > 1이면 스레드 풀에서 여러 묶음을 동시에 번역한다.
+        결과 저장은 입력 순서대로 호출 스레드에서 수행한다.
+        """
+        if self.translation_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=self.translation_workers) as executor:
+                outcomes = list(executor.map(lambda job: self._translate_packed(*job), jobs))
+        else:
+            outcomes = [self._translate_packed(*job) for job in jobs]
+        
+        calls = 0
+        for (batch, _, kind), (translated, job_calls) in zip(jobs, outcomes):
+            calls += job_calls
+            if translated:
+                for text, result in zip(batch, translated):
+                    if _is_translated(text, result):
+                        self.translation_cache.set(text, result.strip(), kind)
+        return calls
+    
+    def prefetch_translations(self, amazon_data: List[Dict]):
+        """변환 전 일괄 번역 단계
+        
+        전체 입력의 미번역 상품명/설명/특징을 모아 5000자 단위 요청으로 번역해
+        번역 캐시에 채워 둔다. 이후 상품별 변환은 캐시에서 결과를 가져간다.
+        """
+        if not (self.enable_translation and self.translator and self.translation_cache):
+            return
+        
+        titles, descriptions, features = {}, {}, {}
+        for product in amazon_data:
+            if not isinstance(product, dict) or not product.get('title') or not product.get('price_usd'):
+                continue
+            try:
+                _, _, product_name = self._split_title(product['title'])
+                titles.setdefault(normalize_text(product_name), None)
+                
+                original_desc = product.get('description', '') or product.get('features', '')
+                if isinstance(original_desc, list):
+                    for feature in original_desc[:3]:
+                        features.setdefault(normalize_text(feature), None)
+                elif original_desc:
+                    descriptions.setdefault(normalize_text(original_desc), None)
+            except Exception:
+                # 형식이 잘못된 상품은 상품별 변환 단계에서 처리
+                continue
+        
+        # 상품별 변환 단계와 같은 번역 함수/번역 종류로 캐시를 채운다
+        groups = (
+            ('title', titles, self.translator.translate_product_title),
+            ('description', descriptions, self.translator.translate_product_description),
+            ('features', features, self.translator.translate_product_features),
+        )
+        pending = [(kind, [t for t in texts if t and not self.translation_cache.contains(t, kind)], translate_func)
+                   for kind, texts, translate_func in groups]
+        total = sum(len(texts) for _, texts, _ in pending)
+        if not total:
+            return
+        
+        # 글자 수 제한 묶음 + 제한을 넘는 긴 문장은 단독 작업
+        jobs = []
+        for kind, texts, translate_func in pending:
+            jobs.extend((batch, translate_func, kind) for batch in pack_translation_batches(texts))
+            jobs.extend(([text], translate_func, kind) for text in texts if len(text) > TRANSLATION_CHAR_LIMIT)
+        
+        calls = self._translate_jobs(jobs)
+        logger.info(f"일괄 번역 완료: {total}개 문장, "
+                    f"번역 호출 {calls}회 (동시 {self.translation_workers}개)")
+    
+    def clean_and_translate_title(self, title: str) -> Dict[str, str]:
+        """상품명 정리 및 번역"""
+        return self._clean_and_translate_title(title)[0]
+    
+    def _clean_and_translate_title(self, title: str) -> Tuple[Dict[str, str], bool]:
+        """상품명 정리 및 번역 - (결과, 번역 성공 여부 (번역하지 않는 설정이면 True)) 반환"""
+        cleaned_title, brand, product_name = self._split_title(title)
+        translated = True
+        
         # 번역 적용
         if self.enable_translation and self.translator:
             try:
-                korean_product_name = self.translator.translate_product_title(product_name)
+                korean_product_name, translated = self._translate_cached(
+                    product_name, self.translator.translate_product_title, 'title'
+                )
                 if brand:
                     final_title = f"{brand} {korean_product_name}"
                 else:
@@ -164,9 +702,10 @@ class SmartstoreUploader:
                     'product_name': korean_product_name,
                     'final_title': final_title,
                     'original_title': cleaned_title
-                }
+                }, translated
             except Exception as e:
                 logger.warning(f"제목 번역 실패: {e}")
+                translated = False
         
         # 번역 실패 시 원본 사용
         if len(product_name) > 100:
@@ -177,7 +716,7 @@ class SmartstoreUploader:
             'product_name': product_name,
             'final_title': cleaned_title,
             'original_title': cleaned_title
-        }
+        }, translated
     
     def calculate_korean_price(self, usd_price: str, margin_rate: int = None) -> int:
         """검증된 한국 판매가격 계산 (쿠팡 변환기 로직 적용)"""
@@ -206,34 +745,148 @@ class SmartstoreUploader:
             logger.error(f"가격 계산 오류: {e}")
             return 0
     
+    def _parse_usd_prices(self, usd_prices: List) -> np.ndarray:
+        """원본 가격 값들을 float 배열로 변환 (해석할 수 없는 값은 NaN)"""
+        parsed = np.full(len(usd_prices), np.nan)
+        for idx, value in enumerate(usd_prices):
+            try:
+                parsed[idx] = float(str(value).replace('$', '').replace(',', ''))
+            except (ValueError, TypeError):
+                pass
+        return parsed
+    
+    def _korean_prices_from_usd(self, parsed: np.ndarray) -> np.ma.MaskedArray:
+        """float 달러 가격 배열에 calculate_korean_price 로직을 한 번에 적용"""
+        with np.errstate(invalid='ignore', over='ignore'):
+            # 환율 및 1.6배 적용 후 800원 단위 반올림, 최소 가격 보장 (1000원)
+            adjusted = parsed * self.usd_to_krw * 1.6
+            rounded = np.where(np.mod(adjusted, 100) != 0, np.round(adjusted / 800) * 800, adjusted)
+            final = np.where(parsed > 0, np.maximum(rounded, 1000), 0)
+            # 2**53 이상은 float64 곱셈 결과가 스칼라 함수의 정수 연산(round() * 800)과 달라질 수 있음
+            invalid = np.isnan(parsed) | ~np.isfinite(final) | (final >= 2 ** 53)
+        
+        return np.ma.MaskedArray(np.where(invalid, 0, final).astype(np.int64), mask=invalid)
+    
+    def calculate_korean_prices(self, usd_prices: List) -> np.ma.MaskedArray:
+        """한국 판매가격 일괄 계산 (calculate_korean_price의 벡터화 버전)
+        
+        price_usd 열 전체를 받아 int64 판매가 배열을 반환한다. 해석할 수 없는 값,
+        환산 결과가 무한대이거나 float64로 정확히 나타낼 수 없는 값(2**53 이상)은 마스킹되며,
+        마스킹되지 않은 값은 calculate_korean_price 결과와 동일하다.
+        """
+        return self._korean_prices_from_usd(self._parse_usd_prices(usd_prices))
+    
+    def _get_category_matcher(self) -> Optional[KeywordMatcher]:
+        """인스턴스별 규칙 재정의용 분류기 (재정의가 없으면 None → 공유 인덱스 분류기 사용)
+        
+        category_codes를 직접 수정한 경우에는 refresh_category_matcher()를 호출한다.
+        """
+        if self._category_codes is None and self._default_category_code is None:
+            return None
+        
+        matcher = self._category_matcher
+        if (matcher is None or self._category_matcher_source is not self.category_codes
+                or matcher.default_code != self.default_category_code):
+            self._category_matcher = self.category_index.build_matcher(self.category_codes, self.default_category_code)
+            self._category_matcher_source = self.category_codes
+        return self._category_matcher
+    
+    def refresh_category_matcher(self):
+        """카테고리 규칙 변경 후 분류기 재생성"""
+        self._category_matcher = None
+    
     def get_category_code(self, product_title: str, category: str = '') -> str:
-        """상품명과 카테고리를 기반으로 올바른 카테고리 코드 반환"""
-        title_lower = product_title.lower() if product_title else ""
-        category_lower = category.lower() if category else ""
-        
-        # 상품명 기반 키워드 매칭 (우선순위)
-        if any(word in title_lower for word in ['serum', '세럼', 'essence', '에센스']):
-            return '50000169'  # 에센스/세럼
-        elif any(word in title_lower for word in ['cream', '크림', 'moisturizer', '모이스처']):
-            return '50000167'  # 크림
-        elif any(word in title_lower for word in ['retinol', '레티놀']):
-            return '50000167'  # 레티놀 크림
-        elif any(word in title_lower for word in ['hyaluronic', '히알루론산']):
-            return '50000169'  # 히알루론산 세럼
-        elif any(word in title_lower for word in ['vitamin c', '비타민c', 'vitamin-c']):
-            return '50000169'  # 비타민C 세럼
-        
-        # 카테고리 기반 키워드 매칭 (보조)
-        for keyword, code in self.category_codes.items():
-            if keyword in title_lower or keyword in category_lower:
-                return code
-        
-        return self.default_category_code
-    
-    def convert_to_smartstore_upload_format(self, amazon_data: List[Dict]) -> pd.DataFrame:
-        """아마존 데이터를 스마트스토어 실제 업로드 형식으로 변환 (검증된 89개 필드)"""
-        converted_products = []
+        """상품명과 카테고리를 기반으로 올바른 카테고리 코드 반환
+        
+        공유 카테고리 인덱스로 분류한다: 상품명 규칙 > 키워드 규칙(category_codes,
+        상품명 또는 카테고리) > 기본 카테고리.
+        """
+        return self.category_index.lookup(product_title, category, self._get_category_matcher())
+    
+    def get_category_codes(self, product_titles: List[str], categories: Optional[List[str]] = None) -> List[str]:
+        """상품명/카테고리 열 전체의 카테고리 코드 일괄 반환 (중복 값은 한 번만 계산)"""
+        return self.category_index.lookup_many(product_titles, categories, self._get_category_matcher())
+    
+    def _build_description(self, product: Dict, final_title: str) -> Tuple[str, bool]:
+        """상품 설명 번역 및 보완 - (설명, 번역 성공 여부 (번역할 내용이 없으면 True)) 반환"""
+        description = ""
+        translated = True
+        if self.enable_translation and self.translator:
+            try:
+                original_desc = product.get('description', '') or product.get('features', '')
+                if original_desc:
+                    if isinstance(original_desc, list):
+                        translated_features, translated = self._translate_features_cached(original_desc[:3])
+                        description = " / ".join(translated_features)
+                    else:
+                        description, translated = self._translate_cached(
+                            original_desc, self.translator.translate_product_description, 'description'
+                        )
+                        
+                # 설명이 없거나 짧을 경우 기본 설명 추가
+                if not description or len(description.strip()) < 50:
+                    # 상품명 기반 기본 설명 생성 (이모지 제거)
+                    product_name = final_title
+                    if 'serum' in product_name.lower() or '세럼' in product_name:
+                        description = f"{product_name}\\n\\n* 프리미엄 스킨케어 세럼\\n* 피부에 깊은 영양과 수분 공급\\n* 건강하고 윤기있는 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
+                    elif 'cream' in product_name.lower() or '크림' in product_name:
+                        description = f"{product_name}\\n\\n* 프리미엄 스킨케어 크림\\n* 피부에 깊은 보습과 영양 공급\\n* 부드럽고 촉촉한 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
+                    else:
+                        description = f"{product_name}\\n\\n* 프리미엄 뷰티 제품\\n* 피부 건강을 위한 전문 케어\\n* 아름답고 건강한 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
+                        
+                # 길이 제한 (32700자 - Excel 제한)
+                if len(description) > 32700:
+                    description = description[:32697] + "..."
+            except Exception as e:
+                logger.warning(f"설명 번역 실패: {e}")
+                translated = False
+                # 번역 실패 시에도 기본 설명 제공 (이모지 제거)
+                product_name = final_title
+                description = f"{product_name}\\n\\n* 프리미엄 뷰티 제품\\n* 피부 건강을 위한 전문 케어\\n* 아름답고 건강한 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
+                
+        return description, translated
+    
+    def _conversion_signature(self) -> str:
+        """증분 변환 캐시 키에 포함되는 변환 설정"""
+        return f"v{CONVERSION_CACHE_VERSION}|translation={bool(self.enable_translation and self.translator)}"
+    
+    def _lookup_converted_products(self, amazon_data: List[Dict],
+                                   start_index: int = 1) -> Tuple[Dict[int, str], Dict[int, Dict]]:
+        """증분 변환: 상품별 지문 계산 후 이전 변환 결과 조회
+        
+        Returns:
+            (상품 번호별 지문, 상품 번호별 저장된 변환 결과)
+        """
+        if not self.incremental:
+            return {}, {}
         
+        try:
+            if self.conversion_cache is None:
+                self.conversion_cache = get_conversion_cache(self.conversion_cache_file)
+            
+            signature = self._conversion_signature()
+            fingerprints = {
+                i: product_fingerprint(product, signature)
+                for i, product in enumerate(amazon_data, start_index) if isinstance(product, dict)
+            }
+            stored = self.conversion_cache.get_many(fingerprints.values())
+        except Exception as e:
+            logger.warning(f"증분 변환 캐시 조회 실패, 전체 변환으로 진행: {e}")
+            return {}, {}
+        
+        cached = {i: stored[fp] for i, fp in fingerprints.items() if fp in stored}
+        logger.info(f"증분 변환: 이전 결과 재사용 {len(cached)}개, 신규/변경 {len(fingerprints) - len(cached)}개")
+        return fingerprints, cached
+    
+    def convert_to_smartstore_upload_format(self, amazon_data: List[Dict], start_index: int = 1) -> pd.DataFrame:
+        """아마존 데이터를 스마트스토어 실제 업로드 형식으로 변환 (검증된 89개 필드)
+        
+        열 단위 변환: 상품명 정리/번역, 설명, 카테고리처럼 상품마다 계산해야 하는 필드만
+        행 단위로 처리하고, 가격/코드/모델명 등은 열 전체를 한 번에 계산하며
+        상수 필드는 모든 행에 브로드캐스트한다.
+        
+        start_index는 첫 상품의 번호이다 (나누어 변환할 때 AMZ_ 코드가 이어지도록).
+        """
         # 입력 데이터 검증
         if not amazon_data:
             logger.error("변환할 아마존 데이터가 없습니다.")
@@ -241,222 +894,141 @@ class SmartstoreUploader:
         
         logger.info(f"변환 시작: {len(amazon_data)}개 상품")
         
-        for i, product in enumerate(amazon_data, 1):
+        # 증분 변환: 변경되지 않은 상품의 이전 결과 조회
+        fingerprints, cached_products = self._lookup_converted_products(amazon_data, start_index)
+        new_entries = []
+        
+        # 일괄 번역 단계 (상품별 변환 전에 번역 캐시 채우기, 재사용 상품 제외)
+        self.prefetch_translations([
+            product for i, product in enumerate(amazon_data, start_index) if i not in cached_products
+        ])
+        
+        # 1단계: 행 검증 및 행 단위 필드 (상품명 정리/번역, 설명, 카테고리)
+        positions, products, title_infos, descriptions, category_codes = [], [], [], [], []
+        required_fields = ['title', 'price_usd']
+        for i, product in enumerate(amazon_data, start_index):
+            # 기본 데이터 검증
+            if not isinstance(product, dict):
+                logger.warning(f"상품 {i}: 올바르지 않은 데이터 형식, 건너뜀")
+                continue
+            
+            # 필수 필드 확인
+            missing_fields = [field for field in required_fields if not product.get(field)]
+            if missing_fields:
+                logger.warning(f"상품 {i}: 필수 필드 누락 ({missing_fields}), 건너뜀")
+                continue
+            
             try:
-                # 기본 데이터 검증
-                if not isinstance(product, dict):
-                    logger.warning(f"상품 {i}: 올바르지 않은 데이터 형식, 건너뜀")
-                    continue
-                
-                # 필수 필드 확인
-                required_fields = ['title', 'price_usd']
-                missing_fields = [field for field in required_fields if not product.get(field)]
-                if missing_fields:
-                    logger.warning(f"상품 {i}: 필수 필드 누락 ({missing_fields}), 건너뜀")
-                    continue
-                title_info = self.clean_and_translate_title(product.get('title', ''))
-                sale_price = self.calculate_korean_price(product.get('price_usd', 0))
+                cached = cached_products.get(i)
+                if cached:
+                    title_info, description = cached['title_info'], cached['description']
+                else:
+                    title_info, title_translated = self._clean_and_translate_title(product.get('title', ''))
+                    description, description_translated = self._build_description(product, title_info['final_title'])
+                    # 번역에 실패한 상품(영문/기본 문구로 대체)은 다음 실행에서 다시 번역하도록 저장하지 않음
+                    if i in fingerprints and title_translated and description_translated:
+                        new_entries.append((fingerprints[i], {'title_info': title_info, 'description': description}))
                 category_code = self.get_category_code(title_info['final_title'], product.get('category', ''))
-                
-                # 상품 설명 번역 및 보완
-                description = ""
-                if self.enable_translation and self.translator:
-                    try:
-                        original_desc = product.get('description', '') or product.get('features', '')
-                        if original_desc:
-                            if isinstance(original_desc, list):
-                                translated_features = self.translator.translate_product_features(original_desc[:3])
-                                description = " / ".join(translated_features)
-                            else:
-                                description = self.translator.translate_product_description(original_desc)
-                        
-                        # 설명이 없거나 짧을 경우 기본 설명 추가
-                        if not description or len(description.strip()) < 50:
-                            # 상품명 기반 기본 설명 생성 (이모지 제거)
-                            product_name = title_info['final_title']
-                            if 'serum' in product_name.lower() or '세럼' in product_name:
-                                description = f"{product_name}\\n\\n* 프리미엄 스킨케어 세럼\\n* 피부에 깊은 영양과 수분 공급\\n* 건강하고 윤기있는 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
-                            elif 'cream' in product_name.lower() or '크림' in product_name:
-                                description = f"{product_name}\\n\\n* 프리미엄 스킨케어 크림\\n* 피부에 깊은 보습과 영양 공급\\n* 부드럽고 촉촉한 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
-                            else:
-                                description = f"{product_name}\\n\\n* 프리미엄 뷰티 제품\\n* 피부 건강을 위한 전문 케어\\n* 아름답고 건강한 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
-                        
-                        # 길이 제한 (32700자 - Excel 제한)
-                        if len(description) > 32700:
-                            description = description[:32697] + "..."
-                    except Exception as e:
-                        logger.warning(f"설명 번역 실패: {e}")
-                        # 번역 실패 시에도 기본 설명 제공 (이모지 제거)
-                        product_name = title_info['final_title']
-                        description = f"{product_name}\\n\\n* 프리미엄 뷰티 제품\\n* 피부 건강을 위한 전문 케어\\n* 아름답고 건강한 피부로 가꾸어 드립니다\\n\\n* 안전한 해외직구 상품\\n* 빠른 배송 서비스 제공"
-                
-                # 모든 텍스트 필드 정리
-                final_title = self.clean_text_for_excel(title_info['final_title'])
-                brand = self.clean_text_for_excel(title_info['brand'])
-                description = self.clean_text_for_excel(description)
-                
-                # 카테고리 상세 정보 가져오기
-                category_detail = self.detailed_category_mapping.get(category_code, {
-                    'category_path': '뷰티 > 스킨케어 > 에센스/세럼',
-                    'category_id': '50000169',
-                    'leaf_category_id': '50000169'
-                })
-                
-                # 검증된 네이버 스마트스토어 완전 필수 필드 구조 (단일 행 헤더 적용)
-                smartstore_product = {
-                    # 핵심 상품 정보 (0-6)
-                    '판매자상품코드': f'AMZ_{i:04d}',
-                    '카테고리코드': category_code,
-                    '상품명': final_title,
-                    '상품상태': '신상품',
-                    '판매가': sale_price,
-                    '부가세': '과세상품',
-                    '재고수량': 999,
-                    
-                    # 필수 추가 필드들
-                    '최종카테고리선택': category_detail['leaf_category_id'],
-                    '구매평노출여부': 'Y',
-                    '상품문의노출여부': 'Y', 
-                    '리뷰작성가능여부': 'Y',
-                    '판매상태': '판매중',
-                    '전시상태': '전시',
-                    '성인인증': 'N',
-                    '청소년이용불가': 'N',
-                    
-                    # 옵션 관련 필드 (7-16) - 옵션 없는 단순 상품으로 설정
-                    '옵션형태': '단순상품',
-                    '옵션명': '',
-                    '옵션값': '',
-                    '옵션가': '',
-                    '옵션재고수량': '',
-                    '직접입력옵션': '',
-                    '추가상품명': '',
-                    '추가상품값': '',
-                    '추가상품가': '',
-                    '추가상품재고수량': '',
-                    
-                    # 이미지 및 설명 (17-19) - 유효한 이미지 URL 설정
-                    '대표이미지': '',
-                    '추가이미지': '',
-                    '상세설명': description,
-                    
-                    # 제조 및 원산지 정보 (20-28) - 정확한 원산지코드 사용
-                    '브랜드': brand,
-                    '제조사': brand or '해외제조사',
-                    '제조일자': '2024-01-01',
-                    '유효일자': '2030-12-31',
-                    '원산지코드': 'US',
-                    '수입사': '',
-                    '복수원산지여부': 'N',
-                    '원산지직접입력': '미국',
-                    '미성년자구매여부': 'N',
-                    
-                    # 배송비 템플릿코드 추가
-                    '배송비템플릿코드': '1',  # 기본 배송비 템플릿
-                    
-                    # 배송 관련 정보 (29-45) - 정확한 배송 설정
-                    '배송방법': '택배',
-                    '기본배송비': 3000,
-                    '배송비유형': '유료',
-                    '배송비결제방식': '선결제',
-                    '출고지': '서울',
-                    '배송업체': 'CJ대한통운',
-                    '배송기간': '1~3일',
-                    '조건부무료상품판매가합계': '',
-                    '수량별부과수량': '',
-                    '구간별2구간수량': '',
-                    '구간별3구간수량': '',
-                    '구간별3구간배송비': '',
-                    '구간별추가배송비': '',
-                    '반품배송비': '',
-                    '교환배송비': '',
-                    '지역별차등배송비': '',
-                    '별도설치비': '',
-                    
-                    # 상품정보제공고시 (46-50) - 상품정보제공고시 템플릿코드 사용  
-                    '상품정보제공고시템플릿코드': '50000169',  # 에센스/세럼 템플릿
-                    '상품정보제공고시품명': final_title,
-                    '상품정보제공고시모델명': final_title[:30] + '_' + f'AMZ_{i:04d}',
-                    '상품정보제공고시인증허가사항': 'FDA 승인 시설에서 제조',
-                    '상품정보제공고시제조자': brand or '해외제조사',
-                    '상품정보제공고시제조국': '미국',
-                    '상품정보제공고시사용기한': '제품 표기 참조',
-                    '상품정보제공고시사용법': '제품 설명서 참조',
-                    '상품정보제공고시주의사항': '사용 전 패치테스트 권장',
-                    
-                    # A/S 관련 (51-54) - A/S 템플릿코드 사용
-                    'AS템플릿코드': '1',  # 기본 A/S 템플릿
-                    'AS담당자명': '고객센터',
-                    'AS전화번호': '010-2291-4080',
-                    'AS안내': 'A/S 관련 문의는 판매자에게 연락바랍니다. 해외 직구 상품으로 A/S는 제한적입니다.',
-                    '판매자특이사항': '해외 직구 상품입니다',
-                    
-                    # 할인 및 포인트 관련 (55-68) - 모든 필드 비워두기 (사용 안함)
-                    '즉시할인값기본할인': '',
-                    '즉시할인단위기본할인': '',
-                    '모바일즉시할인값': '',
-                    '모바일즉시할인단위': '',
-                    '복수구매할인조건값': '',
-                    '복수구매할인조건단위': '',
-                    '복수구매할인값': '',
-                    '복수구매할인단위': '',
-                    '상품구매시포인트지급값': '',
-                    '상품구매시포인트지급단위': '',
-                    '텍스트리뷰작성시지급포인트': '',
-                    '포토동영상리뷰작성시지급포인트': '',
-                    '한달사용텍스트리뷰작성시지급포인트': '',
-                    '한달사용포토동영상리뷰작성시지급포인트': '',
-                    
-                    # 기타 인증 및 상품정보 (69-88) - 화장품 관련 필수 정보
-                    '가전효율등급': '',
-                    '효율등급인증기관': '',
-                    '케어라벨인증유형': '',
-                    '상품정보제공고시색상': '제품 참조',
-                    '상품정보제공고시소재': '화장품',
-                    '상품정보제공고시사이즈': '제품 상세 참조',
-                    '상품정보제공고시동백사이즈': '',
-                    '상품정보제공고시동백노출': '',
-                    '상품정보제공고시수리방법': '',
-                    '사이즈상품군': '일반',
-                    '사이즈사이즈명': 'FREE',
-                    '사이즈상세사이즈': '제품 상세 참조',
-                    '사이즈모델명': f'MODEL{i:04d}',
-                    
-                    # 참고용 데이터 (업로드에는 포함되지 않음)
-                    '상품설명_참고': description,
-                    '아마존평점': product.get('rating', 0),
-                    '아마존리뷰수': product.get('review_count', 0),
-                    '아마존USD가격': product.get('price_usd', 0),
-                    '아마존원본제목': title_info['original_title'],
-                    '이미지URL': product.get('image_url', ''),
-                    '브랜드_참고': title_info['brand'],
-                    '수집일시': product.get('crawl_timestamp', datetime.now().isoformat())
-                }
-                
-                converted_products.append(smartstore_product)
-                logger.info(f"상품 {i} 변환 완료: {title_info['final_title'][:30]}...")
-                
             except Exception as e:
                 logger.error(f"상품 {i} 변환 실패: {e}")
                 # 에러 세부사항 로깅 (디버깅용)
                 logger.debug(f"상품 데이터: {product}")
                 continue
+            
+            positions.append(i)
+            products.append(product)
+            title_infos.append(title_info)
+            category_codes.append(category_code)
+            descriptions.append(description)
+        
+        if new_entries:
+            try:
+                self.conversion_cache.set_many(new_entries)
+            except Exception as e:
+                logger.warning(f"증분 변환 캐시 저장 실패: {e}")
+        
+        # 2단계: 열 단위 계산
+        usd_prices = [p.get('price_usd', 0) for p in products]
+        parsed_prices = self._parse_usd_prices(usd_prices)
+        price_result = self._korean_prices_from_usd(parsed_prices)
+        sale_prices = price_result.filled(0)
+        
+        unparsable = np.isnan(parsed_prices)
+        if unparsable.any():
+            logger.error(f"가격 계산 오류: {int(unparsable.sum())}개 상품의 가격을 해석할 수 없습니다.")
+        
+        # 범위를 벗어난 가격은 단일 계산으로 처리 (계산 불가 시 해당 상품 제외)
+        keep = np.ones(len(products), dtype=bool)
+        out_of_range = np.flatnonzero(np.ma.getmaskarray(price_result) & ~unparsable)
+        if len(out_of_range):
+            sale_prices = sale_prices.astype(object)
+            for idx in out_of_range:
+                try:
+                    sale_prices[idx] = self.calculate_korean_price(usd_prices[idx])
+                except Exception as e:
+                    logger.error(f"상품 {positions[idx]} 변환 실패: {e}")
+                    keep[idx] = False
+        
+        if not keep.all():
+            positions = [v for v, k in zip(positions, keep) if k]
+            products = [v for v, k in zip(products, keep) if k]
+            title_infos = [v for v, k in zip(title_infos, keep) if k]
+            category_codes = [v for v, k in zip(category_codes, keep) if k]
+            descriptions = [v for v, k in zip(descriptions, keep) if k]
+            sale_prices = sale_prices[keep]
         
         # 결과 검증
-        if not converted_products:
+        if not positions:
             logger.error("변환된 상품이 없습니다. 모든 상품에서 오류가 발생했습니다.")
             return pd.DataFrame()
         
-        logger.info(f"변환 완료: {len(converted_products)}개 상품 성공")
+        count = len(positions)
+        number = pd.Series(positions).astype(str).str.zfill(4)
+        seller_codes = 'AMZ_' + number
+        
+        # 모든 텍스트 필드 정리
+        final_titles = pd.Series([info['final_title'] for info in title_infos]).map(self.clean_text_for_excel)
+        brands = pd.Series([info['brand'] for info in title_infos]).map(self.clean_text_for_excel)
+        descriptions = pd.Series(descriptions).map(self.clean_text_for_excel)
+        manufacturers = brands.where(brands != '', '해외제조사')
+        
+        # 카테고리 상세 정보 (최종 카테고리)
+        leaf_ids = {code: detail['leaf_category_id'] for code, detail in self.detailed_category_mapping.items()}
+        category_codes = pd.Series(category_codes)
+        leaf_categories = category_codes.map(leaf_ids).fillna(self.default_category_code)
+        
+        now = datetime.now().isoformat()
+        computed = {
+            '판매자상품코드': seller_codes,
+            '카테고리코드': category_codes,
+            '상품명': final_titles,
+            '판매가': sale_prices,
+            '최종카테고리선택': leaf_categories,
+            '상세설명': descriptions,
+            '브랜드': brands,
+            '제조사': manufacturers,
+            '상품정보제공고시품명': final_titles,
+            '상품정보제공고시모델명': final_titles.str[:30] + '_' + seller_codes,
+            '상품정보제공고시제조자': manufacturers,
+            '사이즈모델명': 'MODEL' + number,
+            '상품설명_참고': descriptions,
+            '아마존평점': [p.get('rating', 0) for p in products],
+            '아마존리뷰수': [p.get('review_count', 0) for p in products],
+            '아마존USD가격': [p.get('price_usd', 0) for p in products],
+            '아마존원본제목': [info['original_title'] for info in title_infos],
+            '이미지URL': [p.get('image_url', '') for p in products],
+            '브랜드_참고': [info['brand'] for info in title_infos],
+            '수집일시': [p.get('crawl_timestamp', now) for p in products]
+        }
+        
+        logger.info(f"변환 완료: {count}개 상품 성공")
         
         # DataFrame 생성 시 에러 방지
         try:
-            df = pd.DataFrame(converted_products)
-            
-            # DataFrame 기본 검증
-            if df.empty:
-                logger.error("DataFrame이 비어있습니다.")
-                return pd.DataFrame()
+            df = pd.DataFrame({
+                column: computed[column] if default is None else default
+                for column, default in SMARTSTORE_ROW_TEMPLATE.items()
+            }, index=range(count))
             
             # 중요 컬럼 존재 확인 (단일 행 헤더 적용)
             required_columns = ['판매자상품코드', '카테고리코드', '상품명', '판매가']
@@ -473,8 +1045,54 @@ class SmartstoreUploader:
             logger.error(f"DataFrame 생성 실패: {e}")
             return pd.DataFrame()
     
-    def create_upload_file(self, df: pd.DataFrame, output_path: str = None) -> str:
-        """스마트스토어 업로드용 Excel 파일 생성 (단일 시트)"""
+    def convert_parallel(self, amazon_data: List[Dict], workers: int = None, start_index: int = 1) -> pd.DataFrame:
+        """여러 프로세스로 나누어 변환 (결과 순서와 AMZ_ 번호는 단일 프로세스 변환과 동일)
+        
+        상품 목록을 작업 수의 약 4배 묶음으로 나누어 ProcessPoolExecutor에 배분하고,
+        각 묶음의 시작 번호를 넘겨 부모 프로세스에서 원래 순서대로 합친다.
+        """
+        workers = workers or self.conversion_workers
+        if workers <= 1 or len(amazon_data) < PARALLEL_MIN_CHUNK * 2:
+            return self.convert_to_smartstore_upload_format(amazon_data, start_index=start_index)
+        
+        chunk_size = max(PARALLEL_MIN_CHUNK, -(-len(amazon_data) // (workers * 4)))
+        tasks = [
+            (amazon_data[offset:offset + chunk_size], start_index + offset)
+            for offset in range(0, len(amazon_data), chunk_size)
+        ]
+        logger.info(f"병렬 변환 시작: {len(amazon_data)}개 상품, 프로세스 {workers}개, 묶음 {len(tasks)}개")
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_conversion_worker,
+                                     initargs=(self,)) as executor:
+                results = list(executor.map(_convert_chunk, tasks))
+        except Exception as e:
+            logger.warning(f"병렬 변환 실패, 단일 프로세스로 변환: {e}")
+            return self.convert_to_smartstore_upload_format(amazon_data, start_index=start_index)
+        
+        results = [df for df in results if not df.empty]
+        if not results:
+            logger.error("변환된 상품이 없습니다. 모든 상품에서 오류가 발생했습니다.")
+            return pd.DataFrame()
+        
+        df = pd.concat(results, ignore_index=True)
+        logger.info(f"병렬 변환 완료: {len(df)}개 상품 성공")
+        return df
+    
+    def write_upload_files(self, df: pd.DataFrame, output_path: str = None) -> str:
+        """업로드 파일 저장 (rows_per_file을 넘으면 분할 저장, 첫 번째 파일 경로 반환)"""
+        if self.rows_per_file and len(df) > self.rows_per_file:
+            return self.create_sharded_upload_files(df, output_path)
+        return self.create_upload_file(df, output_path)
+    
+    def create_upload_file(self, df: pd.DataFrame, output_path: str = None, streaming: bool = None) -> str:
+        """스마트스토어 업로드용 Excel 파일 생성 (단일 시트)
+        
+        streaming이 True이면 write-only 워크시트에 행 단위로 기록한다 (기본값: streaming_export).
+        """
+        if streaming is None:
+            streaming = self.streaming_export
+        
         # 입력 검증
         if df is None or df.empty:
             logger.error("생성할 데이터가 없습니다. DataFrame이 비어있습니다.")
@@ -488,77 +1106,17 @@ class SmartstoreUploader:
         logger.info(f"데이터 크기: {df.shape[0]}행 {df.shape[1]}열")
         
         try:
-            # 스마트스토어 업로드용 단일 행 헤더 컬럼 목록 (줄바꿈 문제 해결)
-            upload_columns = [
-                '판매자상품코드', '카테고리코드', '상품명', '상품상태', '판매가', '부가세', 
-                '재고수량', '최종카테고리선택', '구매평노출여부', '상품문의노출여부', '리뷰작성가능여부',
-                '판매상태', '전시상태', '성인인증', '청소년이용불가',
-                '옵션형태', '옵션명', '옵션값', '옵션가', '옵션재고수량', 
-                '직접입력옵션', '추가상품명', '추가상품값', '추가상품가', '추가상품재고수량',
-                '대표이미지', '추가이미지', '상세설명', '브랜드', '제조사', '제조일자', 
-                '유효일자', '원산지코드', '수입사', '복수원산지여부', '원산지직접입력', '미성년자구매여부',
-                '배송비템플릿코드', '배송방법', '기본배송비', '배송비유형', '배송비결제방식', '출고지', '배송업체', '배송기간',
-                '조건부무료상품판매가합계', '수량별부과수량', '구간별2구간수량', '구간별3구간수량',
-                '구간별3구간배송비', '구간별추가배송비', '반품배송비', '교환배송비',
-                '지역별차등배송비', '별도설치비',
-                '상품정보제공고시템플릿코드', '상품정보제공고시품명', '상품정보제공고시모델명', 
-                '상품정보제공고시인증허가사항', '상품정보제공고시제조자', 
-                '상품정보제공고시제조국', '상품정보제공고시사용기한', 
-                '상품정보제공고시사용법', '상품정보제공고시주의사항',
-                'AS템플릿코드', 'AS담당자명', 'AS전화번호', 'AS안내', '판매자특이사항',
-                '즉시할인값기본할인', '즉시할인단위기본할인', '모바일즉시할인값',
-                '모바일즉시할인단위', '복수구매할인조건값', '복수구매할인조건단위',
-                '복수구매할인값', '복수구매할인단위', '상품구매시포인트지급값',
-                '상품구매시포인트지급단위', '텍스트리뷰작성시지급포인트',
-                '포토동영상리뷰작성시지급포인트', '한달사용텍스트리뷰작성시지급포인트',
-                '한달사용포토동영상리뷰작성시지급포인트', '가전효율등급',
-                '효율등급인증기관', '케어라벨인증유형', '상품정보제공고시색상',
-                '상품정보제공고시소재', '상품정보제공고시사이즈', '상품정보제공고시동백사이즈',
-                '상품정보제공고시동백노출', '상품정보제공고시수리방법',
-                '사이즈상품군', '사이즈사이즈명', '사이즈상세사이즈', '사이즈모델명'
-            ]
-            
             # 업로드용 데이터프레임 생성 (검증된 컬럼만)
-            upload_df = df[upload_columns].copy()
-            
-            # openpyxl로 Excel 파일 생성 (인코딩 문제 해결)
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, Alignment, PatternFill
-            
-            wb = Workbook()
-            ws = wb.active
-            ws.title = '일괄등록'
-            
-            # 헤더 스타일 설정 (네이버 스마트스토어 표준 형식)
-            header_font = Font(name='맑은 고딕', size=10, bold=True)
-            header_fill = PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid')
-            center_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            
-            # 단일 행 헤더 작성 (다중 행 헤더 문제 해결)
-            for col_idx, header in enumerate(upload_columns, 1):
-                # 헤더에서 줄바꿈 문자 제거하여 단일 행으로 만들기
-                clean_header = header.replace('\r\n', '').replace('\n', '')
-                cell = ws.cell(row=1, column=col_idx, value=clean_header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center_alignment
-            
-            # 데이터 작성
-            for row_idx, (_, row) in enumerate(upload_df.iterrows(), 2):
-                for col_idx, value in enumerate(row, 1):
-                    # 텍스트 정리 적용
-                    if isinstance(value, str):
-                        value = self.clean_text_for_excel(value)
-                    
-                    ws.cell(row=row_idx, column=col_idx, value=value)
+            upload_columns = UPLOAD_COLUMNS
+            upload_df = df[upload_columns]
             
-            # 컬럼 너비 자동 조정
-            for col_idx, header in enumerate(upload_columns, 1):
-                max_len = max(len(str(header)), 15)  # 최소 15자
-                ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_len + 2, 50)
-            
-            # 파일 저장
-            wb.save(output_path)
+            if streaming:
+                # write-only 모드 행 단위 기록 (행당 일정한 메모리)
+                writer = StreamingUploadWriter(output_path, upload_columns, self.clean_text_for_excel)
+                writer.write_dataframe(upload_df)
+                writer.close()
+            else:
+                self._write_upload_workbook(upload_df, upload_columns, output_path)
             
             # 참고용 정보는 별도 파일로 생성
             reference_path = output_path.replace('.xlsx', '_참고용.xlsx')
@@ -572,18 +1130,106 @@ class SmartstoreUploader:
             logger.error(f"파일 생성 실패: {e}")
             return None
     
+    def create_sharded_upload_files(self, df: pd.DataFrame, output_path: str = None,
+                                    rows_per_file: int = None, workers: int = None) -> Optional[str]:
+        """rows_per_file행씩 나누어 업로드 파일 여러 개 생성 (파일마다 참고용 파일 포함)
+        
+        workers가 2 이상이면 분할 파일을 여러 프로세스에서 동시에 저장한다.
+        분할 파일 목록은 {출력파일}_manifest.json에 기록하고, 첫 번째 분할 파일 경로를 반환한다.
+        """
+        rows_per_file = rows_per_file or self.rows_per_file
+        workers = workers or self.conversion_workers
+        
+        if df is None or df.empty:
+            logger.error("생성할 데이터가 없습니다. DataFrame이 비어있습니다.")
+            return None
+        
+        if output_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = f"smartstore_upload_{timestamp}.xlsx"
+        
+        tasks = [
+            (df.iloc[offset:offset + rows_per_file], shard_file_paths(output_path, shard_no)[0])
+            for shard_no, offset in enumerate(range(0, len(df), rows_per_file), 1)
+        ]
+        logger.info(f"분할 파일 생성 시작: {len(df)}행 → {len(tasks)}개 파일 ({rows_per_file}행씩)")
+        
+        results = None
+        if workers > 1 and len(tasks) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=_init_conversion_worker,
+                                         initargs=(self,)) as executor:
+                    results = list(executor.map(_write_upload_shard, tasks))
+            except Exception as e:
+                logger.warning(f"병렬 파일 생성 실패, 순차 생성으로 진행: {e}")
+        if results is None:
+            results = [self.create_upload_file(shard_df, shard_path) for shard_df, shard_path in tasks]
+        
+        if not all(results):
+            logger.error("일부 분할 파일 생성에 실패했습니다.")
+            return None
+        
+        shards = []
+        for shard_no, (shard_df, shard_path) in enumerate(tasks, 1):
+            reference_path = shard_file_paths(output_path, shard_no)[1]
+            shards.append({
+                'file': os.path.basename(shard_path),
+                'reference_file': os.path.basename(reference_path) if os.path.exists(reference_path) else None,
+                'rows': len(shard_df),
+                'first_seller_code': str(shard_df['판매자상품코드'].iloc[0]),
+                'last_seller_code': str(shard_df['판매자상품코드'].iloc[-1])
+            })
+        
+        self.last_manifest_path = write_upload_manifest(output_path, shards)
+        logger.info(f"분할 파일 생성 완료: {len(shards)}개 파일, 매니페스트 {self.last_manifest_path}")
+        return tasks[0][1]
+    
+    def _write_upload_workbook(self, upload_df: pd.DataFrame, upload_columns: List[str], output_path: str):
+        """일반 Workbook으로 업로드 시트 작성 (streaming_export=False일 때)"""
+        # openpyxl로 Excel 파일 생성 (인코딩 문제 해결)
+        from openpyxl import Workbook
+        from openpyxl.styles import Font, Alignment, PatternFill
+        
+        wb = Workbook()
+        ws = wb.active
+        ws.title = '일괄등록'
+        
+        # 헤더 스타일 설정 (네이버 스마트스토어 표준 형식)
+        header_font = Font(name='맑은 고딕', size=10, bold=True)
+        header_fill = PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid')
+        center_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        
+        # 단일 행 헤더 작성 (다중 행 헤더 문제 해결)
+        for col_idx, header in enumerate(upload_columns, 1):
+            # 헤더에서 줄바꿈 문자 제거하여 단일 행으로 만들기
+            clean_header = header.replace('\r\n', '').replace('\n', '')
+            cell = ws.cell(row=1, column=col_idx, value=clean_header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = center_alignment
+        
+        # 데이터 작성
+        for row_idx, (_, row) in enumerate(upload_df.iterrows(), 2):
+            for col_idx, value in enumerate(row, 1):
+                # 텍스트 정리 적용
+                if isinstance(value, str):
+                    value = self.clean_text_for_excel(value)
+                
+                ws.cell(row=row_idx, column=col_idx, value=value)
+        
+        # 컬럼 너비 자동 조정
+        for col_idx, header in enumerate(upload_columns, 1):
+            max_len = max(len(str(header)), 15)  # 최소 15자
+            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_len + 2, 50)
+        
+        # 파일 저장
+        wb.save(output_path)
+    
     def _create_reference_file(self, df: pd.DataFrame, reference_path: str):
         """참고용 정보 파일 생성"""
         try:
-            # 참고용 컬럼들 (업로드용과 분리)
-            reference_columns = [
-                '카테고리코드', '상품명', '판매가', '재고수량', 'A/S 전화번호',
-                '상품설명_참고', '아마존평점', '아마존리뷰수', '아마존USD가격', 
-                '아마존원본제목', '이미지URL', '브랜드_참고', '수집일시'
-            ]
-            
             # 참고용 데이터프레임 생성
-            reference_df = df[reference_columns].copy()
+            reference_df = df[REFERENCE_COLUMNS].copy()
             
             # 참고용 파일 생성
             with pd.ExcelWriter(reference_path, engine='openpyxl') as writer:
@@ -608,14 +1254,181 @@ class SmartstoreUploader:
         except Exception as e:
             logger.warning(f"참고용 파일 생성 실패: {e}")
     
-    def convert_file(self, input_file: str, output_file: str = None, margin_rate: int = None) -> str:
-        """파일 변환 메인 함수"""
+    def convert_jsonl_file(self, input_file: str, output_file: str = None, chunk_size: int = STREAM_CHUNK_SIZE,
+                           rows_per_file: int = None) -> str:
+        """JSON Lines 파일 스트리밍 변환
+        
+        chunk_size개씩 읽기 → 검증/변환 → write-only 시트에 기록을 반복하므로
+        변환 데이터의 메모리 사용량은 입력 파일 크기와 관계없이 일정하다. 참고용 파일도 같은 방식으로 기록한다.
+        단, drop_duplicates이면 입력 전체에서 본 상품 키(ASIN/정규화 URL)를 유지하므로
+        고유 상품 100만 개당 약 100MB를 더 사용한다 (중복 제거가 필요 없으면 drop_duplicates=False).
+        rows_per_file을 지정하면 그 행 수마다 새 분할 파일로 넘어가며 매니페스트를 남긴다.
+        변환 중 오류가 나면 작성 중인 파일과 이미 저장한 분할 파일을 모두 지우고 None을 반환한다.
+        """
+        rows_per_file = rows_per_file or self.rows_per_file
+        if output_file is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"smartstore_upload_{timestamp}.xlsx"
+        
+        shards = []
+        writers = None  # (업로드 작성기, 참고용 작성기, 업로드 경로, 참고용 경로, 첫 판매자상품코드)
+        total_read = 0
+        total_kept = 0
+        seen_keys = set()
+        total_written = 0
+        completed = False
+        
+        def open_writers(first_code: str):
+            if rows_per_file:
+                upload_path, reference_path = shard_file_paths(output_file, len(shards) + 1)
+            else:
+                upload_path, reference_path = output_file, output_file.replace('.xlsx', '_참고용.xlsx')
+            logger.info(f"Excel 파일 생성 시작: {upload_path}")
+            upload_writer = StreamingUploadWriter(upload_path, UPLOAD_COLUMNS, self.clean_text_for_excel)
+            try:
+                reference_writer = StreamingUploadWriter(reference_path, REFERENCE_COLUMNS, sheet_title='전체정보')
+            except Exception as e:
+                logger.warning(f"참고용 파일 생성 실패: {e}")
+                reference_writer = None
+            return [upload_writer, reference_writer, upload_path, reference_path, first_code]
+        
+        def close_writers(last_code: str):
+            upload_writer, reference_writer, upload_path, reference_path, first_code = writers
+            upload_writer.close()
+            if reference_writer:
+                try:
+                    reference_writer.close()
+                except Exception as e:
+                    logger.warning(f"참고용 파일 생성 실패: {e}")
+                    reference_writer = None
+            shards.append({
+                'file': os.path.basename(upload_path),
+                'reference_file': os.path.basename(reference_path) if reference_writer else None,
+                'rows': upload_writer.rows_written,
+                'first_seller_code': first_code,
+                'last_seller_code': last_code
+            })
+            logger.info(f"업로드 파일 저장: {upload_path} ({upload_writer.rows_written}행)")
+        
+        try:
+            products = iter_jsonl_products(input_file)
+            last_code = None
+            while True:
+                chunk = list(islice(products, chunk_size))
+                if not chunk:
+                    break
+                
+                total_read += len(chunk)
+                if self.drop_duplicates:
+                    chunk = drop_duplicate_products(chunk, seen_keys)
+                
+                df = self.convert_to_smartstore_upload_format(chunk, start_index=total_kept + 1)
+                total_kept += len(chunk)
+                
+                offset = 0
+                while offset < len(df):
+                    if writers is None:
+                        writers = open_writers(str(df['판매자상품코드'].iloc[offset]))
+                    upload_writer, reference_writer = writers[0], writers[1]
+                    room = rows_per_file - upload_writer.rows_written if rows_per_file else len(df) - offset
+                    part = df.iloc[offset:offset + room]
+                    
+                    upload_writer.write_dataframe(part)
+                    if reference_writer:
+                        try:
+                            reference_writer.write_dataframe(part)
+                        except Exception as e:
+                            logger.warning(f"참고용 파일 생성 실패: {e}")
+                            writers[1] = None
+                    
+                    offset += len(part)
+                    total_written += len(part)
+                    last_code = str(part['판매자상품코드'].iloc[-1])
+                    if rows_per_file and upload_writer.rows_written >= rows_per_file:
+                        close_writers(last_code)
+                        writers = None
+                
+                logger.info(f"스트리밍 변환 진행: {total_read}개 읽음, {total_written}개 기록")
+            
+            if writers is not None:
+                close_writers(last_code)
+                writers = None
+            completed = True
+        except Exception as e:
+            logger.error(f"스트리밍 변환 실패: {e}")
+            return None
+        finally:
+            if not completed:
+                # 작성 중인 파일은 저장하지 않고, 이미 저장한 분할 파일도 삭제 (매니페스트 없는 일부 결과 방지)
+                for writer in (writers or [None, None])[:2]:
+                    if writer:
+                        writer.discard()
+                output_dir = os.path.dirname(output_file)
+                for shard in shards:
+                    for name in (shard['file'], shard['reference_file']):
+                        path = os.path.join(output_dir, name) if name else None
+                        if path and os.path.exists(path):
+                            os.remove(path)
+                shards.clear()
+        
+        if not shards:
+            logger.error("변환된 상품이 없습니다. 모든 상품 변환에 실패했습니다.")
+            return None
+        
+        if rows_per_file:
+            self.last_manifest_path = write_upload_manifest(output_file, shards)
+            logger.info(f"분할 파일 {len(shards)}개, 매니페스트 {self.last_manifest_path}")
+        
+        first_file = os.path.join(os.path.dirname(output_file), shards[0]['file'])
+        logger.info(f"변환된 상품 수: {total_written}개 (입력 {total_read}개)")
+        logger.info(f"스마트스토어 업로드 파일 생성 완료: {first_file}")
+        return first_file
+    
+    def _archive_columns(self) -> Optional[List[str]]:
+        """아카이브에서 읽을 컬럼 (클래스가 ARCHIVE_COLUMNS를 직접 선언하지 않았으면 None = 전체)
+        
+        하위 클래스(EnhancedSmartstoreUploader 등)는 기본 컬럼 외의 필드를 사용할 수 있으므로
+        상속받은 목록으로 잘라 읽지 않는다.
+        """
+        return type(self).__dict__.get('ARCHIVE_COLUMNS')
+    
+    def convert_file(self, input_file: str, output_file: str = None, margin_rate: int = None,
+                     translation_workers: int = None, incremental: bool = None,
+                     conversion_workers: int = None, rows_per_file: int = None) -> str:
+        """파일 변환 메인 함수
+        
+        translation_workers를 지정하면 여러 상품의 번역을 동시에 요청한다 (결과 순서는 동일).
+        incremental=True이면 원본 필드가 바뀌지 않은 상품은 이전 변환 결과를 재사용하고
+        신규/변경 상품만 번역 및 정리한다.
+        conversion_workers가 2 이상이면 상품 목록을 여러 프로세스로 나누어 변환한다.
+        rows_per_file을 지정하면 그 행 수마다 업로드 파일을 나누어 저장하고 첫 번째 파일 경로를 반환한다.
+        """
         logger.info(f"스마트스토어 업로드 형식 변환 시작: {input_file}")
         
         # 마진율 설정
         if margin_rate:
             self.markup_percentage = margin_rate
         
+        # 동시 번역 수 설정
+        if translation_workers:
+            self.translation_workers = max(1, translation_workers)
+        
+        # 증분 변환 설정
+        if incremental is not None:
+            self.incremental = incremental
+        
+        # 변환 프로세스 수 설정
+        if conversion_workers:
+            self.conversion_workers = max(1, conversion_workers)
+        
+        # 파일당 최대 행 수 설정
+        if rows_per_file:
+            self.rows_per_file = rows_per_file
+        
+        # JSON Lines는 전체를 읽지 않고 나누어 스트리밍 변환
+        if input_file.endswith(('.jsonl', '.ndjson')):
+            return self.convert_jsonl_file(input_file, output_file)
+        
         # 아마존 데이터 로드
         try:
             if input_file.endswith('.json'):
@@ -624,8 +1437,12 @@ class SmartstoreUploader:
             elif input_file.endswith('.csv'):
                 df = pd.read_csv(input_file, encoding='utf-8-sig')
                 amazon_data = df.to_dict('records')
+            elif is_archive_path(input_file):
+                # Parquet 아카이브: 변환에 필요한 컬럼만 메모리 매핑으로 읽기
+                amazon_data = read_crawl_archive(input_file, columns=self._archive_columns(),
+                                                 run_id=self.archive_run_id)
             else:
-                raise ValueError("지원되지 않는 파일 형식입니다. JSON 또는 CSV 파일을 사용해주세요.")
+                raise ValueError("지원되지 않는 파일 형식입니다. JSON, JSON Lines, CSV 또는 Parquet 파일을 사용해주세요.")
         except Exception as e:
             logger.error(f"파일 로드 실패: {e}")
             return None
@@ -635,8 +1452,15 @@ class SmartstoreUploader:
         
         logger.info(f"로드된 상품 수: {len(amazon_data)}개")
         
-        # 스마트스토어 업로드 형식으로 변환
-        upload_df = self.convert_to_smartstore_upload_format(amazon_data)
+        # 여러 키워드/실행에서 수집된 같은 상품은 한 번만 변환
+        if self.drop_duplicates:
+            unique_data = drop_duplicate_products(amazon_data)
+            if len(unique_data) < len(amazon_data):
+                logger.info(f"중복 상품 {len(amazon_data) - len(unique_data)}개 제외")
+            amazon_data = unique_data
+        
+        # 스마트스토어 업로드 형식으로 변환 (conversion_workers > 1이면 프로세스 병렬 변환)
+        upload_df = self.convert_parallel(amazon_data)
         
         if upload_df.empty:
             logger.error("변환된 상품이 없습니다. 모든 상품 변환에 실패했습니다.")
@@ -644,8 +1468,13 @@ class SmartstoreUploader:
         
         logger.info(f"변환된 상품 수: {len(upload_df)}개")
         
-        # 업로드 파일 생성
-        output_path = self.create_upload_file(upload_df, output_file)
+        if self.translation_cache:
+            stats = self.translation_cache.stats()
+            logger.info(f"번역 캐시: 적중 {stats['hits']}회, 미적중 {stats['misses']}회 "
+                        f"(적중률 {stats['hit_rate']}%, 저장 {stats['entries']}건)")
+        
+        # 업로드 파일 생성 (rows_per_file을 넘으면 분할 저장)
+        output_path = self.write_upload_files(upload_df, output_file)
         
         if not output_path:
             logger.error("Excel 파일 생성에 실패했습니다.")
@@ -658,17 +1487,24 @@ def main():
     """테스트 실행 함수"""
     uploader = SmartstoreUploader()
     
-    # 최신 아마존 크롤링 파일 찾기
+    # 최신 아마존 크롤링 결과 찾기 (Parquet 아카이브의 최근 실행, 없으면 JSON 파일)
     import glob
-    amazon_files = glob.glob("amazon_products_*.json")
-    
-    if not amazon_files:
-        print("아마존 크롤링 파일을 찾을 수 없습니다.")
-        return
-    
-    # 가장 최신 파일 선택
-    latest_file = max(amazon_files, key=os.path.getctime)
-    print(f"변환할 파일: {latest_file}")
+    latest_run = latest_archive_run(DEFAULT_ARCHIVE_DIR) if PARQUET_AVAILABLE else None
+    if latest_run:
+        latest_file = DEFAULT_ARCHIVE_DIR
+        uploader.archive_run_id = latest_run
+    else:
+        amazon_files = glob.glob("amazon_products_*.json") + glob.glob(
+            os.path.join(DEFAULT_ARCHIVE_DIR, "crawl_date=*", "part-*.json")
+        )
+        
+        if not amazon_files:
+            print("아마존 크롤링 파일을 찾을 수 없습니다.")
+            return
+        
+        # 가장 최신 파일 선택
+        latest_file = max(amazon_files, key=os.path.getctime)
+    print(f"변환할 파일: {latest_file}" + (f" (크롤링 실행 {latest_run})" if latest_run else ""))
     
     try:
         output_file = uploader.convert_file(latest_file)
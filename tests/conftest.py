@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""pytest 공통 설정 - 저장소 루트 모듈 import 경로 추가 및 기본 캐시 폴더 격리"""
+
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """기본 캐시 폴더를 테스트별 임시 폴더로 변경 (사용자 캐시 폴더에 쓰지 않음)"""
+    cache_dir = tmp_path / 'user_cache'
+    monkeypatch.setenv('AMAZON_SMARTSTORE_CACHE_DIR', str(cache_dir))
+    return cache_dir
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""공유 카테고리 인덱스가 두 변환기에 같은 분류 결과를 주는지 확인"""
+
+import pytest
+
+from smartstore_uploader import SmartstoreUploader
+
+
+@pytest.mark.parametrize('title, category, expected', [
+    ('Baby lotion', 'baby clothes ballet', '50002436'),
+    ('Wireless gaming headset', 'gaming accessories', '50000169'),
+    ('Honey granola', 'granola cereal', '50000169'),
+    ('Blood pressure monitor', 'medical equipment', '50000169'),
+    ('Leather wallet', 'brand accessories', '50000169'),
+    ('Camping tent', 'sports outdoor', '50000169'),
+    ('Whey protein powder', 'diet supplements', '50006674'),
+    ('Plant pot', 'home garden', '50000131'),
+    ('Unknown gadget', '', '50000169'),
+])
+def test_uploader_category_codes(title, category, expected):
+    uploader = SmartstoreUploader(enable_translation=False)
+    assert uploader.get_category_code(title, category) == expected
+    assert uploader.get_category_codes([title], [category]) == [expected]
+
+
+@pytest.mark.parametrize('title, category', [
+    ('Baby lotion', 'baby clothes ballet'),
+    ('Wireless gaming headset', 'gaming accessories'),
+    ('Whey protein powder', 'diet supplements'),
+    ('Plant pot', 'home garden'),
+    ('Hyaluronic serum', 'Beauty'),
+    ('Unknown gadget', ''),
+])
+def test_both_converters_use_the_same_category(title, category, tmp_path):
+    from naver_smartstore_api import NaverSmartStoreAPI
+
+    uploader = SmartstoreUploader(enable_translation=False)
+    api = NaverSmartStoreAPI('id', 'secret', 'customer',
+                             translation_cache_file=str(tmp_path / 'translation_cache.db'))
+    product = {'title': title, 'category': category, 'price_usd': 10.0}
+    assert api.convert_amazon_to_naver_product(product).category_id == uploader.get_category_code(title, category)
+
+
+def test_rules_reload_from_json_without_disk_cache(tmp_path, monkeypatch):
+    import json
+    import os
+    import shutil
+    import tempfile
+
+    from category_rules import DEFAULT_RULES_FILE, CategoryRuleIndex
+
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path / 'tmp'))
+    os.makedirs(tempfile.tempdir)
+    rules_file = tmp_path / 'rules.json'
+    shutil.copy(DEFAULT_RULES_FILE, rules_file)
+
+    index = CategoryRuleIndex(str(rules_file), check_interval=0)
+    assert index.lookup('Unknown gadget') == '50000169'
+
+    data = json.loads(rules_file.read_text(encoding='utf-8'))
+    data['default_category_code'] = '50000001'
+    rules_file.write_text(json.dumps(data), encoding='utf-8')
+    os.utime(rules_file, ns=(1, 1))
+    assert index.lookup('Unknown gadget') == '50000001'
+
+    # 컴파일 결과는 메모리에만 보관 (공유 임시 폴더나 규칙 폴더에 파일을 만들지 않음)
+    assert os.listdir(tempfile.tempdir) == []
+    assert sorted(os.listdir(tmp_path)) == ['rules.json', 'tmp']
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""크롤링 아카이브 읽기 순서와 컬럼 선택 확인"""
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from crawl_archive import latest_archive_run, read_crawl_archive, write_crawl_archive  # noqa: E402
+from smartstore_uploader import SmartstoreUploader  # noqa: E402
+
+
+def product(asin, price, keyword, **extra):
+    return {'asin': asin, 'title': f'Brand Product {asin}', 'price_usd': price,
+            'search_keyword': keyword, **extra}
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    path = str(tmp_path / 'crawl_archive')
+    write_crawl_archive([product('B000000001', '10.00', 'serum'), product('B000000002', '5.00', 'cream')],
+                        path, run_id='20250801_090000', crawl_date='2025-08-01')
+    write_crawl_archive([product('B000000003', '7.00', 'cream'), product('B000000001', '12.00', 'serum')],
+                        path, run_id='20250802_090000', crawl_date='2025-08-02')
+    return path
+
+
+def test_directory_read_returns_newest_run_first(archive_dir):
+    rows = read_crawl_archive(archive_dir)
+    assert [row['asin'] for row in rows] == ['B000000003', 'B000000001', 'B000000001', 'B000000002']
+    assert rows[1]['price_usd'] == '12.00'
+    assert latest_archive_run(archive_dir) == '20250802_090000'
+
+
+def test_single_run_keeps_crawl_order(archive_dir):
+    rows = read_crawl_archive(archive_dir, run_id='20250801_090000')
+    assert [row['asin'] for row in rows] == ['B000000001', 'B000000002']
+
+
+def test_duplicate_drop_keeps_latest_copy(archive_dir, tmp_path):
+    uploader = SmartstoreUploader(enable_translation=False)
+    output = uploader.convert_file(archive_dir, str(tmp_path / 'upload.xlsx'))
+    assert output
+    from openpyxl import load_workbook
+    ws = load_workbook(output, read_only=True).active
+    header = next(ws.iter_rows(max_row=1, values_only=True))
+    prices = [row[header.index('판매가')] for row in ws.iter_rows(min_row=2, values_only=True)]
+    assert prices == [uploader.calculate_korean_price(p) for p in ('7.00', '12.00', '5.00')]
+
+
+def test_projection_only_when_class_declares_columns(tmp_path):
+    path = str(tmp_path / 'crawl_archive')
+    write_crawl_archive([product('B000000001', '10.00', 'serum', detail_images=['a.jpg'])], path, run_id='r1')
+
+    class ExtendedUploader(SmartstoreUploader):
+        pass
+
+    class ProjectedUploader(SmartstoreUploader):
+        ARCHIVE_COLUMNS = ['title', 'price_usd']
+
+    assert SmartstoreUploader(enable_translation=False)._archive_columns() == SmartstoreUploader.ARCHIVE_COLUMNS
+    assert ExtendedUploader(enable_translation=False)._archive_columns() is None
+    assert ProjectedUploader(enable_translation=False)._archive_columns() == ['title', 'price_usd']
+
+    rows = read_crawl_archive(path, columns=ExtendedUploader(enable_translation=False)._archive_columns())
+    assert rows[0]['detail_images'] == ['a.jpg']
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""clean_text_for_excel 단일 패턴 구현과 이전 다단계 re.sub 구현의 결과 비교"""
+
+import random
+import re
+
+import pytest
+
+from smartstore_uploader import _clean_text_for_excel, SmartstoreUploader
+
+# 이전 구현에 섞어 넣을 문자 (이모지, 기호 블록, 상표 기호, 제어 문자, 각종 공백)
+SAMPLE_CHARS = (
+    list('abcXYZ 가나다 012.,-') +
+    ['\U0001F600', '\U0001F680', '\U0001F1F0', '\U00010000', '\U0010FFFF', '☀', '✅', '➿',
+     '⭐', '️', '™', '®', '©', '℠', '\x00', '\x07', '\x0b', '\x0c', '\x1c',
+     '\x1f', '\x7f', '\t', '\n', '\r', ' ', '　', ' ', '\x85']
+)
+
+
+def legacy_clean_text_for_excel(text: str) -> str:
+    """이전 구현 (기준 결과)"""
+    if not text:
+        return ""
+    text = re.sub(r'[\U00010000-\U0010ffff]', '', text)
+    emoji_pattern = re.compile("["
+                               u"\U0001F600-\U0001F64F"
+                               u"\U0001F300-\U0001F5FF"
+                               u"\U0001F680-\U0001F6FF"
+                               u"\U0001F1E0-\U0001F1FF"
+                               u"\U00002700-\U000027BF"
+                               u"\U0000FE00-\U0000FE0F"
+                               u"\U00002600-\U000026FF"
+                               u"\U00002B00-\U00002BFF"
+                               "]+", flags=re.UNICODE)
+    text = emoji_pattern.sub('', text)
+    text = re.sub(r'[™®©℠]', '', text)
+    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def random_texts(count: int, seed: int = 10):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rng.choice(SAMPLE_CHARS) for _ in range(rng.randint(0, 24)))
+
+
+def test_matches_legacy_on_random_text():
+    for text in random_texts(20000):
+        assert _clean_text_for_excel(text) == legacy_clean_text_for_excel(text), repr(text)
+
+
+@pytest.mark.parametrize('text', [
+    '', ' ', '\x0b', ' \x0b ', 'a\x1cb', 'a \x1c b', '\U0001F600 Cream™ \U0001F600', '  Serum  ®  50ml ',
+    '✅\n✅', 'a  b', '\x85a\x85',
+])
+def test_matches_legacy_on_edge_cases(text):
+    assert _clean_text_for_excel(text) == legacy_clean_text_for_excel(text)
+
+
+def test_method_handles_empty_values():
+    uploader = SmartstoreUploader(enable_translation=False)
+    assert uploader.clean_text_for_excel('') == ''
+    assert uploader.clean_text_for_excel(None) == ''
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""증분 변환 캐시가 번역에 실패한 상품을 저장하지 않는지 확인"""
+
+import logging
+
+from smartstore_uploader import SmartstoreUploader
+from translation_cache import TranslationCache
+
+
+class FakeTranslator:
+    """fail=True이면 번역기 내부 실패처럼 원문을 그대로 돌려준다"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    def _translate(self, text):
+        self.calls += 1
+        return text if self.fail else f"번역 {text}"
+
+    def translate_product_title(self, text):
+        return self._translate(text)
+
+    def translate_product_description(self, text):
+        return self._translate(text)
+
+    def translate_product_features(self, features):
+        return [self._translate(text) for text in features]
+
+
+PRODUCTS = [
+    {'title': 'Brand Vitamin C Serum', 'price_usd': '19.99', 'description': 'Brightening serum for daily use'},
+    {'title': 'Brand Night Cream', 'price_usd': '25.00', 'features': ['Rich texture', 'Fragrance free']},
+]
+
+
+def make_uploader(tmp_path, translator):
+    uploader = SmartstoreUploader(enable_translation=False, incremental=True,
+                                  conversion_cache_file=str(tmp_path / 'conversion_cache.db'))
+    uploader.enable_translation = True
+    uploader.translator = translator
+    uploader.translation_cache = TranslationCache(str(tmp_path / 'translation_cache.db'))
+    return uploader
+
+
+def test_failed_translations_are_not_cached(tmp_path, caplog):
+    failing = make_uploader(tmp_path, FakeTranslator(fail=True))
+    df = failing.convert_to_smartstore_upload_format(PRODUCTS)
+    assert len(df) == 2
+    assert failing.translation_cache.stats()['entries'] == 0
+
+    working = make_uploader(tmp_path, FakeTranslator())
+    with caplog.at_level(logging.INFO, logger='smartstore_uploader'):
+        df = working.convert_to_smartstore_upload_format(PRODUCTS)
+    assert '이전 결과 재사용 0개' in caplog.text
+    assert all(title.startswith('Brand 번역') for title in df['상품명'])
+    assert working.translator.calls > 0
+
+    # 번역에 성공한 결과는 다음 실행에서 재사용
+    again = make_uploader(tmp_path, FakeTranslator(fail=True))
+    df_again = again.convert_to_smartstore_upload_format(PRODUCTS)
+    assert again.translator.calls == 0
+    assert df_again['상품명'].tolist() == df['상품명'].tolist()
+
+
+def test_incremental_conversion_is_opt_in():
+    from workflow_pipeline import DEFAULT_SETTINGS, build_arg_parser
+
+    assert DEFAULT_SETTINGS['incremental_conversion'] is False
+    assert SmartstoreUploader(enable_translation=False).incremental is False
+    assert build_arg_parser().parse_args(['convert', '--incremental']).incremental is True
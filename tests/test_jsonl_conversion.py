@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""JSON Lines 스트리밍 변환이 실패 시 분할 파일과 임시 시트 파일을 남기지 않는지 확인"""
+
+import glob
+import json
+import os
+import tempfile
+
+from smartstore_uploader import SmartstoreUploader
+
+
+def write_jsonl(path, count):
+    with open(path, 'w', encoding='utf-8') as f:
+        for idx in range(count):
+            product = {'title': f'Brand Serum {idx}', 'price_usd': 10 + idx, 'asin': f'B0{idx:08d}',
+                       'image_url': 'https://example.com/a.jpg'}
+            f.write(json.dumps(product) + '\n')
+
+
+def openpyxl_temp_files():
+    return set(glob.glob(os.path.join(tempfile.gettempdir(), 'openpyxl.*')))
+
+
+def test_jsonl_split_conversion(tmp_path):
+    input_file = tmp_path / 'products.jsonl'
+    write_jsonl(input_file, 25)
+    uploader = SmartstoreUploader(enable_translation=False)
+
+    first_file = uploader.convert_jsonl_file(str(input_file), str(tmp_path / 'upload.xlsx'),
+                                             chunk_size=10, rows_per_file=10)
+    assert first_file == str(tmp_path / 'upload_part001.xlsx')
+    with open(uploader.last_manifest_path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert [shard['rows'] for shard in manifest['files']] == [10, 10, 5]
+
+
+def test_failed_jsonl_conversion_removes_partial_files(tmp_path, monkeypatch):
+    input_file = tmp_path / 'products.jsonl'
+    write_jsonl(input_file, 25)
+    uploader = SmartstoreUploader(enable_translation=False)
+    convert = uploader.convert_to_smartstore_upload_format
+    calls = []
+
+    def failing_convert(chunk, start_index=1):
+        calls.append(start_index)
+        if len(calls) == 3:
+            raise RuntimeError("변환 실패")
+        return convert(chunk, start_index)
+
+    monkeypatch.setattr(uploader, 'convert_to_smartstore_upload_format', failing_convert)
+    temp_files = openpyxl_temp_files()
+
+    # 첫 분할 파일은 저장되고 두 번째 파일 작성 중에 실패
+    result = uploader.convert_jsonl_file(str(input_file), str(tmp_path / 'upload.xlsx'),
+                                         chunk_size=6, rows_per_file=10)
+    assert result is None
+    assert sorted(os.listdir(tmp_path)) == ['products.jsonl']
+    assert openpyxl_temp_files() <= temp_files
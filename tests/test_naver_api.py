@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+"""NaverSmartStoreAPI 비동기 클라이언트 (로컬 aiohttp 대역 서버로 재시도/토큰/이미지 업로드 확인)"""
+
+import asyncio
+import contextlib
+import os
+import socket
+import stat
+import time
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from naver_smartstore_api import NaverSmartStoreAPI, TokenCache  # noqa: E402
+
+TOKEN_PATH = '/external/v1/oauth2/token'
+REGISTER_PATH = '/external/v2/products'
+IMAGE_UPLOAD_PATH = '/external/v1/product-images/upload'
+
+
+class StandInCommerceAPI:
+    """네이버 커머스 API 대역 - 경로별 응답 순서를 지정하고 받은 요청을 기록
+
+    responses[path]는 (상태, 본문, 헤더) 또는 요청을 받는 코루틴 함수 목록이며,
+    목록을 다 쓰면 마지막 응답을 반복한다.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.responses = {
+            TOKEN_PATH: [(200, {'access_token': 'token-1', 'expires_in': 10800}, {})],
+        }
+
+    def set(self, path, *responses):
+        self.responses[path] = list(responses)
+
+    def count(self, path):
+        return sum(1 for method, request_path in self.requests if request_path == path)
+
+    async def handle(self, request):
+        self.requests.append((request.method, request.path))
+        responses = self.responses.get(request.path)
+        if not responses:
+            return web.json_response({'message': 'not found'}, status=404)
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if callable(response):
+            return await response(request)
+        await request.read()
+        status, body, headers = response
+        if isinstance(body, bytes):
+            return web.Response(status=status, body=body, headers=headers)
+        return web.json_response(body, status=status, headers=headers)
+
+
+@contextlib.asynccontextmanager
+async def stand_in_api(tmp_path, port=None, **api_kwargs):
+    """대역 서버와 그 서버를 base_url로 쓰는 API 클라이언트 (port를 주면 실행마다 같은 주소)"""
+    stand_in = StandInCommerceAPI()
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', stand_in.handle)
+    server = TestServer(app, host='127.0.0.1', port=port)
+    await server.start_server()
+
+    api_kwargs.setdefault('translation_cache_file', str(tmp_path / 'translation_cache.db'))
+    api_kwargs.setdefault('requests_per_second', 1000.0)
+    api = NaverSmartStoreAPI('client-id', 'client-secret', 'customer-id', **api_kwargs)
+    api.base_url = str(server.make_url('')).rstrip('/')
+    api.backoff_base = 0.01
+    await api.init_session()
+    try:
+        yield api, stand_in
+    finally:
+        await api.close()
+        await server.close()
+
+
+def sample_product(api, images=()):
+    product = api.convert_amazon_to_naver_product({'title': 'Brand Vitamin C Serum', 'price_usd': 19.99})
+    product.images = list(images)
+    return product
+
+
+async def disconnect(request):
+    """요청을 받은 뒤 응답 없이 연결 종료 (서버가 처리했는지 알 수 없는 경우)"""
+    request.transport.close()
+    await asyncio.sleep(1)
+
+
+async def echo_image_upload(request):
+    """업로드된 이미지 내용을 그대로 담은 네이버 이미지 URL 반환"""
+    form = await request.post()
+    content = form['image'].file.read()
+    return web.json_response({'imageUrl': f"https://shop-phinf.example/{content.decode()}"})
+
+
+class ImageHost:
+    """이미지 원본 서버 대역 - 응답 지연 중 동시에 처리한 요청 수를 기록"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    def image(self, content: bytes):
+        async def respond(request):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            try:
+                await asyncio.sleep(self.delay)
+                return web.Response(body=content, content_type='image/jpeg')
+            finally:
+                self.active -= 1
+        return respond
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.parametrize('first_response', [
+    (503, {'message': 'unavailable'}, {}),
+    (500, {'message': 'error'}, {}),
+    disconnect,
+])
+def test_register_product_is_not_retried_after_ambiguous_failure(tmp_path, first_response):
+    async def scenario():
+        async with stand_in_api(tmp_path) as (api, stand_in):
+            stand_in.set(REGISTER_PATH, first_response, (200, {'originProductId': 1}, {}))
+            product_id = await api.register_product(sample_product(api))
+            return product_id, stand_in.count(REGISTER_PATH)
+
+    product_id, attempts = asyncio.run(scenario())
+    assert product_id is None
+    assert attempts == 1
+
+
+def test_register_product_retries_rate_limit(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path) as (api, stand_in):
+            stand_in.set(REGISTER_PATH, (429, {'message': 'slow down'}, {'Retry-After': '0'}),
+                         (200, {'originProductId': 7}, {}))
+            product_id = await api.register_product(sample_product(api))
+            return product_id, stand_in.count(REGISTER_PATH)
+
+    assert asyncio.run(scenario()) == (7, 2)
+
+
+def test_register_product_retries_connection_failure_before_sending(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path, max_retries=2) as (api, stand_in):
+            await api.ensure_token()
+            api.base_url = f'http://127.0.0.1:{unused_port()}'
+            attempts = []
+            backoff = api._backoff_delay
+            api._backoff_delay = lambda attempt: attempts.append(attempt) or backoff(attempt)
+            product_id = await api.register_product(sample_product(api))
+            return product_id, attempts
+
+    product_id, attempts = asyncio.run(scenario())
+    assert product_id is None
+    assert attempts == [0, 1]
+
+
+def test_idempotent_requests_still_retry_server_errors(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path) as (api, stand_in):
+            stand_in.set('/data', (503, {'message': 'unavailable'}, {}), (200, {'ok': True}, {}))
+            result = await api._request('GET', f'{api.base_url}/data', lambda: {})
+            return result, stand_in.count('/data')
+
+    assert asyncio.run(scenario()) == ((200, {'ok': True}), 2)
+
+
+def test_token_cache_file_is_never_readable_by_others(tmp_path, monkeypatch):
+    cache_file = tmp_path / 'naver_token_cache.json'
+    created_modes = []
+    real_open = os.open
+
+    def recording_open(path, flags, mode=0o777, *args, **kwargs):
+        fd = real_open(path, flags, mode, *args, **kwargs)
+        created_modes.append(stat.S_IMODE(os.fstat(fd).st_mode))
+        return fd
+
+    old_umask = os.umask(0)
+    try:
+        monkeypatch.setattr(os, 'open', recording_open)
+        cache = TokenCache(str(cache_file))
+        cache.store('token-1', 3600, 'client-id')
+        cache.store('token-2', 3600, 'client-id')
+    finally:
+        os.umask(old_umask)
+
+    # umask가 0이어도 파일은 생성 시점부터 소유자만 읽기/쓰기 가능
+    assert created_modes == [0o600, 0o600]
+    assert stat.S_IMODE(os.stat(cache_file).st_mode) == 0o600
+    assert sorted(os.listdir(tmp_path)) == ['naver_token_cache.json']
+    loaded = TokenCache(str(cache_file))
+    assert loaded.load('client-id') and loaded.access_token == 'token-2'
+
+
+def test_upload_images_keeps_order_when_one_image_fails(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path, max_concurrent_images=4) as (api, stand_in):
+            host = ImageHost()
+            stand_in.set(IMAGE_UPLOAD_PATH, echo_image_upload)
+            for name in ('a', 'b', 'd'):
+                stand_in.set(f'/images/{name}.jpg', host.image(name.encode()))
+            stand_in.set('/images/c.jpg', (404, {'message': 'gone'}, {}))
+            urls = [f'{api.base_url}/images/{name}.jpg' for name in 'abcd']
+            uploaded, failed = await api.upload_images(urls)
+            return urls, uploaded, failed, host.max_active
+
+    urls, uploaded, failed, max_active = asyncio.run(scenario())
+    assert uploaded == ['https://shop-phinf.example/a', 'https://shop-phinf.example/b',
+                        'https://shop-phinf.example/d']
+    assert [entry['image_url'] for entry in failed] == [urls[2]]
+    # 이미지 다운로드는 동시에 진행
+    assert max_active > 1
+
+
+def test_register_product_sends_uploaded_images_in_original_order(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path) as (api, stand_in):
+            host = ImageHost()
+            registered = {}
+
+            async def register(request):
+                registered.update(await request.json())
+                return web.json_response({'originProductId': 11})
+
+            stand_in.set(IMAGE_UPLOAD_PATH, echo_image_upload)
+            stand_in.set(REGISTER_PATH, register)
+            for name in ('main', 'side'):
+                stand_in.set(f'/images/{name}.jpg', host.image(name.encode()))
+            stand_in.set('/images/broken.jpg', (500, {'message': 'error'}, {}))
+            product = sample_product(api, [f'{api.base_url}/images/{name}.jpg' for name in ('main', 'broken', 'side')])
+            product_id = await api.register_product(product)
+            return product_id, registered['originProduct']['images'], product.failed_images
+
+    product_id, images, failed = asyncio.run(scenario())
+    assert product_id == 11
+    assert images == [{'url': 'https://shop-phinf.example/main'}, {'url': 'https://shop-phinf.example/side'}]
+    assert [entry['image_url'].rsplit('/', 1)[1] for entry in failed] == ['broken.jpg']
+
+
+def test_batch_register_uses_bounded_workers_and_keeps_input_order(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path, max_concurrent_registrations=3) as (api, stand_in):
+            state = {'active': 0, 'max_active': 0}
+
+            async def register(request):
+                payload = await request.json()
+                name = payload['originProduct']['name']
+                state['active'] += 1
+                state['max_active'] = max(state['max_active'], state['active'])
+                try:
+                    # 앞 상품일수록 늦게 끝나도록 지연
+                    index = int(name.rsplit(' ', 1)[1])
+                    await asyncio.sleep(0.02 * (8 - index))
+                finally:
+                    state['active'] -= 1
+                if index == 4:
+                    return web.json_response({'message': 'invalid'}, status=400)
+                return web.json_response({'originProductId': 100 + index})
+
+            stand_in.set(REGISTER_PATH, register)
+            products = [{'title': f'Brand Serum {index}', 'price_usd': 10.0} for index in range(8)]
+            results = await api.batch_register_products(products)
+            return results, state['max_active'], stand_in.count(TOKEN_PATH)
+
+    results, max_active, token_requests = asyncio.run(scenario())
+    assert (results['total'], results['success'], results['failed']) == (8, 7, 1)
+    assert [entry['product_id'] for entry in results['success_products']] == [100, 101, 102, 103, 105, 106, 107]
+    assert [entry['product_name'] for entry in results['failed_products']] == ['Brand Serum 4']
+    assert max_active == 3
+    assert token_requests == 1
+    assert set(results['latency']) == {'avg', 'p50', 'p95', 'max'}
+
+
+def test_retry_after_pauses_all_requests_and_rate_recovers(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path, requests_per_second=50.0) as (api, stand_in):
+            arrivals = []
+
+            def timed(response):
+                async def respond(request):
+                    arrivals.append((request.path, time.monotonic()))
+                    await request.read()
+                    status, body, headers = response
+                    return web.json_response(body, status=status, headers=headers)
+                return respond
+
+            stand_in.set('/limited', timed((429, {'message': 'slow down'}, {'Retry-After': '0.3'})),
+                         timed((200, {'ok': True}, {})))
+            stand_in.set('/other', timed((200, {'ok': True}, {})))
+            limiter = api.rate_limiter
+
+            async def other_request():
+                # 첫 요청이 429를 받은 뒤에 시작하는 다른 요청도 Retry-After 동안 대기
+                while not arrivals:
+                    await asyncio.sleep(0.005)
+                await asyncio.sleep(0.02)
+                return await api._request('GET', f'{api.base_url}/other', lambda: {})
+
+            first, other = await asyncio.gather(
+                api._request('GET', f'{api.base_url}/limited', lambda: {}), other_request())
+            throttled_rate = limiter.rate
+
+            for _ in range(10):
+                await api._request('GET', f'{api.base_url}/other', lambda: {})
+            return first, other, arrivals, throttled_rate, limiter.rate
+
+    first, other, arrivals, throttled_rate, recovered_rate = asyncio.run(scenario())
+    assert first == (200, {'ok': True}) and other == (200, {'ok': True})
+    throttled_at = arrivals[0][1]
+    assert [path for path, _ in arrivals[:3]].count('/limited') == 2
+    assert all(at - throttled_at >= 0.3 for _, at in arrivals[1:])
+    # 429 후 절반으로 줄고 (재시도/다른 요청 성공 2회만큼 증가), 성공 응답마다 조금씩 늘어 최대 속도로 회복 (AIMD)
+    assert throttled_rate == 50.0 * 0.5 + 2 * 2.5
+    assert recovered_rate == 50.0
+
+
+def test_rate_limiter_decreases_multiplicatively_and_increases_additively():
+    from naver_smartstore_api import AdaptiveRateLimiter
+
+    async def scenario():
+        limiter = AdaptiveRateLimiter(10.0)
+        limiter.on_throttle()
+        after_throttle = limiter.rate
+        limiter.on_throttle()
+        after_second = limiter.rate
+        steps = []
+        while limiter.rate < limiter.max_rate:
+            limiter.on_success()
+            steps.append(limiter.rate)
+        return after_throttle, after_second, steps
+
+    after_throttle, after_second, steps = asyncio.run(scenario())
+    assert (after_throttle, after_second) == (5.0, 2.5)
+    assert steps == [3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0]
+
+
+def slow_token(tokens, delay=0.1):
+    """호출마다 다음 토큰을 지연 후 발급"""
+    async def respond(request):
+        await request.read()
+        await asyncio.sleep(delay)
+        return web.json_response({'access_token': tokens.pop(0), 'expires_in': 10800})
+    return respond
+
+
+async def record_authorization(seen, request):
+    seen.append(request.headers.get('Authorization'))
+    return web.json_response({'ok': True})
+
+
+def authorized_get(api, path):
+    return api._request('GET', f'{api.base_url}{path}', lambda: {'headers': api._get_headers('GET', path)},
+                        authorized=True)
+
+
+def test_concurrent_requests_share_one_token_request(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path) as (api, stand_in):
+            seen = []
+            stand_in.set(TOKEN_PATH, slow_token(['token-1', 'token-2']))
+            stand_in.set('/data', lambda request: record_authorization(seen, request))
+            await asyncio.gather(*(authorized_get(api, '/data') for _ in range(20)))
+            return stand_in.count(TOKEN_PATH), seen
+
+    token_requests, seen = asyncio.run(scenario())
+    assert token_requests == 1
+    assert seen == ['Bearer token-1'] * 20
+
+
+def test_expiring_token_is_refreshed_once_in_background(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path) as (api, stand_in):
+            seen = []
+            stand_in.set(TOKEN_PATH, slow_token(['token-new', 'token-extra'], delay=0.2))
+            stand_in.set('/data', lambda request: record_authorization(seen, request))
+            # 만료 5분 전 토큰 (갱신 여유 10분 이내) - 요청은 기존 토큰으로 바로 진행
+            api.token_cache.store('token-old', 300, api.client_id)
+            api.access_token = 'token-old'
+
+            await asyncio.gather(*(authorized_get(api, '/data') for _ in range(10)))
+            before_refresh = list(seen)
+            await api._refresh_task
+            await authorized_get(api, '/data')
+            return stand_in.count(TOKEN_PATH), before_refresh, seen[-1]
+
+    token_requests, before_refresh, after_refresh = asyncio.run(scenario())
+    assert token_requests == 1
+    assert before_refresh == ['Bearer token-old'] * 10
+    assert after_refresh == 'Bearer token-new'
+
+
+def test_token_cache_file_skips_authentication_on_next_start(tmp_path):
+    cache_file = str(tmp_path / 'naver_token_cache.json')
+
+    async def scenario():
+        counts = []
+        for _ in range(2):
+            async with stand_in_api(tmp_path, token_cache_file=cache_file) as (api, stand_in):
+                seen = []
+                stand_in.set('/data', lambda request: record_authorization(seen, request))
+                await authorized_get(api, '/data')
+                counts.append((stand_in.count(TOKEN_PATH), seen))
+        return counts
+
+    assert asyncio.run(scenario()) == [(1, ['Bearer token-1']), (0, ['Bearer token-1'])]
+
+
+def test_image_cache_skips_repeat_downloads_and_uploads(tmp_path):
+    image_cache_file = str(tmp_path / 'naver_image_cache.db')
+    port = unused_port()
+
+    async def run_client(paths):
+        async with stand_in_api(tmp_path, port=port, image_cache_file=image_cache_file) as (api, stand_in):
+            host = ImageHost()
+            stand_in.set(IMAGE_UPLOAD_PATH, echo_image_upload)
+            stand_in.set('/images/a.jpg', host.image(b'same-content'))
+            stand_in.set('/images/mirror-of-a.jpg', host.image(b'same-content'))
+            uploaded, failed = await api.upload_images([f'{api.base_url}{path}' for path in paths])
+            downloads = {path: stand_in.count(path) for path in set(paths)}
+            return uploaded, failed, downloads, stand_in.count(IMAGE_UPLOAD_PATH)
+
+    async def scenario():
+        # 1회차: 같은 URL이 동시에 두 번 나와도 다운로드/업로드는 한 번
+        first = await run_client(['/images/a.jpg', '/images/a.jpg'])
+        # 2회차 (새 클라이언트, 같은 캐시 파일): 같은 URL은 다운로드 없이, 내용이 같은 다른 URL은 업로드 없이 재사용
+        second = await run_client(['/images/a.jpg', '/images/mirror-of-a.jpg'])
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    cached_url = 'https://shop-phinf.example/same-content'
+    assert first == ([cached_url, cached_url], [], {'/images/a.jpg': 1}, 1)
+    assert second == ([cached_url, cached_url], [], {'/images/a.jpg': 0, '/images/mirror-of-a.jpg': 1}, 0)
+
+
+def chunked_image(content: bytes, chunk_size: int = 16 * 1024):
+    """Content-Length 없이 청크 전송하는 이미지 응답"""
+    async def respond(request):
+        response = web.StreamResponse(headers={'Content-Type': 'image/jpeg'})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for start in range(0, len(content), chunk_size):
+            await response.write(content[start:start + chunk_size])
+        await response.write_eof()
+        return response
+    return respond
+
+
+def test_oversized_images_are_rejected_and_large_ones_spooled(tmp_path):
+    async def scenario():
+        async with stand_in_api(tmp_path, max_image_bytes=100_000, image_spool_bytes=8_000) as (api, stand_in):
+            uploads = []
+
+            async def record_upload(request):
+                form = await request.post()
+                content = form['image'].file.read()
+                uploads.append(content)
+                return web.json_response({'imageUrl': f'https://shop-phinf.example/{len(uploads)}'})
+
+            large = os.urandom(60_000)
+            stand_in.set(IMAGE_UPLOAD_PATH, record_upload)
+            stand_in.set('/images/declared-too-big.jpg', (200, b'x' * 150_000, {'Content-Type': 'image/jpeg'}))
+            stand_in.set('/images/streamed-too-big.jpg', chunked_image(b'y' * 150_000))
+            stand_in.set('/images/large.jpg', chunked_image(large))
+            urls = [f'{api.base_url}/images/{name}.jpg' for name in ('declared-too-big', 'streamed-too-big', 'large')]
+            uploaded, failed = await api.upload_images(urls)
+            return uploaded, failed, uploads, large
+
+    uploaded, failed, uploads, large = asyncio.run(scenario())
+    # 크기 제한(Content-Length 또는 받은 바이트 수)을 넘는 이미지는 업로드하지 않음
+    assert [entry['image_url'].rsplit('/', 1)[1] for entry in failed] == ['declared-too-big.jpg', 'streamed-too-big.jpg']
+    # 메모리 보관 한도를 넘는 이미지는 임시 파일을 거쳐 그대로 전송
+    assert uploaded == ['https://shop-phinf.example/1']
+    assert uploads == [large]
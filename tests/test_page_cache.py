@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""페이지 캐시 (로컬 대역 HTTP 서버로 조건부 재검증/LRU/오류 시 재사용 확인)"""
+
+import http.server
+import os
+import sqlite3
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+requests = pytest.importorskip('requests')
+
+from page_cache import PageCache  # noqa: E402
+
+
+class StandInServer:
+    """경로 접두어별 동작: /etag (ETag), /lm (Last-Modified), /nostore (no-store), 그 외 일반 응답"""
+
+    def __init__(self):
+        self.version = 1
+        self.requests = []
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                headers = {name: self.headers.get(name) for name in
+                           ('Accept-Language', 'If-None-Match', 'If-Modified-Since')}
+                server.requests.append((self.path, headers))
+                etag = f'"v{server.version}"'
+                last_modified = formatdate(1700000000 + server.version, usegmt=True)
+                if self.path.startswith('/etag') and headers['If-None-Match'] == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                if self.path.startswith('/lm') and headers['If-Modified-Since'] == last_modified:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = (f'<html>{self.path} {headers["Accept-Language"]} v{server.version} '.encode()
+                        + os.urandom(10000).hex().encode() + b'</html>')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                if self.path.startswith('/etag'):
+                    self.send_header('ETag', etag)
+                if self.path.startswith('/lm'):
+                    self.send_header('Last-Modified', last_modified)
+                if self.path.startswith('/nostore'):
+                    self.send_header('Cache-Control', 'no-store')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def shutdown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    stand_in = StandInServer()
+    yield stand_in
+    stand_in.shutdown()
+
+
+def expire(cache):
+    """저장된 페이지를 모두 유효 시간이 지난 상태로 만듦"""
+    with cache._lock:
+        cache.conn.execute("UPDATE pages SET fetched_at = fetched_at - ?", (cache.max_age + 1,))
+        cache.conn.commit()
+
+
+def test_fresh_hit_and_etag_revalidation(server, tmp_path):
+    cache = PageCache(str(tmp_path / 'pages.db'), max_age=3600)
+    url = server.base + '/etag/s?k=serum'
+
+    first = cache.fetch(url)
+    assert (first.source, first.status) == ('network', 200)
+    second = cache.fetch(url + '#results')
+    assert second.source == 'cache' and second.content == first.content
+    assert len(server.requests) == 1
+
+    expire(cache)
+    revalidated = cache.fetch(url)
+    assert revalidated.source == 'revalidated' and revalidated.content == first.content
+    assert server.requests[-1][1]['If-None-Match'] == '"v1"'
+    assert cache.fetch(url).source == 'cache'
+
+    server.version = 2
+    expire(cache)
+    changed = cache.fetch(url)
+    assert changed.source == 'network' and ' v2 ' in changed.text
+    assert cache.stats()['revalidated'] == 1
+
+
+def test_last_modified_locale_and_no_store(server, tmp_path):
+    cache = PageCache(str(tmp_path / 'pages.db'), max_age=3600)
+
+    cache.fetch(server.base + '/lm/item')
+    expire(cache)
+    assert cache.fetch(server.base + '/lm/item').source == 'revalidated'
+    assert server.requests[-1][1]['If-Modified-Since']
+
+    assert cache.fetch(server.base + '/lm/item', locale='ko-KR').source == 'network'
+    assert server.requests[-1][1]['Accept-Language'] == 'ko-KR'
+
+    cache.fetch(server.base + '/nostore')
+    assert cache.fetch(server.base + '/nostore').source == 'network'
+
+
+def test_lru_eviction_and_reopen(server, tmp_path):
+    path = str(tmp_path / 'lru.db')
+    cache = PageCache(path, max_age=3600, max_bytes=60000)
+    for i in range(5):
+        cache.fetch(server.base + f'/plain/{i}')
+        time.sleep(0.01)
+    cache.fetch(server.base + '/plain/0')  # 0번을 최근 사용으로
+    time.sleep(0.01)
+    cache.fetch(server.base + '/plain/5')
+
+    kept = {url.rsplit('/', 1)[1] for (url,) in sqlite3.connect(path).execute("SELECT url FROM pages")}
+    assert '0' in kept and '5' in kept and '1' not in kept
+    assert cache.stats()['bytes'] <= 60000
+    assert PageCache(path, max_bytes=60000).stats()['bytes'] == cache.stats()['bytes']
+
+
+def test_stale_page_used_when_server_is_down(server, tmp_path):
+    cache = PageCache(str(tmp_path / 'pages.db'), max_age=3600, timeout=2)
+    url = server.base + '/etag/down'
+    cache.fetch(url)
+    server.shutdown()
+    expire(cache)
+    assert cache.fetch(url).source == 'stale'
+    with pytest.raises(requests.RequestException):
+        cache.fetch(server.base + '/etag/never-fetched')
+
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""calculate_korean_prices(벡터화)와 calculate_korean_price(스칼라) 결과 비교"""
+
+import logging
+import math
+import random
+
+import pytest
+
+from smartstore_uploader import SmartstoreUploader
+
+
+@pytest.fixture(scope='module')
+def uploader():
+    return SmartstoreUploader(enable_translation=False)
+
+
+def random_prices(count: int, rate: float, seed: int = 13):
+    """float/int/서식 문자열/잘못된 값/800원 반올림 경계 값이 섞인 가격 목록"""
+    rng = random.Random(seed)
+    junk = [None, '', 'N/A', 'abc', '$', '1.2.3', [], {}, '--5', 'nan', 'inf', '-inf', float('nan'),
+            float('inf'), float('-inf'), 0, '0', '$0.00', -3, '-1.5']
+    values = []
+    for _ in range(count):
+        kind = rng.randrange(7)
+        if kind == 0:
+            values.append(round(rng.uniform(0, 500), 2))
+        elif kind == 1:
+            values.append(rng.randint(-10, 2000))
+        elif kind == 2:
+            values.append(f"${rng.uniform(0, 20000):,.2f}")
+        elif kind == 3:
+            values.append(rng.choice(junk))
+        elif kind == 4:
+            # adjusted / 800 이 정확히 .5가 되는 가격 (round half to even 경계)
+            values.append((800 * rng.randint(0, 5000) + 400) / (rate * 1.6))
+        elif kind == 5:
+            values.append(10 ** rng.uniform(-4, 20))
+        else:
+            values.append(rng.uniform(1e300, 1.7e308))
+    return values
+
+
+def scalar_outcome(uploader, value):
+    """(결과, 오류 여부) - 스칼라 함수는 일부 값에서 예외를 내거나 오류 로그 후 0을 반환한다"""
+    logger = logging.getLogger('smartstore_uploader')
+    errors = []
+    handler = logging.Handler()
+    handler.emit = errors.append
+    logger.addHandler(handler)
+    try:
+        result = uploader.calculate_korean_price(value)
+    except (OverflowError, ValueError):
+        return None, True
+    finally:
+        logger.removeHandler(handler)
+    return result, bool(errors)
+
+
+def test_vectorized_matches_scalar(uploader):
+    values = random_prices(20000, uploader.usd_to_krw)
+    prices = uploader.calculate_korean_prices(values)
+    assert len(prices) == len(values)
+
+    for value, price, masked in zip(values, prices.data, prices.mask):
+        result, failed = scalar_outcome(uploader, value)
+        if masked:
+            # 마스킹된 값은 스칼라 함수가 실패하거나 float64로 정확히 계산할 수 없는 값
+            assert failed or result >= 2 ** 53, repr(value)
+        else:
+            assert not failed, repr(value)
+            assert int(price) == result, repr(value)
+
+
+@pytest.mark.parametrize('value, expected', [
+    (10, 21600), ('$1,000.00', 2160000), ('12.99', 28000), (0, 0), (-5, 0), (0.0001, 1000),
+])
+def test_known_prices(uploader, value, expected):
+    assert uploader.calculate_korean_price(value) == expected
+    assert int(uploader.calculate_korean_prices([value])[0]) == expected
+
+
+def test_unparseable_values_are_masked(uploader):
+    prices = uploader.calculate_korean_prices([None, 'abc', float('nan'), float('inf'), 1e300])
+    assert prices.mask.all()
+    assert not math.isnan(float(prices.data.sum()))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""상품 중복 인덱스 (ASIN/정규화 URL 키, 수집 기록)"""
+
+import pytest
+
+from product_index import ProductIndex, canonical_product_key, drop_duplicate_products
+
+
+@pytest.mark.parametrize('product, key', [
+    ({'asin': 'b000000001'}, 'asin:B000000001'),
+    ({'product_url': 'https://www.amazon.com/Some-Serum/dp/B000000002/ref=sr_1_1?keywords=x'}, 'asin:B000000002'),
+    ({'url': 'https://WWW.Amazon.com/gp/product/B000000003'}, 'asin:B000000003'),
+    ({'url': 'https://www.amazon.com/stores/page/ABC/ref=x?y=1#z'}, 'url:amazon.com/stores/page/ABC'),
+    ({'asin': float('nan'), 'title': 'no key'}, None),
+    ('not a product', None),
+])
+def test_canonical_product_key(product, key):
+    assert canonical_product_key(product) == key
+
+
+def test_drop_duplicates_across_batches():
+    seen = set()
+    first = drop_duplicate_products([{'asin': 'B000000001'}, {'title': 'no key'}, {'asin': 'B000000001'}], seen)
+    second = drop_duplicate_products([{'url': 'https://amazon.com/dp/B000000001'}, {'asin': 'B000000002'}], seen)
+    assert first == [{'asin': 'B000000001'}, {'title': 'no key'}]
+    assert second == [{'asin': 'B000000002'}]
+
+
+def test_record_counts_new_and_changed_products(tmp_path):
+    index = ProductIndex(str(tmp_path / 'index.db'))
+    products = [{'asin': 'B000000001', 'title': 'A', 'price_usd': '1'}, {'asin': 'B000000002', 'title': 'B'}]
+    assert index.record(products) == {'new': 2, 'changed': 0, 'unchanged': 0}
+
+    products[0] = dict(products[0], price_usd='2')
+    assert index.record(products) == {'new': 0, 'changed': 1, 'unchanged': 1}
+    index.close()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""write-only 스트리밍 업로드 파일과 일반 Workbook 업로드 파일 비교"""
+
+import random
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from smartstore_uploader import REFERENCE_COLUMNS, UPLOAD_COLUMNS, SmartstoreUploader
+
+# 네이버 스마트스토어 일괄등록 템플릿 헤더 (변환기 도입 당시 create_upload_file 컬럼 그대로)
+SMARTSTORE_TEMPLATE_HEADERS = [
+    '판매자상품코드', '카테고리코드', '상품명', '상품상태', '판매가', '부가세', '재고수량', '최종카테고리선택', '구매평노출여부', '상품문의노출여부',
+    '리뷰작성가능여부', '판매상태', '전시상태', '성인인증', '청소년이용불가', '옵션형태', '옵션명', '옵션값', '옵션가', '옵션재고수량', '직접입력옵션',
+    '추가상품명', '추가상품값', '추가상품가', '추가상품재고수량', '대표이미지', '추가이미지', '상세설명', '브랜드', '제조사', '제조일자', '유효일자',
+    '원산지코드', '수입사', '복수원산지여부', '원산지직접입력', '미성년자구매여부', '배송비템플릿코드', '배송방법', '기본배송비', '배송비유형',
+    '배송비결제방식', '출고지', '배송업체', '배송기간', '조건부무료상품판매가합계', '수량별부과수량', '구간별2구간수량', '구간별3구간수량',
+    '구간별3구간배송비', '구간별추가배송비', '반품배송비', '교환배송비', '지역별차등배송비', '별도설치비', '상품정보제공고시템플릿코드', '상품정보제공고시품명',
+    '상품정보제공고시모델명', '상품정보제공고시인증허가사항', '상품정보제공고시제조자', '상품정보제공고시제조국', '상품정보제공고시사용기한', '상품정보제공고시사용법',
+    '상품정보제공고시주의사항', 'AS템플릿코드', 'AS담당자명', 'AS전화번호', 'AS안내', '판매자특이사항', '즉시할인값기본할인', '즉시할인단위기본할인',
+    '모바일즉시할인값', '모바일즉시할인단위', '복수구매할인조건값', '복수구매할인조건단위', '복수구매할인값', '복수구매할인단위', '상품구매시포인트지급값',
+    '상품구매시포인트지급단위', '텍스트리뷰작성시지급포인트', '포토동영상리뷰작성시지급포인트', '한달사용텍스트리뷰작성시지급포인트', '한달사용포토동영상리뷰작성시지급포인트',
+    '가전효율등급', '효율등급인증기관', '케어라벨인증유형', '상품정보제공고시색상', '상품정보제공고시소재', '상품정보제공고시사이즈', '상품정보제공고시동백사이즈',
+    '상품정보제공고시동백노출', '상품정보제공고시수리방법', '사이즈상품군', '사이즈사이즈명', '사이즈상세사이즈', '사이즈모델명',
+]
+
+# 참고용 파일 헤더 (업로드 DataFrame 컬럼 이름 그대로)
+REFERENCE_HEADERS = [
+    '카테고리코드', '상품명', '판매가', '재고수량', 'AS전화번호', '상품설명_참고', '아마존평점',
+    '아마존리뷰수', '아마존USD가격', '아마존원본제목', '이미지URL', '브랜드_참고', '수집일시',
+]
+
+
+def sample_upload_dataframe(rows: int, seed: int = 11) -> pd.DataFrame:
+    """업로드/참고용 컬럼을 모두 가진 임의 DataFrame (이모지, 제어 문자, 숫자, 빈 값 포함)"""
+    rng = random.Random(seed)
+    words = ['Cream', '세럼', 'Serum™', '\U0001F600', '✨', '50ml', 'a\x0bb', '  ', '택배', 'N']
+    columns = list(dict.fromkeys(UPLOAD_COLUMNS + REFERENCE_COLUMNS))
+    data = {}
+    for col_idx, column in enumerate(columns):
+        values = []
+        for row in range(rows):
+            kind = (row + col_idx) % 4
+            if kind == 0:
+                values.append(rng.randint(0, 10 ** 6))
+            elif kind == 1:
+                values.append(None)
+            else:
+                values.append(' '.join(rng.choice(words) for _ in range(rng.randint(1, 6))))
+        data[column] = values
+    return pd.DataFrame(data, columns=columns)
+
+
+def read_sheet(path):
+    wb = load_workbook(path)
+    ws = wb.active
+    header = ws[1]
+    return {
+        'title': ws.title,
+        'values': [list(row) for row in ws.iter_rows(values_only=True)],
+        'fonts': [(cell.font.name, cell.font.size, cell.font.bold) for cell in header],
+        'fills': [(cell.fill.fill_type, cell.fill.start_color.rgb) for cell in header],
+        'alignment': [(cell.alignment.horizontal, cell.alignment.wrap_text) for cell in header],
+        'widths': {key: dim.width for key, dim in ws.column_dimensions.items()},
+    }
+
+
+def test_streaming_matches_standard_workbook(tmp_path):
+    uploader = SmartstoreUploader(enable_translation=False)
+    df = sample_upload_dataframe(300)
+
+    streaming_path = uploader.create_upload_file(df, str(tmp_path / 'streaming.xlsx'), streaming=True)
+    standard_path = uploader.create_upload_file(df, str(tmp_path / 'standard.xlsx'), streaming=False)
+    assert streaming_path and standard_path
+
+    streaming = read_sheet(streaming_path)
+    standard = read_sheet(standard_path)
+    assert streaming == standard
+    assert len(streaming['values']) == len(df) + 1
+    assert streaming['values'][0] == UPLOAD_COLUMNS
+
+
+def test_exported_headers_match_smartstore_template(tmp_path):
+    uploader = SmartstoreUploader(enable_translation=False)
+    df = sample_upload_dataframe(5)
+
+    for streaming in (True, False):
+        path = uploader.create_upload_file(df, str(tmp_path / f'upload_{streaming}.xlsx'), streaming=streaming)
+        assert read_sheet(path)['values'][0] == SMARTSTORE_TEMPLATE_HEADERS
+        # 참고용 파일도 생성되고, 업로드 시트와 같은 'AS전화번호' 컬럼 이름을 사용
+        reference_path = path.replace('.xlsx', '_참고용.xlsx')
+        assert read_sheet(reference_path)['values'][0] == REFERENCE_HEADERS
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""번역/변환 캐시가 실행 폴더가 아닌 사용자별 캐시 폴더에, 처음 사용할 때만 생성되는지 확인"""
+
+import os
+import stat
+
+from conversion_cache import ConversionCache
+from naver_smartstore_api import NaverSmartStoreAPI
+from translation_cache import TranslationCache, get_translation_cache
+
+
+def test_default_caches_live_in_private_user_cache_dir(tmp_path, monkeypatch, isolated_cache_dir):
+    monkeypatch.chdir(tmp_path)
+    translation_cache = TranslationCache()
+    conversion_cache = ConversionCache()
+
+    assert os.path.dirname(translation_cache.db_path) == str(isolated_cache_dir)
+    assert os.path.dirname(conversion_cache.db_path) == str(isolated_cache_dir)
+    assert stat.S_IMODE(os.stat(isolated_cache_dir).st_mode) == 0o700
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.db')]
+    translation_cache.close()
+    conversion_cache.close()
+
+
+def test_naver_api_opens_translation_cache_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache_file = tmp_path / 'translations.db'
+    api = NaverSmartStoreAPI('id', 'secret', 'customer', translation_cache_file=str(cache_file))
+    assert not cache_file.exists()
+    assert os.listdir(tmp_path) == []
+
+    assert api.translation_cache is get_translation_cache(str(cache_file))
+    assert cache_file.exists()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""workflow_pipeline 크롤링 묶음/생산자 종료 동작 (가짜 크롤러 모듈 사용)"""
+
+import sys
+import threading
+import types
+
+import pandas as pd
+import pytest
+
+import workflow_pipeline
+from workflow_pipeline import WorkflowPipeline, split_by_keyword, validate_settings
+
+
+class FakeCrawler:
+    """crawl_all_keywords 호출 = 브라우저 세션 하나로 보는 가짜 크롤러"""
+
+    instances = []
+    sessions = []
+
+    def __init__(self, config_path):
+        self.search_keywords = []
+        self.closed = False
+        FakeCrawler.instances.append(self)
+
+    def crawl_all_keywords(self):
+        FakeCrawler.sessions.append(list(self.search_keywords))
+        products = []
+        for keyword in self.search_keywords:
+            number = int(keyword[2:])
+            for i in range(2):
+                products.append({'asin': f'B{number:04d}{i:05d}', 'title': f'Brand {keyword} item {i}',
+                                 'price_usd': '9.99', 'search_keyword': keyword})
+        return products
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_crawler(monkeypatch, tmp_path):
+    FakeCrawler.instances = []
+    FakeCrawler.sessions = []
+    module = types.ModuleType('amazon_crawler_selenium_improved')
+    module.ImprovedAmazonCrawler = FakeCrawler
+    monkeypatch.setitem(sys.modules, 'amazon_crawler_selenium_improved', module)
+    monkeypatch.chdir(tmp_path)
+    return FakeCrawler
+
+
+def make_pipeline(keywords, **settings):
+    return WorkflowPipeline({'search_keywords': keywords, 'crawl_delay': 1, 'enable_translation': False,
+                             'incremental_conversion': False, **settings}, log=lambda message: None)
+
+
+def test_single_worker_batches_keywords_per_session(fake_crawler):
+    keywords = [f'kw{i}' for i in range(7)]
+    pipeline = make_pipeline(keywords, keywords_per_session=3)
+
+    batches = list(pipeline.iter_keyword_batches(threading.Event()))
+
+    assert [keyword for keyword, _ in batches] == keywords
+    assert all(len(products) == 2 for _, products in batches)
+    assert fake_crawler.sessions == [keywords[0:3], keywords[3:6], keywords[6:7]]
+    assert len(fake_crawler.instances) == 1
+    assert fake_crawler.instances[0].closed
+
+
+def test_parallel_crawlers_are_closed(fake_crawler):
+    keywords = [f'kw{i}' for i in range(6)]
+    pipeline = make_pipeline(keywords, crawler_workers=3, crawl_delay=0)
+
+    batches = list(pipeline.iter_keyword_batches(threading.Event()))
+
+    assert [keyword for keyword, _ in batches] == keywords
+    assert 1 <= len(fake_crawler.instances) <= 3
+    assert all(crawler.closed for crawler in fake_crawler.instances)
+
+
+def test_crawler_workers_validated_with_crawl_settings():
+    settings = dict(workflow_pipeline.DEFAULT_SETTINGS, search_keywords=['serum'], crawler_workers=99)
+    with pytest.raises(ValueError):
+        validate_settings(settings, crawling=True, conversion=False)
+    validate_settings(settings, crawling=False, conversion=True)
+
+
+def test_parallel_groups_give_every_worker_work(fake_crawler):
+    pipeline = make_pipeline([f'kw{i}' for i in range(6)], keywords_per_session=5, crawler_workers=3)
+    assert pipeline.keyword_groups(pipeline.settings['search_keywords'], 3) == [
+        ['kw0', 'kw1'], ['kw2', 'kw3'], ['kw4', 'kw5']
+    ]
+
+
+def test_split_by_keyword_keeps_unknown_products():
+    products = [{'search_keyword': 'b', 'asin': '1'}, {'keyword': 'a', 'asin': '2'}, {'asin': '3'}]
+    assert split_by_keyword(products, ['a', 'b']) == [
+        ('a', [products[1]]), ('b', [products[0]]), ('a, b', [products[2]])
+    ]
+
+
+def test_consumer_failure_stops_and_joins_producer(fake_crawler, monkeypatch):
+    pipeline = make_pipeline([f'kw{i}' for i in range(20)], keywords_per_session=1)
+    threads_before = set(threading.enumerate())
+
+    from smartstore_uploader import SmartstoreUploader
+
+    def failing_convert(self, batch, start_index=1):
+        raise RuntimeError("변환 실패")
+
+    monkeypatch.setattr(SmartstoreUploader, 'convert_parallel', failing_convert)
+
+    assert pipeline.run_pipelined() is False
+    assert not [thread for thread in threading.enumerate() if thread not in threads_before]
+    # 변환이 실패한 뒤에는 남은 키워드를 계속 크롤링하지 않음 (큐 크기 + 진행 중 묶음까지만)
+    assert len(fake_crawler.sessions) <= workflow_pipeline.PIPELINE_QUEUE_SIZE + 2
+
+
+def test_pipelined_run_converts_all_keywords(fake_crawler, tmp_path):
+    keywords = [f'kw{i}' for i in range(4)]
+    pipeline = make_pipeline(keywords, keywords_per_session=2)
+    assert pipeline.run_pipelined(str(tmp_path / 'upload.xlsx')) is True
+    assert len(pipeline.crawled_products) == 8
+    assert fake_crawler.sessions == [keywords[0:2], keywords[2:4]]
+    assert len(pd.read_excel(tmp_path / 'upload.xlsx')) == 8
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+번역 캐시 모듈 (SQLite 기반 번역 메모리)
+NaverSmartStoreAPI(Papago)와 SmartstoreUploader(ProductTranslator)가 함께 사용
+
+(번역 종류, 원문 언어, 대상 언어, 정규화된 원문 해시) 단위로 번역 결과를 저장하여
+같은 상품명/설명을 다시 변환할 때 번역 호출을 생략한다.
+번역 종류(title/description/features)마다 번역 함수가 다르므로 같은 원문이라도 따로 저장한다.
+
+작성일: 2025년 8월 4일
+버전: v1.0
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional
+
+from cache_paths import default_cache_path
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 파일 이름 (사용자별 캐시 폴더 안, 두 모듈이 같은 파일을 공유)
+DEFAULT_CACHE_PATH = "translation_cache.db"
+
+# 번역 요청 1회당 최대 글자 수 (Papago 제한) 및 일괄 번역 문장 구분자
+TRANSLATION_CHAR_LIMIT = 5000
+BATCH_SEPARATOR = '\n'
+
+# 일괄 번역 문장 번호 표시 ("[1] 문장") - 번역 후 문장별 대응을 확인하는 데 사용
+BATCH_MARKER = '[{}] '
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_BATCH_LINE_RE = re.compile(r'^\s*[\[［](\d+)[\]］]\s*(.*)$')
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 원문 정규화 (유니코드 NFC + 공백 정리)"""
+    return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def text_hash(text: str) -> str:
+    """정규화된 원문의 SHA-256 해시"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def pack_translation_batches(texts: List[str], limit: int = TRANSLATION_CHAR_LIMIT) -> List[List[str]]:
+    """정규화된 한 줄 문장들을 글자 수 제한 내의 묶음으로 분할
+    
+    한 문장이 제한을 넘으면 일괄 번역 대상에서 제외한다 (개별 번역으로 처리).
+    """
+    batches = []
+    current = []
+    current_len = 0
+    for text in texts:
+        if len(text) > limit:
+            continue
+        added_len = len(BATCH_MARKER.format(len(current) + 1)) + len(text) + (len(BATCH_SEPARATOR) if current else 0)
+        if current and current_len + added_len > limit:
+            batches.append(current)
+            current = []
+            current_len = 0
+            added_len = len(BATCH_MARKER.format(1)) + len(text)
+        current.append(text)
+        current_len += added_len
+    if current:
+        batches.append(current)
+    return batches
+
+
+def join_translation_batch(batch: List[str]) -> str:
+    """묶음 문장들을 번호 표시를 붙여 한 요청 문자열로 결합"""
+    return BATCH_SEPARATOR.join(BATCH_MARKER.format(idx) + text for idx, text in enumerate(batch, 1))
+
+
+def split_translation_batch(translated: str, count: int) -> Optional[List[str]]:
+    """일괄 번역 결과를 문장별로 분리 (번호가 1..count 순서로 모두 맞지 않으면 None)"""
+    lines = [line for line in translated.split(BATCH_SEPARATOR) if line.strip()]
+    if len(lines) != count:
+        return None
+    results = []
+    for idx, line in enumerate(lines, 1):
+        match = _BATCH_LINE_RE.match(line)
+        if not match or int(match.group(1)) != idx or not match.group(2).strip():
+            return None
+        results.append(match.group(2).strip())
+    return results
+
+
+class TranslationCache:
+    """SQLite 번역 메모리 (스레드 안전)"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        """캐시 DB 초기화 (db_path가 없으면 사용자별 캐시 폴더의 기본 파일)"""
+        db_path = db_path or default_cache_path(DEFAULT_CACHE_PATH)
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._migrate()
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS translations (
+                kind TEXT NOT NULL,
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (kind, source, target, text_hash)
+            );
+        """)
+
+    def _migrate(self):
+        """번역 종류 컬럼이 없는 이전 형식 테이블 삭제
+        
+        이전 형식은 상품명/설명/특징 번역이 한 키를 공유해 어떤 번역 함수의 결과인지 알 수 없으므로
+        옮기지 않고 다시 번역하도록 비운다.
+        """
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(translations)")]
+        if columns and 'kind' not in columns:
+            entries = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            self.conn.execute("DROP TABLE translations")
+            self.conn.commit()
+            logger.info(f"이전 형식 번역 캐시 {entries}건 삭제 (번역 종류별 캐시로 변경)")
+
+    def get(self, text: str, kind: str, source: str = 'en', target: str = 'ko') -> Optional[str]:
+        """캐시된 번역 조회 (kind: 번역 종류, 없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT translated_text FROM translations "
+                "WHERE kind = ? AND source = ? AND target = ? AND text_hash = ?",
+                (kind, source, target, text_hash(text))
+            ).fetchone()
+            if row:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def contains(self, text: str, kind: str, source: str = 'en', target: str = 'ko') -> bool:
+        """캐시 보유 여부 확인 (적중 통계에 포함하지 않음)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM translations WHERE kind = ? AND source = ? AND target = ? AND text_hash = ?",
+                (kind, source, target, text_hash(text))
+            ).fetchone()
+        return row is not None
+
+    def set(self, text: str, translated_text: str, kind: str, source: str = 'en', target: str = 'ko'):
+        """번역 결과 저장"""
+        if not translated_text:
+            return
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(kind, source, target, text_hash, source_text, translated_text, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, source, target, text_hash(text), normalize_text(text), translated_text, time.time())
+            )
+            self.conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        """적중/미적중 통계"""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            'entries': entries
+        }
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self.conn.close()
+
+
+_shared_caches: Dict[str, TranslationCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_translation_cache(db_path: Optional[str] = None) -> TranslationCache:
+    """경로별 공유 번역 캐시 인스턴스 반환 (db_path가 없으면 사용자별 캐시 폴더의 기본 파일)"""
+    path = os.path.abspath(db_path or default_cache_path(DEFAULT_CACHE_PATH))
+    with _shared_lock:
+        if path not in _shared_caches:
+            _shared_caches[path] = TranslationCache(path)
+        return _shared_caches[path]
@@ -0,0 +1,680 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 → 변환 워크플로우 파이프라인 (GUI 없이 실행 가능)
+AmazonSmartstoreIntegrated GUI와 헤드리스 실행(서버, cron)이 같은 단계 구현을 공유
+
+tkinter를 임포트하지 않으며, 크롤러/업로더/아카이브 모듈은 해당 단계를 실행할 때만 로드한다.
+
+사용 예:
+    python workflow_pipeline.py                      # 크롤링 + 변환 (integrated_config.json)
+    python workflow_pipeline.py crawl --keywords "vitamin c serum" "yoga mat"
+    python workflow_pipeline.py convert --input crawl_archive --rows-per-file 500
+
+종료 코드: 0 성공, 1 단계 실패, 2 설정 오류, 130 사용자 중단
+
+작성일: 2025년 8월 6일
+버전: v1.0
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from crawl_archive import KEYWORD_FIELDS
+from product_index import DEFAULT_INDEX_PATH, drop_duplicate_products, get_product_index
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 통합 프로그램 설정 파일
+DEFAULT_CONFIG_FILE = 'integrated_config.json'
+
+# 종료 코드
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_CONFIG_ERROR = 2
+EXIT_INTERRUPTED = 130
+
+# GUI 기본값과 동일한 설정 기본값
+DEFAULT_SETTINGS = {
+    'search_keywords': [],
+    'products_per_keyword': 20,
+    'crawl_delay': 3,
+    'min_rating': 3.0,
+    'min_reviews': 10,
+    'margin_rate': 50,
+    'auto_convert': True,
+    'enable_translation': True,
+    'incremental_conversion': False,  # 변경된 상품만 다시 변환 (사용 시 conversion_cache.db 생성)
+    'translation_workers': 1,
+    'conversion_workers': 1,
+    'crawler_workers': 1,
+    'keywords_per_session': 5,
+    'rows_per_file': None,
+    'product_index_file': DEFAULT_INDEX_PATH
+}
+
+# 동시에 띄울 수 있는 크롤러(브라우저) 최대 수
+MAX_CRAWLER_WORKERS = 8
+
+
+# 크롤링 → 변환 사이에 대기할 수 있는 키워드 묶음 수 (메모리 상한)
+PIPELINE_QUEUE_SIZE = 2
+
+# 크롤링 종료 표시
+_END_OF_CRAWL = object()
+
+
+def load_pipeline_config(config_file: str = DEFAULT_CONFIG_FILE) -> Dict:
+    """설정 파일을 읽어 기본값과 합침 (파일이 없으면 기본값)"""
+    settings = dict(DEFAULT_SETTINGS)
+    if os.path.exists(config_file):
+        with open(config_file, 'r', encoding='utf-8') as f:
+            settings.update(json.load(f))
+    return settings
+
+
+def validate_settings(settings: Dict, crawling: bool = True, conversion: bool = True):
+    """설정 검증 (GUI validate_settings와 같은 범위, 잘못되면 ValueError)"""
+    try:
+        if crawling:
+            products_per_keyword = int(settings['products_per_keyword'])
+            crawl_delay = int(settings['crawl_delay'])
+            min_rating = float(settings['min_rating'])
+            min_reviews = int(settings['min_reviews'])
+
+            if products_per_keyword < 1 or products_per_keyword > 50:
+                raise ValueError("키워드당 상품 수는 1-50 사이여야 합니다.")
+            if crawl_delay < 1:
+                raise ValueError("요청 간격은 1초 이상이어야 합니다.")
+            if not (0 <= min_rating <= 5):
+                raise ValueError("최소 평점은 0-5 사이여야 합니다.")
+            if min_reviews < 0:
+                raise ValueError("최소 리뷰 수는 0 이상이어야 합니다.")
+            if not settings.get('search_keywords'):
+                raise ValueError("최소 하나의 검색 키워드가 필요합니다.")
+            if int(settings.get('keywords_per_session') or 1) < 1:
+                raise ValueError("크롤러 세션당 키워드 수는 1 이상이어야 합니다.")
+            crawler_workers = int(settings.get('crawler_workers') or 1)
+            if crawler_workers < 1 or crawler_workers > MAX_CRAWLER_WORKERS:
+                raise ValueError(f"동시 크롤러 수는 1-{MAX_CRAWLER_WORKERS} 사이여야 합니다.")
+        if conversion:
+            margin_rate = int(settings['margin_rate'])
+            if margin_rate < 10 or margin_rate > 200:
+                raise ValueError("마진율은 10% ~ 200% 사이여야 합니다.")
+            if settings.get('rows_per_file') is not None and int(settings['rows_per_file']) < 1:
+                raise ValueError("파일당 최대 행 수는 1 이상이어야 합니다.")
+    except (TypeError, KeyError) as e:
+        raise ValueError(f"설정 값이 올바르지 않습니다: {e}")
+
+
+def split_by_keyword(products: List[Dict], keywords: List[str]) -> List[Tuple[str, List[Dict]]]:
+    """여러 키워드를 한 번에 크롤링한 결과를 키워드별로 나눔 (키워드 순서 유지)
+
+    상품의 검색 키워드 필드로 나누며, 키워드를 알 수 없는 상품은 묶음 전체 이름으로 마지막에 둔다.
+    """
+    if len(keywords) == 1:
+        return [(keywords[0], products)]
+
+    groups: Dict[str, List[Dict]] = {keyword: [] for keyword in keywords}
+    unassigned = []
+    for product in products:
+        keyword = next((product[field] for field in KEYWORD_FIELDS if product.get(field)), None)
+        groups.get(keyword, unassigned).append(product)
+
+    result = list(groups.items())
+    if unassigned:
+        result.append((', '.join(keywords), unassigned))
+    return result
+
+
+def merge_crawl_results(batches: Iterable[List[Dict]]) -> List[Dict]:
+    """키워드별 크롤링 결과를 순서대로 합치고 중복 상품(같은 ASIN/정규화 URL)은 처음 것만 유지"""
+    seen = set()
+    merged = []
+    for products in batches:
+        merged.extend(drop_duplicate_products(products, seen))
+    return merged
+
+
+class DispatchGate:
+    """모든 크롤러 작업이 공유하는 키워드 시작 간격 제한 (정중한 크롤링 예산)
+
+    작업 수와 관계없이 키워드 크롤링 시작은 interval초에 한 번만 허용한다.
+    """
+
+    def __init__(self, interval: float):
+        """시작 간격(초) 설정"""
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self, stop: Optional[threading.Event] = None) -> bool:
+        """다음 시작 차례까지 대기 (중단되면 False)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay <= 0:
+            return not (stop and stop.is_set())
+        if stop is None:
+            time.sleep(delay)
+            return True
+        return not stop.wait(delay)
+
+
+def close_crawler(crawler):
+    """크롤러의 브라우저 세션 종료 (close/quit 메서드 또는 driver.quit, 실패는 로그만 남김)"""
+    try:
+        for name in ('close', 'quit'):
+            method = getattr(crawler, name, None)
+            if callable(method):
+                method()
+                return
+        driver = getattr(crawler, 'driver', None)
+        if driver is not None:
+            driver.quit()
+    except Exception as e:
+        logger.warning(f"크롤러 종료 실패: {e}")
+
+
+def _create_uploader(**kwargs):
+    """스마트스토어 업로더 생성 (상세페이지 이미지 포함 버전이 없으면 기본 업로더)"""
+    try:
+        from enhanced_smartstore_uploader import EnhancedSmartstoreUploader
+        return EnhancedSmartstoreUploader(**kwargs)
+    except ImportError:
+        from smartstore_uploader import SmartstoreUploader
+        return SmartstoreUploader(**kwargs)
+
+
+class WorkflowPipeline:
+    """크롤링 → 아카이브 저장 → 스마트스토어 변환 단계 실행기"""
+
+    def __init__(self, settings: Dict, log: Optional[Callable[[str], None]] = None):
+        """파이프라인 초기화 (log를 지정하면 진행 메시지를 그 함수로 전달)"""
+        self.settings = {**DEFAULT_SETTINGS, **settings}
+        self.log = log or logger.info
+
+        self.crawled_products: List[Dict] = []
+        self.latest_crawl_file: Optional[str] = None
+        self.latest_crawl_run: Optional[str] = None  # 아카이브 폴더 안의 크롤링 실행 ID
+        self.latest_smartstore_file: Optional[str] = None
+        self.latest_manifest_file: Optional[str] = None
+
+    @property
+    def crawler_workers(self) -> int:
+        """동시 크롤러 수 (키워드 수보다 많이 띄우지 않음)"""
+        workers = max(1, int(self.settings.get('crawler_workers') or 1))
+        return min(workers, MAX_CRAWLER_WORKERS, max(1, len(self.settings['search_keywords'])))
+
+    def keyword_groups(self, keywords: List[str], workers: int = 1) -> List[List[str]]:
+        """크롤러 세션(crawl_all_keywords 호출) 하나에 넘길 키워드 묶음
+
+        keywords_per_session개씩 묶어 브라우저를 키워드마다 다시 띄우지 않게 하되,
+        동시 크롤링이면 모든 크롤러가 일을 받을 수 있도록 묶음 크기를 줄인다.
+        """
+        size = max(1, int(self.settings.get('keywords_per_session') or 1))
+        if workers > 1:
+            size = min(size, max(1, -(-len(keywords) // workers)))
+        return [keywords[start:start + size] for start in range(0, len(keywords), size)]
+
+    def _write_crawler_config(self, delay_scale: int = 1) -> str:
+        """크롤러 설정을 실행마다 고유한 임시 파일에 저장 (크롤러는 설정 파일 경로를 받음)
+
+        delay_scale은 크롤러 작업 수이며, 각 크롤러의 요청 간격을 그만큼 늘려
+        전체 요청 빈도가 크롤러 하나일 때와 같도록 한다.
+        """
+        config = {
+            "crawler_settings": {
+                "max_products_per_keyword": int(self.settings['products_per_keyword']),
+                "min_rating": float(self.settings['min_rating']),
+                "min_reviews": int(self.settings['min_reviews']),
+                "crawl_delay": int(self.settings['crawl_delay']) * delay_scale
+            }
+        }
+        fd, config_path = tempfile.mkstemp(prefix='crawl_config_', suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
+        return config_path
+
+    def _save_archive(self, products: List[Dict]):
+        """크롤링 결과 저장 (수집일/키워드 파티션 Parquet 아카이브, pyarrow가 없으면 JSON)"""
+        from crawl_archive import DEFAULT_ARCHIVE_DIR, PARQUET_AVAILABLE, write_crawl_archive
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        saved_files = write_crawl_archive(products, DEFAULT_ARCHIVE_DIR, run_id=timestamp)
+
+        if PARQUET_AVAILABLE:
+            self.latest_crawl_file = DEFAULT_ARCHIVE_DIR
+            self.latest_crawl_run = timestamp
+            self.log(f"📁 크롤링 결과 저장: {DEFAULT_ARCHIVE_DIR} ({len(saved_files)}개 키워드 파티션)")
+        else:
+            self.latest_crawl_file = saved_files[0]
+            self.latest_crawl_run = None
+            self.log(f"📁 크롤링 결과 저장: {saved_files[0]}")
+
+    def _create_configured_uploader(self):
+        """설정(마진율, 번역/변환 작업 수, 증분 변환, 분할 행 수)을 적용한 업로더"""
+        uploader = _create_uploader(enable_translation=bool(self.settings['enable_translation']))
+        uploader.markup_percentage = int(self.settings['margin_rate'])
+        uploader.translation_workers = max(1, int(self.settings.get('translation_workers') or 1))
+        uploader.conversion_workers = max(1, int(self.settings.get('conversion_workers') or 1))
+        uploader.incremental = bool(self.settings['incremental_conversion'])
+        rows_per_file = self.settings.get('rows_per_file')
+        uploader.rows_per_file = int(rows_per_file) if rows_per_file else None
+
+        if uploader.incremental:
+            self.log("♻️ 증분 변환: 변경되지 않은 상품은 이전 변환 결과를 재사용합니다")
+        self.log(f"📊 마진율: {uploader.markup_percentage}%")
+        return uploader
+
+    def _report_output(self, output_path: Optional[str], uploader) -> bool:
+        """업로드 파일 생성 결과 기록"""
+        if not output_path or not os.path.exists(output_path):
+            self.log("❌ 스마트스토어 파일 생성에 실패했습니다.")
+            self.log("💡 가능한 원인: 데이터 품질 문제, 필수 필드 누락, 변환 오류")
+            return False
+
+        self.latest_smartstore_file = output_path
+        self.latest_manifest_file = getattr(uploader, 'last_manifest_path', None)
+        self.log("✅ 스마트스토어 업로드 파일 생성 성공!")
+        self.log(f"📁 파일 위치: {os.path.basename(output_path)}")
+        self.log("📋 네이버 스마트스토어 일괄등록에서 사용 가능한 Excel 파일입니다.")
+
+        if self.latest_manifest_file:
+            self.log(f"🗂️ 분할 파일 목록: {os.path.basename(self.latest_manifest_file)}")
+
+        # 참고용 파일 정보 추가
+        reference_file = output_path.replace('.xlsx', '_참고용.xlsx')
+        if os.path.exists(reference_file):
+            self.log(f"📊 참고용 상세 정보: {os.path.basename(reference_file)}")
+
+        return True
+
+    def _product_index(self):
+        """상품 중복 인덱스 (ASIN/정규화 URL별 마지막 수집 시각)"""
+        return get_product_index(self.settings.get('product_index_file'))
+
+    def _record_products(self, products: List[Dict]):
+        """수집한 상품을 중복 인덱스에 기록"""
+        try:
+            counts = self._product_index().record(products)
+        except Exception as e:
+            self.log(f"⚠️ 상품 인덱스 기록 실패: {e}")
+            return
+        self.log(f"📇 상품 인덱스: 신규 {counts['new']}개, 내용 변경 {counts['changed']}개, 동일 {counts['unchanged']}개")
+
+    def run_crawling(self) -> bool:
+        """아마존 크롤링 후 결과를 아카이브에 저장 (crawler_workers > 1이면 키워드를 나누어 동시 크롤링)"""
+        if self.crawler_workers > 1:
+            return self._run_sharded_crawling()
+
+        from amazon_crawler_selenium_improved import ImprovedAmazonCrawler
+
+        config_path = self._write_crawler_config()
+        try:
+            crawler = ImprovedAmazonCrawler(config_path)
+            crawler.search_keywords = list(self.settings['search_keywords'])
+
+            crawled = crawler.crawl_all_keywords()
+            if not crawled:
+                return False
+
+            # 여러 키워드에서 수집된 같은 상품은 하나만 유지
+            products = drop_duplicate_products(crawled)
+            if len(products) < len(crawled):
+                self.log(f"🧹 키워드 간 중복 상품 {len(crawled) - len(products)}개 제외")
+
+            self.crawled_products = products
+            self._record_products(products)
+            self._save_archive(products)
+            return True
+
+        except Exception as e:
+            self.log(f"❌ 크롤링 실행 오류: {e}")
+            return False
+        finally:
+            # 임시 파일 정리
+            try:
+                os.remove(config_path)
+            except OSError:
+                pass
+
+    def _run_sharded_crawling(self) -> bool:
+        """여러 크롤러로 키워드를 나누어 크롤링한 뒤 키워드 순서대로 합치고 중복 제거"""
+        stop = threading.Event()
+        batches = self.iter_keyword_batches(stop)
+        try:
+            collected = [products for _keyword, products in batches]
+            products = merge_crawl_results(collected)
+            if not products:
+                return False
+
+            duplicates = sum(len(batch) for batch in collected) - len(products)
+            if duplicates:
+                self.log(f"🧹 키워드 간 중복 상품 {duplicates}개 제외")
+
+            self.crawled_products = products
+            self._record_products(products)
+            self._save_archive(products)
+            return True
+
+        except Exception as e:
+            self.log(f"❌ 크롤링 실행 오류: {e}")
+            return False
+        finally:
+            stop.set()
+            batches.close()
+
+    def run_conversion(self, input_file: Optional[str] = None, output_file: Optional[str] = None) -> bool:
+        """크롤링 결과를 스마트스토어 업로드 파일로 변환"""
+        try:
+            input_file = input_file or self.latest_crawl_file
+            if not input_file:
+                self.log("❌ 크롤링 파일이 없습니다. 먼저 크롤링을 실행하세요.")
+                return False
+
+            if not os.path.exists(input_file):
+                self.log(f"❌ 크롤링 파일을 찾을 수 없습니다: {input_file}")
+                return False
+
+            self.log("🔄 스마트스토어 변환 시작...")
+
+            uploader = self._create_configured_uploader()
+            uploader.archive_run_id = self.latest_crawl_run if input_file == self.latest_crawl_file else None
+            output_path = uploader.convert_file(input_file=input_file, output_file=output_file)
+            return self._report_output(output_path, uploader)
+
+        except Exception as e:
+            # 에러 발생 시 로그만 출력하고 파일을 생성하지 않음
+            self.log(f"❌ 변환 중 오류 발생: {e}")
+            self.log("💡 해결방법: 크롤링을 다시 실행하거나 데이터를 확인해주세요.")
+            return False
+
+    def iter_keyword_batches(self, stop: threading.Event) -> Iterator[Tuple[str, List[Dict]]]:
+        """키워드별 크롤링 결과를 키워드 순서대로 생성 (실패한 키워드는 건너뜀)
+
+        키워드는 keyword_groups 묶음 단위로 crawl_all_keywords 한 번(브라우저 세션 하나)에 크롤링한 뒤
+        키워드별로 나누어 내보낸다. stop이 설정되면 다음 묶음을 시작하지 않는다.
+
+        crawler_workers가 2 이상이면 작업마다 별도 크롤러(브라우저 세션)를 두고 묶음을 나누어
+        동시에 크롤링한다. 전체 요청 빈도는 크롤러 하나일 때를 넘지 않도록, 각 크롤러의 요청 간격을
+        작업 수만큼 늘리고 묶음 시작은 DispatchGate로 crawl_delay 간격을 둔다.
+        """
+        from amazon_crawler_selenium_improved import ImprovedAmazonCrawler
+
+        keywords = list(self.settings['search_keywords'])
+        workers = self.crawler_workers
+        groups = self.keyword_groups(keywords, workers)
+        config_path = self._write_crawler_config(delay_scale=workers)
+        crawlers = []  # 만든 크롤러 (끝나면 모두 종료)
+        crawlers_lock = threading.Lock()
+        try:
+            if workers <= 1:
+                crawler = ImprovedAmazonCrawler(config_path)
+                crawlers.append(crawler)
+
+                def crawl(group: List[str]) -> Optional[List[Dict]]:
+                    if stop.is_set():
+                        return None
+                    crawler.search_keywords = list(group)
+                    return crawler.crawl_all_keywords() or []
+
+                results = (self._crawl_group(crawl, group) for group in groups)
+                executor = None
+            else:
+                self.log(f"🕸️ 동시 크롤링: 크롤러 {workers}개, 키워드 {len(keywords)}개 ({len(groups)}개 묶음)")
+                gate = DispatchGate(float(self.settings['crawl_delay']))
+                local = threading.local()
+
+                def crawl(group: List[str]) -> Optional[List[Dict]]:
+                    if not gate.wait(stop):
+                        return None
+                    # 작업 쓰레드마다 독립된 크롤러 (쿠키/세션을 공유하지 않음)
+                    if getattr(local, 'crawler', None) is None:
+                        local.crawler = ImprovedAmazonCrawler(config_path)
+                        with crawlers_lock:
+                            crawlers.append(local.crawler)
+                    local.crawler.search_keywords = list(group)
+                    return local.crawler.crawl_all_keywords() or []
+
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='crawler')
+                futures = [executor.submit(self._crawl_group, crawl, group) for group in groups]
+                results = (future.result() for future in futures)
+
+            try:
+                number = 0
+                for group, keyword_batches in zip(groups, results):
+                    if stop.is_set():
+                        break
+                    if keyword_batches is None:
+                        number += len(group)
+                        continue
+                    for keyword, products in keyword_batches:
+                        number = min(number + 1, len(keywords))
+                        self.log(f"🕷️ [{number}/{len(keywords)}] '{keyword}' 수집 완료: {len(products)}개")
+                        yield keyword, products
+            finally:
+                if executor is not None:
+                    stop.set()
+                    executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            # 브라우저 세션 종료 (병렬 크롤링은 작업 쓰레드가 모두 끝난 뒤)
+            for crawler in crawlers:
+                close_crawler(crawler)
+            # 임시 파일 정리
+            try:
+                os.remove(config_path)
+            except OSError:
+                pass
+
+    def _crawl_group(self, crawl: Callable[[List[str]], Optional[List[Dict]]],
+                     group: List[str]) -> Optional[List[Tuple[str, List[Dict]]]]:
+        """키워드 묶음 하나 크롤링 후 키워드별로 나눔 (실패하거나 중단되면 로그를 남기고 None)"""
+        try:
+            products = crawl(group)
+        except Exception as e:
+            self.log(f"⚠️ '{', '.join(group)}' 크롤링 실패: {e}")
+            return None
+        return None if products is None else split_by_keyword(products, group)
+
+    def _crawl_keywords(self, batches: queue.Queue, stop: threading.Event, errors: List[Exception]):
+        """생산자: 키워드별 크롤링 결과를 순서대로 큐에 넣음 (별도 쓰레드)"""
+
+        def put(item) -> bool:
+            # 변환 쪽이 중단되면 큐가 비워지지 않으므로 주기적으로 중단 여부 확인
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        keyword_batches = None
+        try:
+            keyword_batches = self.iter_keyword_batches(stop)
+            for keyword, products in keyword_batches:
+                if products and not put((keyword, products)):
+                    break
+        except Exception as e:
+            errors.append(e)
+        finally:
+            if keyword_batches is not None:
+                keyword_batches.close()
+            put(_END_OF_CRAWL)
+
+    def run_pipelined(self, output_file: Optional[str] = None) -> bool:
+        """크롤링과 변환을 겹쳐 실행 (키워드별 크롤링 결과가 나오는 대로 변환)
+
+        크롤러 쓰레드가 키워드 하나를 마칠 때마다 상품 묶음을 크기 제한 큐에 넣고,
+        현재 쓰레드가 받아서 바로 변환한다. 변환이 밀리면 큐가 차서 크롤링이 잠시 기다린다.
+        상품 순서와 AMZ_ 번호는 수집된 상품 목록 전체를 한 번에 변환한 결과와 같다.
+        """
+        batches: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        errors: List[Exception] = []
+        producer = threading.Thread(target=self._crawl_keywords, args=(batches, stop, errors), daemon=True)
+
+        products: List[Dict] = []
+        seen_keys = set()
+        frames = []
+        try:
+            import pandas as pd
+
+            uploader = self._create_configured_uploader()
+            producer.start()
+
+            while True:
+                item = batches.get()
+                if item is _END_OF_CRAWL:
+                    break
+                keyword, batch = item
+                # 앞 키워드에서 이미 수집한 상품은 제외
+                batch = drop_duplicate_products(batch, seen_keys)
+                if not batch:
+                    continue
+                start_index = len(products) + 1
+                products.extend(batch)
+
+                df = uploader.convert_parallel(batch, start_index=start_index)
+                if not df.empty:
+                    frames.append(df)
+                self.log(f"🔄 '{keyword}' 변환 완료: {len(df)}개 (누적 {sum(len(frame) for frame in frames)}개)")
+
+            if errors:
+                raise errors[0]
+            if not products:
+                self.log("❌ 크롤링된 상품이 없습니다.")
+                return False
+
+            self.crawled_products = products
+            self.log(f"✅ 1단계 완료: {len(products)}개 상품 수집")
+            self._record_products(products)
+            self._save_archive(products)
+
+            if not frames:
+                self.log("❌ 변환된 상품이 없습니다. 모든 상품 변환에 실패했습니다.")
+                return False
+
+            output_path = uploader.write_upload_files(pd.concat(frames, ignore_index=True), output_file)
+            if not self._report_output(output_path, uploader):
+                return False
+            self.log("✅ 2단계 완료: 스마트스토어 파일 생성")
+            return True
+
+        except Exception as e:
+            self.log(f"❌ 워크플로우 실행 오류: {e}")
+            return False
+        finally:
+            # 변환이 실패/중단되어도 크롤러 쓰레드가 다음 묶음을 시작하지 않고 끝나도록 기다림
+            stop.set()
+            if producer.is_alive():
+                self.log("⏳ 진행 중인 크롤링 묶음이 끝나면 크롤러를 종료합니다...")
+                producer.join()
+
+    def run_full(self, output_file: Optional[str] = None) -> bool:
+        """크롤링 후 auto_convert 설정이면 변환까지 실행 (변환은 크롤링과 겹쳐 진행)"""
+        if self.settings.get('auto_convert', True):
+            return self.run_pipelined(output_file)
+
+        if not self.run_crawling():
+            return False
+        self.log(f"✅ 1단계 완료: {len(self.crawled_products)}개 상품 수집")
+        return True
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """명령행 인자 정의"""
+    parser = argparse.ArgumentParser(
+        description="아마존 크롤링 → 스마트스토어 변환 (GUI 없이 실행)"
+    )
+    parser.add_argument('stage', nargs='?', choices=['all', 'crawl', 'convert'], default='all',
+                        help="실행할 단계 (기본값: all)")
+    parser.add_argument('--config', default=DEFAULT_CONFIG_FILE, help="설정 파일 (기본값: integrated_config.json)")
+    parser.add_argument('--keywords', nargs='+', help="검색 키워드 (설정 파일 값 대신 사용)")
+    parser.add_argument('--input', help="변환할 크롤링 파일 또는 아카이브 폴더 (convert 단계)")
+    parser.add_argument('--output', help="업로드 Excel 파일 경로")
+    parser.add_argument('--margin-rate', type=int, help="판매 마진율 (%%)")
+    parser.add_argument('--conversion-workers', type=int, help="변환 프로세스 수")
+    parser.add_argument('--crawler-workers', type=int, help="동시 크롤러(브라우저) 수")
+    parser.add_argument('--rows-per-file', type=int, help="업로드 파일당 최대 행 수 (초과 시 분할 저장)")
+    parser.add_argument('--no-translation', action='store_true', help="한국어 번역 끄기")
+    parser.add_argument('--incremental', action='store_true', help="증분 변환 켜기 (변경된 상품만 다시 변환)")
+    parser.add_argument('--full-conversion', action='store_true', help="증분 변환 끄기 (모든 상품 다시 변환)")
+    parser.add_argument('--log-level', default='INFO', help="로그 수준 (기본값: INFO)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """헤드리스 실행 진입점 (종료 코드 반환)"""
+    args = build_arg_parser().parse_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+    )
+
+    try:
+        settings = load_pipeline_config(args.config)
+    except (OSError, ValueError) as e:
+        logger.error(f"설정 파일 로드 실패: {e}")
+        return EXIT_CONFIG_ERROR
+
+    # 명령행 인자가 설정 파일보다 우선
+    overrides = {
+        'search_keywords': args.keywords,
+        'margin_rate': args.margin_rate,
+        'conversion_workers': args.conversion_workers,
+        'crawler_workers': args.crawler_workers,
+        'rows_per_file': args.rows_per_file
+    }
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+    if args.no_translation:
+        settings['enable_translation'] = False
+    if args.incremental:
+        settings['incremental_conversion'] = True
+    if args.full_conversion:
+        settings['incremental_conversion'] = False
+
+    crawling = args.stage in ('all', 'crawl')
+    conversion = args.stage == 'convert' or (args.stage == 'all' and settings.get('auto_convert', True))
+    try:
+        validate_settings(settings, crawling=crawling, conversion=conversion)
+        if args.stage == 'convert' and not args.input:
+            raise ValueError("convert 단계에는 --input이 필요합니다.")
+    except ValueError as e:
+        logger.error(f"설정 오류: {e}")
+        return EXIT_CONFIG_ERROR
+
+    pipeline = WorkflowPipeline(settings)
+    try:
+        if args.stage == 'crawl':
+            success = pipeline.run_crawling()
+        elif args.stage == 'convert':
+            success = pipeline.run_conversion(args.input, args.output)
+        else:
+            success = pipeline.run_full(args.output)
+    except ImportError as e:
+        logger.error(f"필요한 모듈을 찾을 수 없습니다: {e}")
+        return EXIT_FAILED
+    except KeyboardInterrupt:
+        logger.warning("사용자에 의해 중단되었습니다.")
+        return EXIT_INTERRUPTED
+
+    return EXIT_OK if success else EXIT_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())